@@ -0,0 +1,68 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: JSONL lines/sec per PacketReader decoder backend.
+
+Usage:
+    python benchmarks/bench_decoders.py --lines 1000000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from generator import TraceSpec, generate_trace
+
+from eval_calibration_core.io.decoders import available_decoders, get_decoder
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.registry import CORE_FIELDS
+
+
+def bench_decode(path: Path, backend: str) -> float:
+    """Raw decode throughput (lines/sec), no PacketV2 construction."""
+    decoder = get_decoder(backend)
+    start = time.perf_counter()
+    n = 0
+    with open(path, "rb") as f:
+        for line in f:
+            decoder.decode(line)
+            n += 1
+    return n / (time.perf_counter() - start)
+
+
+def bench_reader(path: Path, backend: str, fields: tuple[str, ...] | None = None) -> float:
+    """PacketReader.read() throughput (lines/sec): decode + PacketV2.from_dict (or projection)."""
+    start = time.perf_counter()
+    n = sum(1 for _ in PacketReader(path, decoder=backend, fields=fields).read())
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the decoder benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000, help="Trace length")
+    parser.add_argument("--trace", type=Path, help="Existing JSONL trace (skips generation)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.trace or Path(tmp) / "trace.jsonl"
+        if args.trace is None:
+            generate_trace(path, TraceSpec(packets=args.lines))
+        print(f"trace: {path} ({path.stat().st_size / 1e6:.1f} MB)")
+        print(
+            f"{'backend':<10} {'decode lines/s':>16} {'reader lines/s':>16} "
+            f"{'projected lines/s':>18}"
+        )
+        for backend in available_decoders():
+            decode_rate = bench_decode(path, backend)
+            reader_rate = bench_reader(path, backend)
+            projected_rate = bench_reader(path, backend, CORE_FIELDS)
+            print(
+                f"{backend:<10} {decode_rate:>16,.0f} {reader_rate:>16,.0f} "
+                f"{projected_rate:>18,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: traced bytes per packet held by PacketReader.read_all() per record type.
+
+Usage:
+    python benchmarks/bench_memory.py --packets 100000
+"""
+
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from generator import TraceSpec, generate_trace
+
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.registry import CORE_FIELDS
+from eval_calibration_core.report.builder import build_report
+
+# Label -> PacketReader keyword arguments
+RECORD_TYPES = {
+    "PacketV2": {},
+    "projected": {"fields": CORE_FIELDS},
+    "compact": {"compact": True},
+    "compact+projected": {"fields": CORE_FIELDS, "compact": True},
+}
+
+
+def bench_memory(path: Path, **reader_options) -> tuple[float, list]:
+    """Traced bytes per packet retained by read_all() (the packets are returned)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        packets = PacketReader(path, **reader_options).read_all()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return retained / max(len(packets), 1), packets
+
+
+def main() -> None:
+    """Run the memory benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packets", type=int, default=100_000, help="Trace length")
+    parser.add_argument("--trace", type=Path, help="Existing JSONL trace (skips generation)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.trace or Path(tmp) / "trace.jsonl"
+        if args.trace is None:
+            generate_trace(path, TraceSpec(packets=args.packets))
+        print(f"trace: {path} ({path.stat().st_size / 1e6:.1f} MB)")
+        print(f"{'records':<18} {'bytes/packet':>14} {'vs PacketV2':>12}")
+        baseline = None
+        expected = None
+        for label, options in RECORD_TYPES.items():
+            per_packet, packets = bench_memory(path, **options)
+            metrics = build_report(packets).metrics
+            if expected is None:
+                expected = metrics
+            elif metrics != expected:
+                raise SystemExit(f"{label}: metrics differ from PacketV2")
+            baseline = baseline or per_packet
+            print(f"{label:<18} {per_packet:>14,.0f} {per_packet / baseline:>11.0%}")
+            del packets
+
+
+if __name__ == "__main__":
+    main()
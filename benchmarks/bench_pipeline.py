@@ -0,0 +1,207 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: per-stage time, throughput and peak RSS of the evaluation pipeline.
+
+Each (size, mode) runs in a fresh process so peak RSS is not shared between runs.
+
+Usage:
+    python benchmarks/bench_pipeline.py --sizes 1e3,1e4,1e5,1e6
+    python benchmarks/bench_pipeline.py --sizes 1e7,1e8 --modes stream --trace-dir /data/traces
+    python benchmarks/bench_pipeline.py --baseline benchmarks/baseline.json   # regression gate
+    python benchmarks/bench_pipeline.py --save-baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from generator import TraceSpec, generate_trace
+
+MODES = ("list", "stream")
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+# Peak RSS below this many MB over baseline is never a regression (interpreter noise)
+RSS_SLACK_MB = 16.0
+# Stages faster than this in the baseline are too noisy to gate on
+MIN_STAGE_SECONDS = 0.2
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def run_pipeline(trace: str, mode: str, out_dir: str) -> dict[str, Any]:
+    """
+    Run the pipeline once over a trace and time each stage (executed in a child process).
+
+    list: PacketReader.read_all, compute_metrics, check_invariants, build_report, write_report
+    stream: build_report_streaming over PacketReader.read(), write_report
+    """
+    from eval_calibration_core.io.packet_reader import PacketReader
+    from eval_calibration_core.metrics.compute import compute_metrics
+    from eval_calibration_core.report.builder import build_report, build_report_streaming
+    from eval_calibration_core.report.writer import write_report
+    from eval_calibration_core.suites.invariants import check_invariants
+
+    stages: dict[str, float] = {}
+
+    def timed(name: str, fn: Any, *args: Any) -> Any:
+        start = time.perf_counter()
+        result = fn(*args)
+        stages[name] = time.perf_counter() - start
+        return result
+
+    if mode == "list":
+        packets = timed("read", PacketReader(trace).read_all)
+        timed("compute_metrics", compute_metrics, packets)
+        timed("check_invariants", check_invariants, packets)
+        report = timed("build_report", build_report, packets)
+    else:
+        report = timed("build_report_streaming", build_report_streaming, PacketReader(trace).read())
+    timed("write_report", write_report, report, out_dir)
+    return {
+        "packets": report.metrics["total_steps"],
+        "stages": stages,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_isolated(trace: Path, mode: str) -> dict[str, Any]:
+    """run_pipeline in a fresh (spawned) process."""
+    context = multiprocessing.get_context("spawn")
+    with (
+        tempfile.TemporaryDirectory() as out_dir,
+        ProcessPoolExecutor(max_workers=1, mp_context=context) as pool,
+    ):
+        result = pool.submit(run_pipeline, str(trace), mode, out_dir).result()
+    n = result["packets"]
+    result["throughput"] = {
+        stage: (n / seconds if seconds > 0 else float("inf"))
+        for stage, seconds in result["stages"].items()
+    }
+    return result
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """
+    Regression gate: throughput may not drop, nor peak RSS grow, by more than tolerance.
+
+    Only (size, mode, stage) entries present in both runs are compared, and only
+    stages that took at least MIN_STAGE_SECONDS in the baseline.
+
+    Returns:
+        Human-readable regression messages (empty if none)
+    """
+    regressions = []
+    for size, modes in results.items():
+        for mode, current in modes.items():
+            reference = baseline.get(size, {}).get(mode)
+            if reference is None:
+                continue
+            for stage, rate in current["throughput"].items():
+                base_rate = reference["throughput"].get(stage)
+                if reference["stages"].get(stage, 0.0) < MIN_STAGE_SECONDS:
+                    continue
+                if base_rate and rate < base_rate * (1.0 - tolerance):
+                    regressions.append(
+                        f"{size} {mode} {stage}: {rate:,.0f} packets/s "
+                        f"< baseline {base_rate:,.0f} (-{tolerance:.0%} allowed)"
+                    )
+            rss, base_rss = current.get("peak_rss_mb"), reference.get("peak_rss_mb")
+            if (
+                rss is not None
+                and base_rss is not None
+                and rss > base_rss * (1.0 + tolerance) + RSS_SLACK_MB
+            ):
+                regressions.append(
+                    f"{size} {mode} peak RSS: {rss:.1f} MB > baseline {base_rss:.1f} MB"
+                )
+    return regressions
+
+
+def _sizes(spec: str) -> list[int]:
+    return [int(float(item)) for item in spec.split(",") if item.strip()]
+
+
+def main() -> None:
+    """Run the benchmark matrix, print a table and apply the regression gate."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=_sizes, default=list(DEFAULT_SIZES), help="e.g. 1e3,1e4,1e5"
+    )
+    parser.add_argument("--modes", default="list,stream", help="Comma-separated: list,stream")
+    parser.add_argument(
+        "--list-max",
+        type=float,
+        default=1e6,
+        help="Skip list mode (all packets in memory) above this size",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace-dir", type=Path, help="Keep/reuse generated traces here")
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Fail if slower/larger than this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed regression (0.3)")
+    parser.add_argument("--save-baseline", type=Path, help="Write results as the new baseline")
+    args = parser.parse_args()
+    modes = [m for m in args.modes.split(",") if m]
+    for mode in modes:
+        if mode not in MODES:
+            parser.error(f"unknown mode: {mode}")
+
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_dir = args.trace_dir or Path(tmp)
+        trace_dir.mkdir(parents=True, exist_ok=True)
+        print(
+            f"{'size':>11} {'mode':<7} {'stage':<24} {'seconds':>9} {'packets/s':>13} {'RSS MB':>8}"
+        )
+        for size in args.sizes:
+            trace = trace_dir / f"synthetic-{size}-seed{args.seed}.jsonl"
+            if not trace.exists():
+                generate_trace(trace, TraceSpec(packets=size, seed=args.seed))
+            results[str(size)] = {}
+            for mode in modes:
+                if mode == "list" and size > args.list_max:
+                    continue
+                result = run_isolated(trace, mode)
+                results[str(size)][mode] = result
+                rss = result["peak_rss_mb"]
+                for stage, seconds in result["stages"].items():
+                    rate = result["throughput"][stage]
+                    rss_text = f"{rss:8.1f}" if rss is not None else f"{'n/a':>8}"
+                    print(
+                        f"{size:>11,} {mode:<7} {stage:<24} {seconds:9.3f} {rate:13,.0f} {rss_text}"
+                    )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"[OK] Baseline written to {args.save_baseline}")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"[FAIL] {message}")
+        if regressions:
+            sys.exit(1)
+        print(f"[OK] No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
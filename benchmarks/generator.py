@@ -0,0 +1,169 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Seeded synthetic PacketV2 JSONL trace generator (10^3 to 10^8 packets).
+
+Usage:
+    python benchmarks/generator.py --packets 1000000 --out trace.jsonl --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_ACTION_MIX = {"ACT": 0.70, "HOLD": 0.20, "EXIT": 0.06, "CANCEL": 0.03, "STOP": 0.01}
+LATENCY_DISTRIBUTIONS = ("lognormal", "exponential", "uniform")
+
+_FLAGS = ("exposure_limit", "rate_limit", "stale_data")
+_REASON_CODES = (
+    "max_exposure_exceeded",
+    "cooldown",
+    "stale_quote",
+    "rate_limited",
+    "spread_too_wide",
+)
+
+
+@dataclass
+class TraceSpec:
+    """
+    Shape of a synthetic trace.
+
+    Attributes:
+        packets: Number of packets
+        seed: RNG seed (same spec and seed -> byte-identical file)
+        action_mix: Proposal action -> probability
+        mismatch_rate: Fraction of packets with a mismatch (guards fired)
+        deny_rate: Fraction of mismatches with deny flags (final action HOLD, not allowed)
+        latency: "lognormal", "exponential" or "uniform" (integer milliseconds)
+        latency_median_ms: Median (lognormal), mean (exponential) or upper bound (uniform)
+        latency_sigma: Lognormal shape
+        runs: Number of distinct run_ids (packets are split into contiguous runs)
+    """
+
+    packets: int = 1000
+    seed: int = 0
+    action_mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_ACTION_MIX))
+    mismatch_rate: float = 0.05
+    deny_rate: float = 0.5
+    latency: str = "lognormal"
+    latency_median_ms: float = 8.0
+    latency_sigma: float = 0.6
+    runs: int = 1
+
+
+def generate_trace(path: Path | str, spec: TraceSpec) -> int:
+    """
+    Write a synthetic trace (streaming, constant memory).
+
+    Args:
+        path: Output JSONL path
+        spec: Trace shape
+
+    Returns:
+        Bytes written
+
+    Raises:
+        ValueError: If the latency distribution is unknown
+    """
+    if spec.latency not in LATENCY_DISTRIBUTIONS:
+        raise ValueError(
+            f"Unknown latency distribution: {spec.latency}. "
+            f"Available: {list(LATENCY_DISTRIBUTIONS)}"
+        )
+    rng = random.Random(spec.seed)
+    actions = list(spec.action_mix)
+    cum_weights = []
+    total = 0.0
+    for action in actions:
+        total += spec.action_mix[action]
+        cum_weights.append(total)
+    log_median = math.log(spec.latency_median_ms)
+    per_run = max(1, -(-spec.packets // max(1, spec.runs)))
+    ts0 = 1_700_000_000_000
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        buffer = []
+        for i in range(spec.packets):
+            action = rng.choices(actions, cum_weights=cum_weights)[0]
+            confidence = round(rng.betavariate(5, 2), 4)
+            mismatch = None
+            final = {"action": action, "allowed": True}
+            if rng.random() < spec.mismatch_rate:
+                codes = rng.sample(_REASON_CODES, rng.randint(1, 2))
+                if rng.random() < spec.deny_rate:
+                    mismatch = {"flags": [rng.choice(_FLAGS)], "reason_codes": codes}
+                    final = {"action": "HOLD", "allowed": False}
+                else:
+                    mismatch = {"flags": [], "reason_codes": codes}
+            if spec.latency == "lognormal":
+                latency = int(rng.lognormvariate(log_median, spec.latency_sigma))
+            elif spec.latency == "exponential":
+                latency = int(rng.expovariate(1.0 / spec.latency_median_ms))
+            else:
+                latency = rng.randint(0, int(spec.latency_median_ms))
+            mid = round(0.5 + rng.uniform(-0.05, 0.05), 4)
+            record = {
+                "schema_version": "0.2.2",
+                "run_id": f"run-{i // per_run:04d}",
+                "step": i % per_run,
+                "input": {"ts": ts0 + i * 100, "seed": spec.seed, "bid": round(mid - 0.01, 4)},
+                "external": {"mid": mid, "now_ms": ts0 + i * 100},
+                "mdm": {"action": action, "confidence": confidence},
+                "final_action": final,
+                "latency_ms": latency,
+                "mismatch": mismatch,
+            }
+            buffer.append(json.dumps(record))
+            if len(buffer) >= 10_000:
+                chunk = "\n".join(buffer) + "\n"
+                f.write(chunk)
+                written += len(chunk)
+                buffer = []
+        if buffer:
+            chunk = "\n".join(buffer) + "\n"
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def main() -> None:
+    """Generate a trace from command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packets", type=float, default=1000, help="Packets (e.g. 1e6)")
+    parser.add_argument("--out", type=Path, required=True, help="Output JSONL path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mismatch-rate", type=float, default=0.05)
+    parser.add_argument("--deny-rate", type=float, default=0.5)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-median-ms", type=float, default=8.0)
+    parser.add_argument("--runs", type=int, default=1, help="Distinct run_ids")
+    parser.add_argument(
+        "--action-mix",
+        type=json.loads,
+        default=None,
+        help='JSON action -> weight, e.g. \'{"ACT": 0.9, "HOLD": 0.1}\'',
+    )
+    args = parser.parse_args()
+    spec = TraceSpec(
+        packets=int(args.packets),
+        seed=args.seed,
+        mismatch_rate=args.mismatch_rate,
+        deny_rate=args.deny_rate,
+        latency=args.latency,
+        latency_median_ms=args.latency_median_ms,
+        runs=args.runs,
+    )
+    if args.action_mix:
+        spec.action_mix = args.action_mix
+    size = generate_trace(args.out, spec)
+    print(f"[OK] Wrote {spec.packets} packets ({size / 1e6:.1f} MB) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
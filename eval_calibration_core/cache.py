@@ -0,0 +1,151 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Content-addressed on-disk cache of JSON results keyed by trace hash."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_ENV = "EVAL_CAL_CACHE_DIR"
+
+_CHUNK = 1 << 20
+
+
+def default_cache_dir() -> Path:
+    """$EVAL_CAL_CACHE_DIR, else ~/.cache/evaluation-calibration-core."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "evaluation-calibration-core"
+
+
+def file_digest(path: Path | str, quick: bool = False) -> str:
+    """
+    BLAKE2b digest of a file's full content (the trace hash).
+
+    Args:
+        path: File to hash (compressed traces are hashed as stored)
+        quick: Hash the resolved path, size and mtime instead of the content
+            (constant time; an edit that keeps size and mtime goes unnoticed)
+
+    Returns:
+        Hex digest (40 characters)
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    if quick:
+        stat = os.stat(path)
+        digest.update(f"{Path(path).resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(*parts: Any) -> str:
+    """
+    Key for a result derived from JSON-serializable parts (trace digest, configuration).
+
+    Returns:
+        Hex digest (40 characters)
+    """
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+class ContentCache:
+    """
+    JSON documents stored under <root>/<namespace>/<key[:2]>/<key>.json.
+
+    Entries are immutable: a key identifies its content, so writes are atomic
+    (temp file + os.replace) and concurrent writers of one key are harmless.
+    Unreadable entries are treated as misses. With max_bytes, a hit refreshes
+    the entry's mtime and put() evicts least recently used entries of the
+    namespace until it fits.
+    """
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        namespace: str = "default",
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize.
+
+        Args:
+            root: Cache root (default: default_cache_dir())
+            namespace: Subdirectory separating result kinds (e.g. "calibrators")
+            max_bytes: Size budget of the namespace (None: unbounded)
+        """
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+
+    def path_for(self, key: str) -> Path:
+        """File that holds (or would hold) the entry for key."""
+        return self.root / self.namespace / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Cached document, or None on a miss."""
+        path = self.path_for(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self.max_bytes is not None:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return value
+
+    def put(self, key: str, value: Any) -> Path:
+        """
+        Store a JSON-serializable document.
+
+        Returns:
+            Path of the entry
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
+        if self.max_bytes is not None:
+            self.evict(self.max_bytes)
+        return path
+
+    def evict(self, max_bytes: int) -> int:
+        """
+        Remove least recently used entries until the namespace holds at most max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for path in (self.root / self.namespace).glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # removed by a concurrent evict
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[:2]):
+            if total <= max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,46 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Confidence calibration: reliability bins, ECE, MCE, Brier score and fitted calibrators."""
+
+from eval_calibration_core.calibration.fitting import (
+    CALIBRATION_METHODS,
+    FitAccumulator,
+    HistogramCalibrator,
+    IsotonicCalibrator,
+    PlattCalibrator,
+    TemperatureCalibrator,
+    fit_calibrators,
+    fit_packets,
+    fit_trace,
+    load_calibrator,
+    weighted_points,
+)
+from eval_calibration_core.calibration.reliability import (
+    DEFAULT_BINS,
+    CalibrationAccumulator,
+    action_agreement,
+    calibration_columns,
+    compute_calibration,
+)
+from eval_calibration_core.calibration.summation import ExactSum
+
+__all__ = [
+    "CALIBRATION_METHODS",
+    "DEFAULT_BINS",
+    "CalibrationAccumulator",
+    "ExactSum",
+    "FitAccumulator",
+    "HistogramCalibrator",
+    "IsotonicCalibrator",
+    "PlattCalibrator",
+    "TemperatureCalibrator",
+    "action_agreement",
+    "calibration_columns",
+    "compute_calibration",
+    "fit_calibrators",
+    "fit_packets",
+    "fit_trace",
+    "load_calibrator",
+    "weighted_points",
+]
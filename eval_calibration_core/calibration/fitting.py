@@ -0,0 +1,541 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Post-hoc calibrators for mdm.confidence: isotonic (PAV), Platt, histogram, temperature."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from eval_calibration_core.cache import ContentCache, cache_key, file_digest
+from eval_calibration_core.calibration.reliability import (
+    DEFAULT_BINS,
+    OutcomeFn,
+    action_agreement,
+    confidence_sample,
+)
+
+CALIBRATION_METHODS = ("isotonic", "platt", "histogram", "temperature")
+CACHE_NAMESPACE = "calibrators"
+# Bump when fitting changes, so cached fits of older versions are not reused
+FIT_VERSION = 1
+
+# Weighted sample: (confidence, positive outcomes, samples) per distinct confidence
+Point = tuple[float, int, int]
+
+_EPS = 1e-12
+
+
+def weighted_points(pairs: Iterable[tuple[float, bool]]) -> list[Point]:
+    """
+    Collapse (confidence, outcome) pairs into one weighted point per distinct confidence.
+
+    Every fitter works on these points, so traces with rounded confidences fit
+    in O(distinct values) per iteration instead of O(samples).
+
+    Returns:
+        Points sorted by confidence
+    """
+    counts: dict[float, list[int]] = {}
+    for confidence, outcome in pairs:
+        entry = counts.get(confidence)
+        if entry is None:
+            entry = counts[confidence] = [0, 0]
+        entry[0] += outcome
+        entry[1] += 1
+    return [(x, *counts[x]) for x in sorted(counts)]
+
+
+def _sigmoid(z: float) -> float:
+    if z >= 0.0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
+
+
+def _logit(p: float) -> float:
+    p = min(max(p, _EPS), 1.0 - _EPS)
+    return math.log(p / (1.0 - p))
+
+
+class IsotonicCalibrator:
+    """
+    Isotonic regression by pool-adjacent-violators: the non-decreasing step
+    function of confidence with minimum squared error.
+
+    PAV is a single O(points) stack pass over the sorted points; block means
+    are compared by cross-multiplying integer counts, so pooling is exact.
+    """
+
+    method = "isotonic"
+
+    def __init__(self) -> None:
+        """Initialize unfitted (identity)."""
+        self.thresholds: list[float] = []
+        self.values: list[float] = []
+
+    def fit(self, points: Sequence[Point]) -> IsotonicCalibrator:
+        """Fit on sorted weighted points; returns self."""
+        blocks: list[list[Any]] = []  # [lower confidence, positives, samples]
+        for x, positives, samples in points:
+            blocks.append([x, positives, samples])
+            while len(blocks) > 1 and blocks[-2][1] * blocks[-1][2] > blocks[-1][1] * blocks[-2][2]:
+                _, positives, samples = blocks.pop()
+                blocks[-1][1] += positives
+                blocks[-1][2] += samples
+        self.thresholds = [block[0] for block in blocks]
+        self.values = [block[1] / block[2] for block in blocks]
+        return self
+
+    def predict(self, confidence: float) -> float:
+        """Calibrated probability."""
+        if not self.values:
+            return confidence
+        return self.values[max(bisect_right(self.thresholds, confidence) - 1, 0)]
+
+    def params(self) -> dict[str, Any]:
+        return {"thresholds": self.thresholds, "values": self.values}
+
+    def load_params(self, params: dict[str, Any]) -> None:
+        self.thresholds = list(params["thresholds"])
+        self.values = list(params["values"])
+
+
+class PlattCalibrator:
+    """
+    Platt scaling: P(outcome) = 1 / (1 + exp(A * confidence + B)).
+
+    Fitted with the Newton method and backtracking line search of Lin, Lin and
+    Weng (2007), including Platt's smoothed targets against overfitting.
+    """
+
+    method = "platt"
+    MAX_ITERATIONS = 100
+
+    def __init__(self) -> None:
+        """Initialize unfitted (A = B = 0 is not the identity; fit before use)."""
+        self.a = 0.0
+        self.b = 0.0
+
+    def fit(self, points: Sequence[Point]) -> PlattCalibrator:
+        """Fit on weighted points; returns self."""
+        prior1 = sum(p for _, p, _ in points)
+        prior0 = sum(n for _, _, n in points) - prior1
+        hi_target = (prior1 + 1.0) / (prior1 + 2.0)
+        lo_target = 1.0 / (prior0 + 2.0)
+        # (confidence, weight, target) with positives and negatives as separate terms
+        terms = [
+            (x, float(w), t)
+            for x, p, n in points
+            for w, t in ((p, hi_target), (n - p, lo_target))
+            if w
+        ]
+
+        def objective(a: float, b: float) -> float:
+            total = 0.0
+            for f, w, t in terms:
+                z = f * a + b
+                if z >= 0:
+                    total += w * (t * z + math.log1p(math.exp(-z)))
+                else:
+                    total += w * ((t - 1.0) * z + math.log1p(math.exp(z)))
+            return total
+
+        a, b = 0.0, math.log((prior0 + 1.0) / (prior1 + 1.0))
+        value = objective(a, b)
+        for _ in range(self.MAX_ITERATIONS):
+            h11 = h22 = 1e-12
+            h21 = g1 = g2 = 0.0
+            for f, w, t in terms:
+                p = _sigmoid(-(f * a + b))
+                d2 = w * p * (1.0 - p)
+                h11 += f * f * d2
+                h22 += d2
+                h21 += f * d2
+                d1 = w * (t - p)
+                g1 += f * d1
+                g2 += d1
+            if abs(g1) < 1e-5 and abs(g2) < 1e-5:
+                break
+            det = h11 * h22 - h21 * h21
+            da = -(h22 * g1 - h21 * g2) / det
+            db = -(-h21 * g1 + h11 * g2) / det
+            slope = g1 * da + g2 * db
+            step = 1.0
+            while step >= 1e-10:
+                candidate = objective(a + step * da, b + step * db)
+                if candidate < value + 1e-4 * step * slope:
+                    a, b, value = a + step * da, b + step * db, candidate
+                    break
+                step /= 2.0
+            else:
+                break  # Line search failed: keep the best parameters so far
+        self.a, self.b = a, b
+        return self
+
+    def predict(self, confidence: float) -> float:
+        """Calibrated probability."""
+        return _sigmoid(-(confidence * self.a + self.b))
+
+    def params(self) -> dict[str, Any]:
+        return {"a": self.a, "b": self.b}
+
+    def load_params(self, params: dict[str, Any]) -> None:
+        self.a = params["a"]
+        self.b = params["b"]
+
+
+class HistogramCalibrator:
+    """Histogram binning: each equal-width confidence bin maps to its observed outcome rate."""
+
+    method = "histogram"
+
+    def __init__(self, bins: int = DEFAULT_BINS) -> None:
+        """
+        Initialize unfitted (identity).
+
+        Args:
+            bins: Number of equal-width confidence bins
+        """
+        self.bins = bins
+        self.values: list[float | None] = [None] * bins
+
+    def fit(self, points: Sequence[Point]) -> HistogramCalibrator:
+        """Fit on weighted points; returns self. Empty bins keep the identity."""
+        positives = [0] * self.bins
+        samples = [0] * self.bins
+        for x, p, n in points:
+            index = min(int(x * self.bins), self.bins - 1)
+            positives[index] += p
+            samples[index] += n
+        self.values = [p / n if n else None for p, n in zip(positives, samples)]
+        return self
+
+    def predict(self, confidence: float) -> float:
+        """Calibrated probability."""
+        value = self.values[min(int(confidence * self.bins), self.bins - 1)]
+        return confidence if value is None else value
+
+    def params(self) -> dict[str, Any]:
+        return {"bins": self.bins, "values": self.values}
+
+    def load_params(self, params: dict[str, Any]) -> None:
+        self.bins = params["bins"]
+        self.values = list(params["values"])
+
+
+class TemperatureCalibrator:
+    """
+    Binary temperature scaling: P(outcome) = sigmoid(logit(confidence) / T).
+
+    A single-parameter fit (Newton on 1/T, which keeps the negative
+    log-likelihood convex); preserves the ranking of confidences.
+    """
+
+    method = "temperature"
+    MAX_ITERATIONS = 100
+
+    def __init__(self) -> None:
+        """Initialize unfitted (T = 1, the identity)."""
+        self.temperature = 1.0
+
+    def fit(self, points: Sequence[Point]) -> TemperatureCalibrator:
+        """Fit on weighted points; returns self."""
+        # (logit, weight, sign): sign +1 for positive outcomes, -1 for negative
+        terms = [
+            (_logit(x), float(w), sign)
+            for x, p, n in points
+            for w, sign in ((p, 1.0), (n - p, -1.0))
+            if w
+        ]
+
+        def objective(s: float) -> float:
+            total = 0.0
+            for z, w, sign in terms:
+                m = sign * s * z
+                total += w * (math.log1p(math.exp(-m)) if m >= 0 else math.log1p(math.exp(m)) - m)
+            return total
+
+        s = 1.0
+        value = objective(s)
+        for _ in range(self.MAX_ITERATIONS):
+            gradient = hessian = 0.0
+            for z, w, sign in terms:
+                q = _sigmoid(-sign * s * z)
+                gradient -= w * sign * z * q
+                hessian += w * z * z * q * (1.0 - q)
+            if abs(gradient) < 1e-8 or hessian <= 0.0:
+                break
+            delta = -gradient / hessian
+            step = 1.0
+            while step >= 1e-10:
+                candidate_s = s + step * delta
+                if candidate_s > 0.0:
+                    candidate = objective(candidate_s)
+                    if candidate < value + 1e-4 * step * gradient * delta:
+                        s, value = candidate_s, candidate
+                        break
+                step /= 2.0
+            else:
+                break
+        self.temperature = 1.0 / s
+        return self
+
+    def predict(self, confidence: float) -> float:
+        """Calibrated probability."""
+        return _sigmoid(_logit(confidence) / self.temperature)
+
+    def params(self) -> dict[str, Any]:
+        return {"temperature": self.temperature}
+
+    def load_params(self, params: dict[str, Any]) -> None:
+        self.temperature = params["temperature"]
+
+
+_CALIBRATORS = {
+    "isotonic": IsotonicCalibrator,
+    "platt": PlattCalibrator,
+    "histogram": HistogramCalibrator,
+    "temperature": TemperatureCalibrator,
+}
+
+Calibrator = IsotonicCalibrator | PlattCalibrator | HistogramCalibrator | TemperatureCalibrator
+
+
+def make_calibrator(method: str, bins: int = DEFAULT_BINS) -> Calibrator:
+    """
+    Create an unfitted calibrator.
+
+    Args:
+        method: One of CALIBRATION_METHODS
+        bins: Number of bins for "histogram"
+
+    Raises:
+        ValueError: If method is unknown
+    """
+    if method not in _CALIBRATORS:
+        raise ValueError(
+            f"Unknown calibration method: {method}. Available: {list(CALIBRATION_METHODS)}"
+        )
+    if method == "histogram":
+        return HistogramCalibrator(bins)
+    return _CALIBRATORS[method]()
+
+
+def parse_calibration_methods(spec: str) -> list[str]:
+    """
+    Parse a comma-separated method list (e.g. "isotonic,platt"; "all" for every method).
+
+    Raises:
+        ValueError: If a method is unknown
+    """
+    methods = [item.strip().lower() for item in spec.split(",") if item.strip()]
+    if methods == ["all"]:
+        return list(CALIBRATION_METHODS)
+    for method in methods:
+        make_calibrator(method)
+    return methods
+
+
+def load_calibrator(fitted: dict[str, Any]) -> Calibrator:
+    """
+    Restore a calibrator from its serialized fit (an entry of fit_calibrators()).
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    calibrator = make_calibrator(fitted["method"])
+    calibrator.load_params(fitted["params"])
+    return calibrator
+
+
+def fit_calibrators(
+    points: Sequence[Point],
+    methods: Sequence[str] = CALIBRATION_METHODS,
+    bins: int = DEFAULT_BINS,
+) -> dict[str, dict[str, Any]]:
+    """
+    Fit calibrators on weighted points.
+
+    Args:
+        points: Output of weighted_points()
+        methods: Calibration methods to fit
+        bins: Number of bins for "histogram"
+
+    Returns:
+        Dict mapping method -> {"method", "params", "brier_score"}, where
+        brier_score is the calibrated Brier score on the fitted samples
+        (None without samples)
+
+    Raises:
+        ValueError: If a method is unknown
+    """
+    samples = sum(n for _, _, n in points)
+    fits: dict[str, dict[str, Any]] = {}
+    for method in methods:
+        calibrator = make_calibrator(method, bins).fit(points)
+        squared_error = 0.0
+        for x, p, n in points:
+            q = calibrator.predict(x)
+            squared_error += p * (1.0 - q) ** 2 + (n - p) * q * q
+        fits[method] = {
+            "method": method,
+            "params": calibrator.params(),
+            "brier_score": squared_error / samples if samples else None,
+        }
+    return fits
+
+
+class FitAccumulator:
+    """
+    Collect weighted fit points one packet at a time.
+
+    Fed during the report pass (update(), or observe() around a lazy reader), so
+    calibrators are fitted without reading the trace a second time.
+    """
+
+    def __init__(self, outcome: OutcomeFn | None = None) -> None:
+        """
+        Initialize with no points.
+
+        Args:
+            outcome: Outcome extractor (default action_agreement)
+        """
+        self.outcome = outcome or action_agreement
+        self.counts: dict[float, list[int]] = {}  # confidence -> [positives, samples]
+
+    def update(self, packet: Any) -> None:
+        """Add the confidence/outcome pair of one packet (skipped like the calibration summary)."""
+        pair = confidence_sample(packet, self.outcome)
+        if pair is None:
+            return
+        entry = self.counts.get(pair[0])
+        if entry is None:
+            entry = self.counts[pair[0]] = [0, 0]
+        entry[0] += pair[1]
+        entry[1] += 1
+
+    def observe(self, packets: Iterable[Any]) -> Iterator[Any]:
+        """Yield packets unchanged, adding each one on the way."""
+        for packet in packets:
+            self.update(packet)
+            yield packet
+
+    def points(self) -> list[Point]:
+        """Points sorted by confidence (see weighted_points)."""
+        return [(x, *self.counts[x]) for x in sorted(self.counts)]
+
+    def finalize(
+        self, methods: Sequence[str] = CALIBRATION_METHODS, bins: int = DEFAULT_BINS
+    ) -> dict[str, Any]:
+        """
+        Fit calibrators on the collected points.
+
+        Returns:
+            {"outcome", "samples", "fits"} (see fit_calibrators)
+        """
+        points = self.points()
+        return {
+            "outcome": getattr(self.outcome, "__name__", type(self.outcome).__name__),
+            "samples": sum(n for _, _, n in points),
+            "fits": fit_calibrators(points, methods, bins),
+        }
+
+
+def fit_packets(
+    packets: Iterable[Any],
+    methods: Sequence[str] = CALIBRATION_METHODS,
+    bins: int = DEFAULT_BINS,
+    outcome: OutcomeFn | None = None,
+) -> dict[str, Any]:
+    """
+    Fit calibrators on the confidence/outcome pairs of packets (one pass).
+
+    Args:
+        packets: Iterable of PacketV2 packets
+        methods: Calibration methods to fit
+        bins: Number of bins for "histogram"
+        outcome: Outcome extractor (default action_agreement)
+
+    Returns:
+        {"outcome", "samples", "fits"} (see fit_calibrators)
+    """
+    accumulator = FitAccumulator(outcome)
+    for packet in packets:
+        accumulator.update(packet)
+    return accumulator.finalize(methods, bins)
+
+
+def fit_trace(
+    path: Path | str,
+    methods: Sequence[str] = CALIBRATION_METHODS,
+    bins: int = DEFAULT_BINS,
+    outcome: OutcomeFn | None = None,
+    cache: ContentCache | None = None,
+    decoder: str = "auto",
+    digest: str | None = None,
+    accumulator: FitAccumulator | None = None,
+) -> dict[str, Any]:
+    """
+    Fit calibrators on a trace file, reusing a cached fit of the same content.
+
+    The cache key covers the trace hash (file_digest), the methods, bins,
+    outcome extractor name and FIT_VERSION, so retuning runs over an unchanged
+    trace skip reading and fitting entirely. Pass the points collected during
+    the report pass as accumulator (and the trace hash, if already computed, as
+    digest) so that a cache miss does not read the trace again either.
+
+    Args:
+        path: JSONL (optionally .gz / .zst), Arrow IPC or Parquet trace
+        methods: Calibration methods to fit
+        bins: Number of bins for "histogram"
+        outcome: Outcome extractor (default action_agreement)
+        cache: ContentCache to read and store fits (None: always fit)
+        decoder: JSON decoder backend for JSONL traces (see io/decoders.py)
+        digest: file_digest(path), e.g. from the report cache key (None: hash here)
+        accumulator: Points of every packet of the trace (its outcome replaces outcome)
+
+    Returns:
+        {"trace_digest", "outcome", "samples", "fits"}
+
+    Raises:
+        ValueError: If a method is unknown or a packet is invalid
+    """
+    for method in methods:
+        make_calibrator(method)
+    if digest is None:
+        digest = file_digest(path)
+    if accumulator is not None:
+        outcome = accumulator.outcome
+    outcome = outcome or action_agreement
+    key = cache_key(
+        CACHE_NAMESPACE,
+        FIT_VERSION,
+        digest,
+        list(methods),
+        bins,
+        getattr(outcome, "__name__", type(outcome).__name__),
+    )
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    if accumulator is None:
+        accumulator = FitAccumulator(outcome)
+        for packet in _read(path, decoder):
+            accumulator.update(packet)
+    result = {"trace_digest": digest, **accumulator.finalize(methods, bins)}
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+def _read(path: Path | str, decoder: str) -> Iterable[Any]:
+    """Packets of a trace file in any supported format."""
+    from eval_calibration_core.io.readers import open_packet_reader
+
+    return open_packet_reader(path, decoder).read()
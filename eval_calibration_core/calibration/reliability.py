@@ -0,0 +1,294 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Reliability binning of mdm.confidence against outcomes: ECE, MCE, Brier score."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from eval_calibration_core.calibration.summation import ExactSum
+from eval_calibration_core.metrics import vectorized
+
+if TYPE_CHECKING:
+    from eval_calibration_core.io.columns import PacketColumns
+
+DEFAULT_BINS = 10
+
+# Samples buffered before their confidences and squared errors are summed (ExactSum.extend)
+_FLUSH_SAMPLES = 1 << 10
+
+# Outcome extractor: packet -> True/False, or None to leave the packet out
+OutcomeFn = Callable[[Any], "bool | None"]
+
+
+def action_agreement(packet: Any) -> bool | None:
+    """
+    Default outcome: the proposal (mdm.action) survived as the final action.
+
+    Returns:
+        True if final_action.action equals mdm.action, None if there is no proposal
+    """
+    proposed = packet.mdm.get("action")
+    if proposed is None:
+        return None
+    return packet.final_action.get("action", "UNKNOWN") == proposed
+
+
+def confidence_sample(packet: Any, outcome: OutcomeFn) -> tuple[float, bool] | None:
+    """
+    The (confidence, outcome) pair of a packet.
+
+    Returns:
+        None when the outcome is None or mdm.confidence is missing, not a
+        number or outside [0, 1]
+    """
+    result = outcome(packet)
+    if result is None:
+        return None
+    confidence = packet.mdm.get("confidence")
+    if not isinstance(confidence, (int, float)) or not 0.0 <= confidence <= 1.0:
+        return None
+    return float(confidence), bool(result)
+
+
+class CalibrationAccumulator:
+    """
+    Equal-width reliability bins over confidence in [0, 1], in O(bins) memory.
+
+    Per bin: sample count, positive outcome count and the exact sum of
+    confidences; plus the exact sum of squared errors for the Brier score.
+    Sums are order independent (ExactSum), so merged shards, restored states
+    and calibration_columns() all finalize to identical values. Confidences and
+    squared errors are buffered and added in chunks with ExactSum.extend
+    (math.fsum) rather than one pure-Python add per packet.
+
+    A packet is skipped (counted in `skipped`) when the outcome extractor
+    returns None or mdm.confidence is missing, not a number or outside [0, 1].
+    """
+
+    def __init__(self, bins: int = DEFAULT_BINS, outcome: OutcomeFn | None = None) -> None:
+        """
+        Initialize empty bins.
+
+        Args:
+            bins: Number of equal-width confidence bins
+            outcome: Outcome extractor (default action_agreement); must be a
+                module-level function to be used with build_report_parallel
+
+        Raises:
+            ValueError: If bins < 1
+        """
+        if bins < 1:
+            raise ValueError(f"bins must be >= 1, got {bins}")
+        self.bins = bins
+        self.outcome = outcome or action_agreement
+        self.counts = [0] * bins
+        self.positives = [0] * bins
+        self.confidence_sums = [ExactSum() for _ in range(bins)]
+        self.squared_error = ExactSum()
+        self.skipped = 0
+        self._confidences: list[list[float]] = [[] for _ in range(bins)]
+        self._squared_errors: list[float] = []
+
+    @property
+    def outcome_name(self) -> str:
+        """Name of the outcome extractor (recorded in the summary and saved state)."""
+        return getattr(self.outcome, "__name__", type(self.outcome).__name__)
+
+    def update(self, packet: Any) -> None:
+        """
+        Add one packet.
+
+        Args:
+            packet: PacketV2 packet
+        """
+        sample = confidence_sample(packet, self.outcome)
+        if sample is None:
+            self.skipped += 1
+            return
+        self._add(*sample)
+
+    def _add(self, confidence: float, outcome: bool) -> None:
+        index = min(int(confidence * self.bins), self.bins - 1)
+        self.counts[index] += 1
+        self._confidences[index].append(confidence)
+        error = 1.0 - confidence if outcome else confidence
+        if outcome:
+            self.positives[index] += 1
+        self._squared_errors.append(error * error)
+        if len(self._squared_errors) >= _FLUSH_SAMPLES:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Add the buffered confidences and squared errors to the exact sums."""
+        for total, pending in zip(self.confidence_sums, self._confidences):
+            if pending:
+                total.extend(pending)
+                pending.clear()
+        self.squared_error.extend(self._squared_errors)
+        self._squared_errors.clear()
+
+    def merge(self, other: CalibrationAccumulator) -> CalibrationAccumulator:
+        """
+        Merge another accumulator into this one; returns self.
+
+        Raises:
+            ValueError: If the bin counts differ
+        """
+        if other.bins != self.bins:
+            raise ValueError(f"Cannot merge {other.bins} calibration bins into {self.bins}")
+        self._flush()
+        other._flush()
+        for i in range(self.bins):
+            self.counts[i] += other.counts[i]
+            self.positives[i] += other.positives[i]
+            self.confidence_sums[i].merge(other.confidence_sums[i])
+        self.squared_error.merge(other.squared_error)
+        self.skipped += other.skipped
+        return self
+
+    def to_state(self) -> dict[str, Any]:
+        """JSON-serializable state (exact sums as their float partials)."""
+        self._flush()
+        return {
+            "bins": self.bins,
+            "outcome": self.outcome_name,
+            "counts": list(self.counts),
+            "positives": list(self.positives),
+            "confidence_sums": [s.partials for s in self.confidence_sums],
+            "squared_error": self.squared_error.partials,
+            "skipped": self.skipped,
+        }
+
+    @classmethod
+    def from_state(
+        cls, state: dict[str, Any], outcome: OutcomeFn | None = None
+    ) -> CalibrationAccumulator:
+        """
+        Restore an accumulator saved with to_state().
+
+        Args:
+            state: Saved state
+            outcome: Outcome extractor for further updates (callables are not saved)
+        """
+        accumulator = cls(state["bins"], outcome)
+        accumulator.counts = list(state["counts"])
+        accumulator.positives = list(state["positives"])
+        accumulator.confidence_sums = [ExactSum(p) for p in state["confidence_sums"]]
+        accumulator.squared_error = ExactSum(state["squared_error"])
+        accumulator.skipped = state["skipped"]
+        return accumulator
+
+    def finalize(self) -> dict[str, Any]:
+        """
+        Produce the calibration summary (Report.calibration_summary).
+
+        Returns:
+            Dict with bins, outcome, samples, skipped, ece, mce, brier_score
+            (None when there are no samples) and one reliability entry per bin
+            (mean_confidence/accuracy None for empty bins)
+        """
+        self._flush()
+        samples = sum(self.counts)
+        reliability = []
+        ece = ExactSum()
+        mce = 0.0
+        for i in range(self.bins):
+            count = self.counts[i]
+            entry: dict[str, Any] = {
+                "lower": i / self.bins,
+                "upper": (i + 1) / self.bins,
+                "count": count,
+                "mean_confidence": None,
+                "accuracy": None,
+            }
+            if count:
+                mean_confidence = self.confidence_sums[i].value / count
+                accuracy = self.positives[i] / count
+                gap = abs(accuracy - mean_confidence)
+                ece.add(count * gap)
+                mce = max(mce, gap)
+                entry["mean_confidence"] = mean_confidence
+                entry["accuracy"] = accuracy
+            reliability.append(entry)
+        return {
+            "bins": self.bins,
+            "outcome": self.outcome_name,
+            "samples": samples,
+            "skipped": self.skipped,
+            "ece": ece.value / samples if samples else None,
+            "mce": mce if samples else None,
+            "brier_score": self.squared_error.value / samples if samples else None,
+            "reliability": reliability,
+        }
+
+
+def compute_calibration(
+    packets: Iterable[Any], bins: int = DEFAULT_BINS, outcome: OutcomeFn | None = None
+) -> dict[str, Any]:
+    """
+    Calibration summary of packets in a single pass.
+
+    Args:
+        packets: Iterable of PacketV2 packets
+        bins: Number of equal-width confidence bins
+        outcome: Outcome extractor (default action_agreement)
+
+    Returns:
+        Calibration summary (see CalibrationAccumulator.finalize)
+    """
+    accumulator = CalibrationAccumulator(bins, outcome)
+    for packet in packets:
+        accumulator.update(packet)
+    return accumulator.finalize()
+
+
+def calibration_columns(columns: PacketColumns, bins: int = DEFAULT_BINS) -> dict[str, Any]:
+    """
+    Calibration summary from a columnar store (default action_agreement outcome).
+
+    With NumPy the binning is vectorized (bincount per bin, ExactSum.extend per bin);
+    the result is identical to compute_calibration over the same packets.
+
+    Args:
+        columns: PacketColumns (e.g. from PacketReader.read_columns())
+        bins: Number of equal-width confidence bins
+
+    Returns:
+        Calibration summary (see CalibrationAccumulator.finalize)
+    """
+    accumulator = CalibrationAccumulator(bins)
+    # mdm action code -> final action code of the same value (-1: no proposal / never final)
+    final_codes = columns.final_actions.codes
+    agree_code = [
+        -1 if value is None else final_codes.get(value, -2) for value in columns.mdm_actions.values
+    ]
+    if not vectorized.HAS_NUMPY:
+        for mdm_code, final_code, confidence in zip(
+            columns.mdm_action, columns.final_action, columns.confidence
+        ):
+            target = agree_code[mdm_code]
+            if target == -1 or not 0.0 <= confidence <= 1.0:
+                accumulator.skipped += 1
+                continue
+            accumulator._add(confidence, final_code == target)
+        return accumulator.finalize()
+
+    np = vectorized.np
+    confidence = np.asarray(memoryview(columns.confidence))
+    target = np.asarray(agree_code, dtype=np.int64)[np.asarray(memoryview(columns.mdm_action))]
+    valid = (target != -1) & (confidence >= 0.0) & (confidence <= 1.0)
+    confidence = confidence[valid]
+    outcome = np.asarray(memoryview(columns.final_action))[valid] == target[valid]
+    index = np.minimum((confidence * bins).astype(np.int64), bins - 1)
+    error = np.where(outcome, 1.0 - confidence, confidence)
+
+    accumulator.skipped = len(columns) - len(confidence)
+    accumulator.counts = np.bincount(index, minlength=bins).tolist()
+    accumulator.positives = np.bincount(index[outcome], minlength=bins).tolist()
+    for i in range(bins):
+        accumulator.confidence_sums[i].extend(confidence[index == i].tolist())
+    accumulator.squared_error.extend((error * error).tolist())
+    return accumulator.finalize()
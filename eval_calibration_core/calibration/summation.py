@@ -0,0 +1,68 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Exact, order-independent float summation (Shewchuk partials, as in math.fsum)."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+
+class ExactSum:
+    """
+    Running float sum kept as non-overlapping partials, so the result is the
+    correctly rounded exact sum regardless of the order values were added or
+    merged in (serial, sharded and vectorized paths agree bit for bit).
+    """
+
+    __slots__ = ("partials",)
+
+    def __init__(self, partials: Iterable[float] = ()) -> None:
+        """Initialize (optionally from saved partials)."""
+        self.partials: list[float] = list(partials)
+
+    def add(self, x: float) -> None:
+        """Add one value."""
+        partials = self.partials
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Add many values, exactly, at C speed.
+
+        math.fsum gives the correctly rounded sum of the values; adding it and
+        then the rounded remainder (values minus what was added so far) until
+        the remainder is zero keeps the sum exact. That is usually two or three
+        fsum passes instead of one pure-Python add() per value.
+        """
+        values = list(values)
+        while values:
+            part = math.fsum(values)
+            if not part:
+                return
+            self.add(part)
+            if not math.isfinite(part):
+                return
+            values.append(-part)
+
+    def merge(self, other: ExactSum) -> ExactSum:
+        """Add another sum's partials; returns self."""
+        for y in other.partials:
+            self.add(y)
+        return self
+
+    @property
+    def value(self) -> float:
+        """Correctly rounded sum."""
+        return math.fsum(self.partials)
@@ -4,19 +4,12 @@
 """CLI for evaluation-calibration-core."""
 
 import argparse
+import sys
 from pathlib import Path
+from typing import Any
 
-from eval_calibration_core.contracts import (
-    check_schema_compatibility,
-    check_expected_minor_range,
-    get_schema_version,
-)
-from eval_calibration_core.io.fixtures import load_fixture_suite
-from eval_calibration_core.io.packet_reader import PacketReader
-from eval_calibration_core.metrics.compute import compute_metrics
-from eval_calibration_core.report.model import Report
-from eval_calibration_core.report.writer import write_report
-from eval_calibration_core.suites.invariants import check_invariants
+# Only argparse/pathlib at module level: subcommand handlers import what they use,
+# so `eval-cal --help` does not load decision_schema, NumPy or the report stack.
 
 
 def main() -> None:
@@ -33,11 +26,246 @@ def main() -> None:
         "--in",
         type=Path,
         dest="input_path",
-        help="Input JSONL file (optional, uses fixture if not provided)",
+        help="Input JSONL, .arrow or .parquet file, or a directory or quoted glob of them "
+        "(one report per trace under --out plus index.json; optional, uses fixture if "
+        "not provided)",
     )
     run_parser.add_argument(
         "--out", type=Path, default=Path("reports/latest"), help="Output directory"
     )
+    run_parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write report.json without indentation (streamed by section, orjson if installed)",
+    )
+    run_parser.add_argument(
+        "--compress",
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Write report.json.gz or report.json.zst instead of report.json",
+    )
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Consume --in lazily instead of loading all packets (memory grows only with "
+        "distinct latencies; add --latency-backend ddsketch for constant memory)",
+    )
+    run_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Parse only lines appended to --in since the last run (state in --out)",
+    )
+    run_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-stage wall/CPU time, packets/s and peak tracemalloc in report perf",
+    )
+    run_parser.add_argument(
+        "--decoder",
+        choices=["auto", "orjson", "msgspec", "json"],
+        default="auto",
+        help="JSON decoder for --in (auto: orjson, then msgspec, then stdlib json)",
+    )
+    run_parser.add_argument(
+        "--project-fields",
+        action="store_true",
+        help="Materialize only the packet fields the report reads "
+        "(lightweight records, skips PacketV2 validation)",
+    )
+    run_parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Decode JSONL --in straight into dictionary-encoded columns (int codes for "
+        "actions, flags and reason codes; bincount counters) with the default options",
+    )
+    run_parser.add_argument(
+        "--compact-records",
+        action="store_true",
+        help="Hold packets as compact records sharing equal values (interned strings, "
+        "read-only dicts) to cut per-packet memory",
+    )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Evaluate --in in N byte-range shards across N processes, or N traces at "
+        "a time when --in names several (default: 1)",
+    )
+    run_parser.add_argument(
+        "--latency-backend",
+        choices=["exact", "ddsketch"],
+        default=None,
+        help="Latency quantile backend (recorded in metrics.latency_estimator when set)",
+    )
+    run_parser.add_argument(
+        "--relative-accuracy",
+        type=float,
+        default=0.01,
+        help="Relative error bound for --latency-backend ddsketch (default: 0.01)",
+    )
+    run_parser.add_argument(
+        "--percentiles",
+        type=_parse_percentiles,
+        default=None,
+        help="Comma-separated latency percentiles, e.g. 50,90,99,99.9,max",
+    )
+    run_parser.add_argument(
+        "--calibration-bins",
+        type=int,
+        default=10,
+        help="Equal-width confidence bins for the calibration summary (default: 10)",
+    )
+    run_parser.add_argument(
+        "--window",
+        type=float,
+        default=None,
+        metavar="SIZE",
+        help="Add per-window metrics to report windows, windows of SIZE key units",
+    )
+    run_parser.add_argument(
+        "--window-step",
+        type=float,
+        default=None,
+        help="Distance between window starts (default: --window, i.e. tumbling windows)",
+    )
+    run_parser.add_argument(
+        "--window-key",
+        default="ts",
+        help='Window key: "step" or a numeric input field (default: ts)',
+    )
+    invariant_group = run_parser.add_mutually_exclusive_group()
+    invariant_group.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first packet violating an invariant and report its offset and step",
+    )
+    invariant_group.add_argument(
+        "--audit",
+        action="store_true",
+        help="Record every violating packet offset per invariant (run-length encoded) "
+        "in report violations",
+    )
+    run_parser.add_argument(
+        "--group-by",
+        default=None,
+        metavar="KEY",
+        help="Add per-group metrics and invariants to report groups, e.g. run_id "
+        "(a packet attribute or input field; the top-level report is the rollup)",
+    )
+    run_parser.add_argument(
+        "--max-groups",
+        type=int,
+        default=None,
+        help="Groups held in memory with --group-by; older groups spill to disk",
+    )
+    run_parser.add_argument(
+        "--spill-dir",
+        type=Path,
+        default=None,
+        help="Directory for --max-groups spill files (default: system temp dir)",
+    )
+    run_parser.add_argument(
+        "--fit-calibrators",
+        type=_parse_calibration_methods,
+        default=None,
+        metavar="METHODS",
+        help="Fit calibrators into calibration_summary.calibrators, e.g. isotonic,platt "
+        "(methods: isotonic, platt, histogram, temperature, or all)",
+    )
+    run_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache of reports and fits keyed by trace hash (default: $EVAL_CAL_CACHE_DIR "
+        "or ~/.cache/evaluation-calibration-core)",
+    )
+    run_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the cached report of an unchanged --in trace and configuration "
+        "(skips parsing; not used with --incremental)",
+    )
+    run_parser.add_argument(
+        "--quick-hash",
+        action="store_true",
+        help="Key the report cache on the size and mtime of --in instead of its content",
+    )
+    run_parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=None,
+        help="Evict least recently used cached reports beyond this size",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always rebuild the report and refit calibrators (neither read nor write caches)",
+    )
+
+    # Convert command
+    convert_parser = subparsers.add_parser(
+        "convert", help="Convert a JSONL trace to Arrow IPC, Parquet or seekable gzip/zstd"
+    )
+    convert_parser.add_argument(
+        "--in", type=Path, dest="input_path", required=True, help="Input JSONL file"
+    )
+    convert_parser.add_argument(
+        "--to",
+        choices=["arrow", "parquet", "gzip", "zstd"],
+        default="arrow",
+        help="Output format (gzip/zstd: independently compressed frames of whole lines)",
+    )
+    convert_parser.add_argument(
+        "--out", type=Path, default=None, help="Output file (default: input with new suffix)"
+    )
+    convert_parser.add_argument(
+        "--decoder",
+        choices=["auto", "orjson", "msgspec", "json"],
+        default="auto",
+        help="JSON decoder for --in",
+    )
+
+    # Drift command
+    drift_parser = subparsers.add_parser(
+        "drift", help="Compare a candidate trace against a baseline trace"
+    )
+    drift_parser.add_argument("--baseline", type=Path, required=True, help="Baseline trace")
+    drift_parser.add_argument("--candidate", type=Path, required=True, help="Candidate trace")
+    drift_parser.add_argument(
+        "--out", type=Path, default=Path("reports/drift"), help="Output directory"
+    )
+    drift_parser.add_argument(
+        "--alpha", type=float, default=0.01, help="Significance level (default: 0.01)"
+    )
+    drift_parser.add_argument(
+        "--latency-backend",
+        choices=["exact", "ddsketch"],
+        default="ddsketch",
+        help="Latency distribution backend for the KS test (default: ddsketch, constant memory)",
+    )
+    drift_parser.add_argument(
+        "--relative-accuracy",
+        type=float,
+        default=0.01,
+        help="Relative error bound for --latency-backend ddsketch (default: 0.01)",
+    )
+    drift_parser.add_argument(
+        "--bins",
+        type=int,
+        default=10,
+        help="Equal-width confidence histogram bins (default: 10)",
+    )
+    drift_parser.add_argument(
+        "--decoder",
+        choices=["auto", "orjson", "msgspec", "json"],
+        default="auto",
+        help="JSON decoder for JSONL traces",
+    )
+    drift_parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Profile the traces one after the other instead of in two processes",
+    )
 
     # Report command
     report_parser = subparsers.add_parser("report", help="Generate report from existing data")
@@ -46,8 +274,13 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+    if args.command is None:
+        parser.print_help()
+        return
+
+    # Check schema compatibility (only for commands that touch packets)
+    from eval_calibration_core.contracts import check_schema_compatibility
 
-    # Check schema compatibility
     try:
         check_schema_compatibility()
     except RuntimeError as e:
@@ -55,7 +288,14 @@ def main() -> None:
         return
 
     if args.command == "run":
-        _run_evaluation(args)
+        if args.input_path is not None and _is_multi_input(args.input_path):
+            _run_batch(args)
+        else:
+            _run_evaluation(args)
+    elif args.command == "convert":
+        _convert_trace(args)
+    elif args.command == "drift":
+        _run_drift(args)
     elif args.command == "report":
         print("Report generation from existing data not yet implemented")
     else:
@@ -64,41 +304,454 @@ def main() -> None:
 
 def _run_evaluation(args: argparse.Namespace) -> None:
     """Run evaluation suite."""
+    from eval_calibration_core.io.arrow_reader import (
+        ARROW_SUFFIXES,
+        PARQUET_SUFFIXES,
+        ArrowPacketReader,
+    )
+    from eval_calibration_core.io.fixtures import load_fixture_suite
+    from eval_calibration_core.profiling import NULL_PROFILER, Profiler
+    from eval_calibration_core.registry import REGISTRY, load_entry_points
+    from eval_calibration_core.report.builder import (
+        build_report,
+        build_report_columns,
+        build_report_parallel,
+        build_report_streaming,
+        report_fields,
+    )
+    from eval_calibration_core.report.incremental import (
+        STATE_FILENAME,
+        build_report_incremental,
+    )
+    from eval_calibration_core.report.model import Report
+    from eval_calibration_core.report.writer import write_perf, write_report
+    from eval_calibration_core.suites.violations import InvariantViolation
+
     # Load packets
     input_path = getattr(args, "input_path", None)
-    if input_path:
-        reader = PacketReader(input_path)
-        packets = reader.read_all()
-        suite_name = input_path.stem
-    else:
-        packets = load_fixture_suite(args.suite)
-        suite_name = args.suite
+    options = _metric_options(args)
+    workers = getattr(args, "workers", 1)
+    decoder = getattr(args, "decoder", "auto")
+    profiler = Profiler() if getattr(args, "profile", False) else NULL_PROFILER
+    group_options = _group_options(args)
+    load_entry_points()
+    project = getattr(args, "project_fields", False)
+    compact = getattr(args, "compact_records", False)
+    fields = None
+    if project:
+        fields = report_fields(window=options["window"], group_by=group_options.get("group_by"))
+    if group_options and input_path and (getattr(args, "incremental", False) or workers > 1):
+        print("[FAIL] --group-by is not supported with --incremental or --workers")
+        return
+    # Options the dictionary-encoded columnar path (build_report_columns) does not implement
+    columnar_blockers = [
+        flag
+        for flag, used in (
+            ("--latency-backend", options["latency_backend"] is not None),
+            ("--window", options["window"] is not None),
+            ("--fail-fast / --audit", options["invariant_mode"] != "summary"),
+            ("--group-by", bool(group_options)),
+            ("plugin metrics or invariants", bool(REGISTRY.names())),
+        )
+        if used
+    ]
+    columns_supported = not columnar_blockers
+    arrow_input = input_path and input_path.suffix.lower() in (*ARROW_SUFFIXES, *PARQUET_SUFFIXES)
+    if getattr(args, "columnar", False) and input_path:
+        # For JSONL, --incremental and --workers take precedence over --columnar
+        ignored_by = columnar_blockers + [
+            flag
+            for flag, used in (
+                ("--incremental", getattr(args, "incremental", False)),
+                ("--workers", workers > 1),
+            )
+            if used and not arrow_input
+        ]
+        if ignored_by:
+            print(
+                f"[NOTE] --columnar ignored with {', '.join(ignored_by)} "
+                "(using the per-packet path)",
+                file=sys.stderr,
+            )
+    methods = getattr(args, "fit_calibrators", None)
+    # Calibrator fit points, collected in the report pass where it reads packets
+    fit_points = None
+    if methods:
+        from eval_calibration_core.calibration.fitting import FitAccumulator
 
-    # Compute metrics
-    metrics = compute_metrics(packets)
+        fit_points = FitAccumulator()
+    fit_fed = False
+    report = None
+    cache_options = {**options, **group_options}
+    if methods:
+        # Cached reports include the fitted calibrators
+        cache_options["fit_calibrators"] = methods
+    cache, cache_key, trace_digest = _report_cache(args, input_path, cache_options)
+    if cache is not None:
+        with profiler.stage("cache_lookup"):
+            cached = cache.get(cache_key)
+        if cached is not None:
+            report = Report.from_dict(cached)
+    cache_hit = report is not None
+    try:
+        if report is not None:
+            # Cache hit: same trace content and configuration, nothing to parse
+            pass
+        elif arrow_input:
+            # Columnar: vectorized metrics over projected columns (exact percentiles);
+            # other options (latency backend, window, invariant mode, groups, plugins) stream
+            reader = ArrowPacketReader(input_path, fields=fields, compact=compact)
+            with profiler.stage("evaluate") as stats:
+                if columns_supported:
+                    report = build_report_columns(
+                        reader.read_columns(),
+                        suite_name=input_path.stem,
+                        percentiles=options["percentiles"],
+                        calibration_bins=options["calibration_bins"],
+                    )
+                else:
+                    packets = reader.read()
+                    if fit_points is not None:
+                        packets, fit_fed = fit_points.observe(packets), True
+                    report = build_report_streaming(
+                        packets, suite_name=input_path.stem, **options, **group_options
+                    )
+                stats.packets = report.input_stats["total_packets"]
+        elif input_path and getattr(args, "incremental", False):
+            # Incremental: resume from the accumulator state saved next to the report
+            with profiler.stage("evaluate") as stats:
+                report = build_report_incremental(
+                    input_path,
+                    args.out / STATE_FILENAME,
+                    suite_name=input_path.stem,
+                    project_fields=project,
+                    decoder=decoder,
+                    **options,
+                )
+                stats.packets = report.input_stats["total_packets"]
+        elif input_path and workers > 1:
+            # Sharded: each worker streams its byte range, states are merged in order
+            # (CPU time covers this process only)
+            with profiler.stage("evaluate") as stats:
+                report = build_report_parallel(
+                    input_path,
+                    workers,
+                    suite_name=input_path.stem,
+                    project_fields=project,
+                    decoder=decoder,
+                    **options,
+                )
+                stats.packets = report.input_stats["total_packets"]
+        elif input_path and getattr(args, "columnar", False) and columns_supported:
+            # JSONL into PacketColumns: actions, flags and reason codes as int codes
+            with profiler.stage("evaluate") as stats:
+                columns = _packet_reader(input_path, decoder).read_columns()
+                report = build_report_columns(
+                    columns,
+                    suite_name=input_path.stem,
+                    percentiles=options["percentiles"],
+                    calibration_bins=options["calibration_bins"],
+                )
+                stats.packets = len(columns)
+        elif input_path and getattr(args, "stream", False):
+            # Streaming: packets are folded into accumulators as they are read
+            reader = _packet_reader(input_path, decoder, profiler, fields, compact)
+            packets = reader.read()
+            if fit_points is not None:
+                packets, fit_fed = fit_points.observe(packets), True
+            report = build_report_streaming(
+                packets,
+                suite_name=input_path.stem,
+                profiler=profiler,
+                **options,
+                **group_options,
+            )
+        else:
+            with profiler.stage("read") as stats:
+                if input_path:
+                    reader = _packet_reader(input_path, decoder, profiler, fields, compact)
+                    packets = reader.read_all()
+                    suite_name = input_path.stem
+                else:
+                    packets = load_fixture_suite(args.suite)
+                    suite_name = args.suite
+                stats.packets = len(packets)
 
-    # Check invariants
-    invariant_results = check_invariants(packets)
+            # Compute metrics, check invariants and contract matrix in one pass
+            report = build_report(
+                packets, suite_name=suite_name, profiler=profiler, **options, **group_options
+            )
+            if fit_points is not None:
+                for packet in packets:
+                    fit_points.update(packet)
+                fit_fed = True
+    except InvariantViolation as e:
+        # --fail-fast: the pipeline stopped at the first violating packet
+        print(f"[FAIL] {e}")
+        return
+
+    if methods and not cache_hit:
+        with profiler.stage("fit_calibrators"):
+            report.calibration_summary["calibrators"] = _fit_calibrators(
+                args, input_path, methods, decoder, fit_points if fit_fed else None, trace_digest
+            )
+    if cache is not None and not cache_hit:
+        cache.put(cache_key, report.to_dict())
+
+    # Write report
+    write_options = {
+        "compact": getattr(args, "compact_json", False),
+        "compression": getattr(args, "compress", None),
+    }
+    if profiler.enabled:
+        # Attached before writing; perf.json adds the write_report stage afterwards
+        report.perf = profiler.to_dict()
+    with profiler.stage("write_report"):
+        json_path = write_report(report, args.out, **write_options)
+    print(f"[OK] Report written to {json_path} and {args.out}/report.md")
+    if profiler.enabled:
+        perf_path = write_perf(profiler.to_dict(), args.out)
+        print(f"[OK] Profile written to {perf_path}")
 
-    # Check contract matrix compatibility
-    contract_ok, contract_details = check_expected_minor_range(
-        expected_major=0, min_minor=2, max_minor=2
-    )
 
-    # Create report
-    report = Report(
-        schema_version=get_schema_version(),
-        suite_name=suite_name,
-        input_stats={"total_packets": len(packets)},
-        metrics=metrics,
-        invariant_results=invariant_results,
-        contract_matrix_check=contract_details,
-        contract_ok=contract_ok,
+def _run_batch(args: argparse.Namespace) -> None:
+    """Evaluate every trace named by a directory or glob --in, one report per trace."""
+    from eval_calibration_core.cache import ContentCache
+    from eval_calibration_core.registry import load_entry_points
+    from eval_calibration_core.report.batch import build_report_batch, expand_inputs
+    from eval_calibration_core.report.cached import REPORT_CACHE_NAMESPACE
+
+    unsupported = [
+        flag
+        for flag, used in (
+            ("--incremental", getattr(args, "incremental", False)),
+            ("--profile", getattr(args, "profile", False)),
+            ("--fit-calibrators", getattr(args, "fit_calibrators", None)),
+        )
+        if used
+    ]
+    if unsupported:
+        print(f"[FAIL] {', '.join(unsupported)} not supported with several --in traces")
+        return
+    try:
+        inputs = expand_inputs(args.input_path)
+    except FileNotFoundError as e:
+        print(f"[FAIL] {e}")
+        return
+    load_entry_points()
+    cache = None
+    if getattr(args, "cache", False) and not getattr(args, "no_cache", False):
+        max_mb = getattr(args, "cache_max_mb", None)
+        cache = ContentCache(
+            getattr(args, "cache_dir", None),
+            REPORT_CACHE_NAMESPACE,
+            max_bytes=None if max_mb is None else int(max_mb * 1e6),
+        )
+    index = build_report_batch(
+        inputs,
+        args.out,
+        workers=getattr(args, "workers", 1),
+        decoder=getattr(args, "decoder", "auto"),
+        project_fields=getattr(args, "project_fields", False),
+        cache=cache,
+        quick=getattr(args, "quick_hash", False),
+        write_options={
+            "compact": getattr(args, "compact_json", False),
+            "compression": getattr(args, "compress", None),
+        },
+        **_metric_options(args),
+        **_group_options(args),
+    )
+    for entry in index["reports"]:
+        if entry["status"] == "failed":
+            print(f"[FAIL] {entry['input']}: {entry['error']}")
+    print(
+        f"[OK] {index['ok']}/{index['inputs']} reports written to {args.out} "
+        f"(index: {args.out}/index.json)"
     )
 
-    # Write report
+
+def _is_multi_input(input_path: Path) -> bool:
+    """True if --in is a directory or glob pattern (see report/batch.py is_multi_input)."""
+    import glob
+
+    return input_path.is_dir() or glob.has_magic(str(input_path))
+
+
+def _run_drift(args: argparse.Namespace) -> None:
+    """Write the candidate's report with a drift section against the baseline."""
+    from eval_calibration_core.drift.compare import build_drift_report
+    from eval_calibration_core.report.writer import write_report
+
+    report = build_drift_report(
+        args.baseline,
+        args.candidate,
+        latency_backend=args.latency_backend,
+        relative_accuracy=args.relative_accuracy,
+        bins=args.bins,
+        alpha=args.alpha,
+        decoder=args.decoder,
+        parallel=not args.serial,
+    )
     write_report(report, args.out)
-    print(f"[OK] Report written to {args.out}/report.json and {args.out}/report.md")
+    drifted = ", ".join(report.drift["drifted"]) or "none"
+    print(f"[OK] Drift report written to {args.out}/report.json (drifted: {drifted})")
+
+
+def _convert_trace(args: argparse.Namespace) -> None:
+    """Convert a JSONL trace to a columnar format."""
+    from eval_calibration_core.io.arrow_reader import convert_trace
+    from eval_calibration_core.io.indexed_reader import compress_trace
+
+    if args.to in ("gzip", "zstd"):
+        suffix = ".gz" if args.to == "gzip" else ".zst"
+        out = args.out or args.input_path.with_name(args.input_path.name + suffix)
+        frames = compress_trace(args.input_path, out, compression=args.to)
+        print(f"[OK] Compressed {args.input_path} into {frames} frames at {out}")
+        return
+    suffix = ".arrow" if args.to == "arrow" else ".parquet"
+    out = args.out or args.input_path.with_suffix(suffix)
+    total = convert_trace(args.input_path, out, fmt=args.to, decoder=args.decoder)
+    print(f"[OK] Converted {total} packets to {out}")
+
+
+def _fit_calibrators(
+    args: argparse.Namespace,
+    input_path: Path | None,
+    methods: list[str],
+    decoder: str,
+    fit_points: Any,
+    digest: str | None,
+) -> dict[str, Any]:
+    """
+    Fit calibrators on --in (through the fit cache) or on fixture packets.
+
+    fit_points holds the points collected in the report pass; paths that do not
+    read packets one by one (columnar, sharded, incremental) pass None, and the
+    trace is then read again on a fit cache miss. digest is the trace hash of
+    the report cache key, if computed.
+    """
+    from eval_calibration_core.cache import ContentCache
+    from eval_calibration_core.calibration.fitting import CACHE_NAMESPACE, fit_trace
+
+    bins = getattr(args, "calibration_bins", 10)
+    if input_path is None:
+        return fit_points.finalize(methods, bins)
+    cache = None
+    if not getattr(args, "no_cache", False):
+        cache = ContentCache(getattr(args, "cache_dir", None), CACHE_NAMESPACE)
+    return fit_trace(
+        input_path,
+        methods,
+        bins,
+        cache=cache,
+        decoder=decoder,
+        digest=digest,
+        accumulator=fit_points,
+    )
+
+
+def _report_cache(
+    args: argparse.Namespace, input_path: Path | None, options: dict[str, Any]
+) -> tuple[Any, str | None, str | None]:
+    """
+    (ContentCache, key, trace content hash) of the report for --in with --cache,
+    else (None, None, None); the hash is None with --quick-hash.
+    """
+    if (
+        input_path is None
+        or not getattr(args, "cache", False)
+        or getattr(args, "no_cache", False)
+        or getattr(args, "incremental", False)
+    ):
+        return None, None, None
+    from eval_calibration_core.cache import ContentCache, file_digest
+    from eval_calibration_core.report.cached import REPORT_CACHE_NAMESPACE, report_cache_key
+
+    max_mb = getattr(args, "cache_max_mb", None)
+    cache = ContentCache(
+        getattr(args, "cache_dir", None),
+        REPORT_CACHE_NAMESPACE,
+        max_bytes=None if max_mb is None else int(max_mb * 1e6),
+    )
+    quick = getattr(args, "quick_hash", False)
+    digest = file_digest(input_path, quick=quick)
+    return cache, report_cache_key(digest, input_path.stem, options), None if quick else digest
+
+
+def _packet_reader(
+    input_path: Path,
+    decoder: str,
+    profiler: Any = None,
+    fields: Any = None,
+    compact: bool = False,
+) -> Any:
+    """PacketReader for plain JSONL, IndexedPacketReader for gzip/zstd traces."""
+    from eval_calibration_core.io.indexed_reader import IndexedPacketReader, detect_compression
+    from eval_calibration_core.io.packet_reader import PacketReader
+
+    if detect_compression(input_path) is not None:
+        return IndexedPacketReader(input_path, decoder=decoder, fields=fields, compact=compact)
+    return PacketReader(
+        input_path, decoder=decoder, profiler=profiler, fields=fields, compact=compact
+    )
+
+
+def _parse_calibration_methods(spec: str) -> list[str]:
+    """argparse type for --fit-calibrators (imports the calibration package only when used)."""
+    from eval_calibration_core.calibration.fitting import parse_calibration_methods
+
+    return parse_calibration_methods(spec)
+
+
+def _parse_percentiles(spec: str) -> list[float | str]:
+    """argparse type for --percentiles (imports the metrics package only when used)."""
+    from eval_calibration_core.metrics.quantiles import parse_percentiles
+
+    return parse_percentiles(spec)
+
+
+def _metric_options(args: argparse.Namespace) -> dict[str, Any]:
+    """Metric configuration keyword arguments for build_report from CLI args."""
+    return {
+        "latency_backend": getattr(args, "latency_backend", None),
+        "relative_accuracy": getattr(args, "relative_accuracy", 0.01),
+        "percentiles": getattr(args, "percentiles", None),
+        "calibration_bins": getattr(args, "calibration_bins", 10),
+        "window": _window_spec(args),
+        "invariant_mode": _invariant_mode(args),
+    }
+
+
+def _invariant_mode(args: argparse.Namespace) -> str:
+    """Invariant mode from --fail-fast / --audit."""
+    if getattr(args, "fail_fast", False):
+        return "fail_fast"
+    if getattr(args, "audit", False):
+        return "audit"
+    return "summary"
+
+
+def _group_options(args: argparse.Namespace) -> dict[str, Any]:
+    """group_by / max_groups / spill_dir keyword arguments (empty without --group-by)."""
+    group_by = getattr(args, "group_by", None)
+    if group_by is None:
+        return {}
+    return {
+        "group_by": group_by,
+        "max_groups": getattr(args, "max_groups", None),
+        "spill_dir": getattr(args, "spill_dir", None),
+    }
+
+
+def _window_spec(args: argparse.Namespace) -> Any:
+    """WindowSpec from --window / --window-step / --window-key (None without --window)."""
+    size = getattr(args, "window", None)
+    if size is None:
+        return None
+    from eval_calibration_core.metrics.windows import WindowSpec
+
+    return WindowSpec(size, getattr(args, "window_step", None), getattr(args, "window_key", "ts"))
 
 
 if __name__ == "__main__":
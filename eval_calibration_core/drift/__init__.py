@@ -0,0 +1,22 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Drift detection between a baseline and a candidate trace."""
+
+from eval_calibration_core.drift.compare import (
+    TraceProfile,
+    build_drift_report,
+    compare_profiles,
+    profile_trace,
+)
+from eval_calibration_core.drift.statistics import chi_square, ks_two_sample, psi
+
+__all__ = [
+    "TraceProfile",
+    "build_drift_report",
+    "chi_square",
+    "compare_profiles",
+    "ks_two_sample",
+    "profile_trace",
+    "psi",
+]
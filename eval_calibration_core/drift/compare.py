@@ -0,0 +1,266 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Baseline vs candidate drift: streaming trace profiles and their comparison."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from eval_calibration_core.calibration.reliability import DEFAULT_BINS, CalibrationAccumulator
+from eval_calibration_core.drift.statistics import chi_square, ks_two_sample, psi
+from eval_calibration_core.io.readers import open_packet_reader
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
+from eval_calibration_core.report.builder import _report_from_accumulators
+from eval_calibration_core.report.model import Report
+from eval_calibration_core.suites.invariants import InvariantAccumulator
+
+DEFAULT_ALPHA = 0.01
+PSI_THRESHOLD = 0.25
+
+
+class TraceProfile:
+    """
+    Everything drift detection reads from one trace, accumulated in a single pass.
+
+    Wraps the report accumulators (metrics with a mergeable latency sketch,
+    invariants, calibration) and adds an equal-width confidence histogram, so
+    the candidate's full report comes out of the same pass. Memory is bounded
+    by the number of actions, guard codes, latency buckets and bins.
+    """
+
+    def __init__(
+        self,
+        latency_backend: str = "ddsketch",
+        relative_accuracy: float = 0.01,
+        bins: int = DEFAULT_BINS,
+    ) -> None:
+        """
+        Initialize empty profile.
+
+        Args:
+            latency_backend: "ddsketch" (constant memory) or "exact"
+            relative_accuracy: Relative error bound for "ddsketch"
+            bins: Confidence histogram and calibration bins
+        """
+        self.metrics = MetricsAccumulator(latency_backend, relative_accuracy)
+        self.invariants = InvariantAccumulator()
+        self.calibration = CalibrationAccumulator(bins)
+        self.bins = bins
+        self.confidence_counts = [0] * bins
+        self.confidence_missing = 0
+
+    def update(self, packet: Any) -> None:
+        """
+        Add one packet.
+
+        Args:
+            packet: PacketV2 packet
+        """
+        self.metrics.update(packet)
+        self.invariants.update(packet)
+        self.calibration.update(packet)
+        confidence = packet.mdm.get("confidence")
+        if isinstance(confidence, (int, float)) and 0.0 <= confidence <= 1.0:
+            self.confidence_counts[min(int(confidence * self.bins), self.bins - 1)] += 1
+        else:
+            self.confidence_missing += 1
+
+    def confidence_histogram(self) -> dict[int, int]:
+        """Bin index -> count."""
+        return dict(enumerate(self.confidence_counts))
+
+
+def profile_trace(path: Path | str, decoder: str = "auto", **options: Any) -> TraceProfile:
+    """
+    Stream a trace into a TraceProfile.
+
+    Args:
+        path: JSONL (optionally .gz / .zst), Arrow IPC or Parquet trace
+        decoder: JSON decoder backend for JSONL traces
+        **options: TraceProfile arguments
+
+    Returns:
+        TraceProfile
+    """
+    profile = TraceProfile(**options)
+    for packet in open_packet_reader(path, decoder).read():
+        profile.update(packet)
+    return profile
+
+
+def compare_profiles(
+    baseline: TraceProfile, candidate: TraceProfile, alpha: float = DEFAULT_ALPHA
+) -> dict[str, Any]:
+    """
+    Drift of candidate against baseline.
+
+    Sections: action distribution (chi-square and PSI), latency (two-sample KS
+    over the latency sketches), guard trigger rates (per-code rates with a 2x2
+    chi-square) and confidence histogram (chi-square and PSI). A section is
+    flagged `drifted` when a p-value is below alpha or PSI exceeds PSI_THRESHOLD.
+
+    Args:
+        baseline: Profile of the baseline trace
+        candidate: Profile of the candidate trace
+        alpha: Significance level
+
+    Returns:
+        Drift dict (Report.drift)
+
+    Raises:
+        ValueError: If the profiles use different latency sketches or bins
+    """
+    if (baseline.metrics.latency.backend, baseline.metrics.latency.relative_accuracy) != (
+        candidate.metrics.latency.backend,
+        candidate.metrics.latency.relative_accuracy,
+    ) or baseline.bins != candidate.bins:
+        raise ValueError("Baseline and candidate profiles must use the same configuration")
+    n_base = baseline.metrics.total_steps
+    n_cand = candidate.metrics.total_steps
+
+    actions_base = baseline.metrics.action_counts
+    actions_cand = candidate.metrics.action_counts
+    actions = {
+        "baseline": dict(actions_base),
+        "candidate": dict(actions_cand),
+        "chi_square": chi_square(actions_base, actions_cand),
+        "psi": psi(actions_base, actions_cand),
+    }
+    actions["drifted"] = _drifted(actions["chi_square"]["p_value"], actions["psi"], alpha)
+
+    ks = ks_two_sample(
+        baseline.metrics.latency.cdf_points(), candidate.metrics.latency.cdf_points()
+    )
+    percentiles = baseline.metrics.percentiles
+    latency = {
+        "baseline": baseline.metrics.latency.quantiles(percentiles),
+        "candidate": candidate.metrics.latency.quantiles(percentiles),
+        "ks": ks,
+        "drifted": ks["p_value"] < alpha,
+    }
+
+    codes = {}
+    for code in {**baseline.metrics.trigger_counts, **candidate.metrics.trigger_counts}:
+        b = baseline.metrics.trigger_counts.get(code, 0)
+        c = candidate.metrics.trigger_counts.get(code, 0)
+        test = chi_square(
+            {"triggered": b, "clear": max(n_base - b, 0)},
+            {"triggered": c, "clear": max(n_cand - c, 0)},
+        )
+        rate_base = b / n_base if n_base else 0.0
+        rate_cand = c / n_cand if n_cand else 0.0
+        codes[code] = {
+            "baseline": rate_base,
+            "candidate": rate_cand,
+            "delta": rate_cand - rate_base,
+            "p_value": test["p_value"],
+        }
+    guards = {
+        "codes": codes,
+        "max_abs_delta": max((abs(entry["delta"]) for entry in codes.values()), default=0.0),
+        "drifted": any(entry["p_value"] < alpha for entry in codes.values()),
+    }
+
+    hist_base = baseline.confidence_histogram()
+    hist_cand = candidate.confidence_histogram()
+    confidence = {
+        "bins": baseline.bins,
+        "baseline": baseline.confidence_counts,
+        "candidate": candidate.confidence_counts,
+        "missing": {
+            "baseline": baseline.confidence_missing,
+            "candidate": candidate.confidence_missing,
+        },
+        "chi_square": chi_square(hist_base, hist_cand),
+        "psi": psi(hist_base, hist_cand),
+    }
+    confidence["drifted"] = _drifted(confidence["chi_square"]["p_value"], confidence["psi"], alpha)
+
+    sections = {
+        "action_distribution": actions,
+        "latency": latency,
+        "guard_trigger_rates": guards,
+        "confidence": confidence,
+    }
+    return {
+        "alpha": alpha,
+        "psi_threshold": PSI_THRESHOLD,
+        "packets": {"baseline": n_base, "candidate": n_cand},
+        **sections,
+        "drifted": [name for name, section in sections.items() if section["drifted"]],
+    }
+
+
+def _drifted(p_value: float, psi_value: float, alpha: float) -> bool:
+    return p_value < alpha or psi_value > PSI_THRESHOLD
+
+
+def build_drift_report(
+    baseline_path: Path | str,
+    candidate_path: Path | str,
+    suite_name: str | None = None,
+    expected_schema_minor: int = 2,
+    latency_backend: str = "ddsketch",
+    relative_accuracy: float = 0.01,
+    bins: int = DEFAULT_BINS,
+    alpha: float = DEFAULT_ALPHA,
+    decoder: str = "auto",
+    parallel: bool = True,
+) -> Report:
+    """
+    Report of the candidate trace with a drift section against the baseline.
+
+    Each trace is streamed once (both at the same time in two worker
+    processes when parallel is True); the candidate's metrics, invariants and
+    calibration summary come from the same pass.
+
+    Args:
+        baseline_path: Baseline trace
+        candidate_path: Candidate trace
+        suite_name: Suite identifier (default: candidate file stem)
+        expected_schema_minor: Expected decision-schema minor (default 2 for 0.2.x)
+        latency_backend: "ddsketch" (constant memory) or "exact"
+        relative_accuracy: Relative error bound for "ddsketch"
+        bins: Confidence histogram and calibration bins
+        alpha: Significance level for the drift flags
+        decoder: JSON decoder backend for JSONL traces
+        parallel: Profile both traces concurrently in two processes
+
+    Returns:
+        Report with drift set
+
+    Raises:
+        ValueError: If a packet is invalid
+    """
+    options = {
+        "latency_backend": latency_backend,
+        "relative_accuracy": relative_accuracy,
+        "bins": bins,
+    }
+    if parallel:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(profile_trace, path, decoder, **options)
+                for path in (baseline_path, candidate_path)
+            ]
+            baseline, candidate = [future.result() for future in futures]
+    else:
+        baseline = profile_trace(baseline_path, decoder, **options)
+        candidate = profile_trace(candidate_path, decoder, **options)
+
+    report = _report_from_accumulators(
+        candidate.metrics,
+        candidate.invariants,
+        suite_name or Path(candidate_path).stem,
+        expected_schema_minor,
+        candidate.calibration,
+    )
+    report.drift = {
+        "baseline": str(baseline_path),
+        "candidate": str(candidate_path),
+        **compare_profiles(baseline, candidate, alpha),
+    }
+    return report
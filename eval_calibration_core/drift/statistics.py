@@ -0,0 +1,165 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Two-sample drift statistics over counts and CDF points: chi-square, PSI, KS."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+# Proportions below this are floored in PSI so empty categories stay finite
+PSI_FLOOR = 1e-4
+
+_FPMIN = 1e-300
+_EPS = 3e-16
+
+
+def chi_square(baseline: Mapping[Any, int], candidate: Mapping[Any, int]) -> dict[str, Any]:
+    """
+    Chi-square test of homogeneity of two categorical count distributions.
+
+    Args:
+        baseline: Category -> count
+        candidate: Category -> count
+
+    Returns:
+        {"statistic", "dof", "p_value"} (p_value 1.0 when there is nothing to compare)
+    """
+    n_base = sum(baseline.values())
+    n_cand = sum(candidate.values())
+    total = n_base + n_cand
+    statistic = 0.0
+    columns = 0
+    if n_base and n_cand:
+        for key in {**baseline, **candidate}:
+            b, c = baseline.get(key, 0), candidate.get(key, 0)
+            if not b + c:
+                continue
+            columns += 1
+            expected_b = n_base * (b + c) / total
+            expected_c = n_cand * (b + c) / total
+            statistic += (b - expected_b) ** 2 / expected_b + (c - expected_c) ** 2 / expected_c
+    dof = max(columns - 1, 0)
+    return {
+        "statistic": statistic,
+        "dof": dof,
+        "p_value": chi2_sf(statistic, dof) if dof else 1.0,
+    }
+
+
+def psi(baseline: Mapping[Any, int], candidate: Mapping[Any, int]) -> float:
+    """
+    Population stability index: sum((c - b) * ln(c / b)) over category proportions.
+
+    Proportions are floored at PSI_FLOOR. Common reading: < 0.1 stable,
+    0.1-0.25 moderate shift, > 0.25 significant shift.
+    """
+    n_base = sum(baseline.values())
+    n_cand = sum(candidate.values())
+    if not n_base or not n_cand:
+        return 0.0
+    total = 0.0
+    for key in {**baseline, **candidate}:
+        b = max(baseline.get(key, 0) / n_base, PSI_FLOOR)
+        c = max(candidate.get(key, 0) / n_cand, PSI_FLOOR)
+        total += (c - b) * math.log(c / b)
+    return total
+
+
+def ks_two_sample(
+    baseline: Sequence[tuple[float, int]], candidate: Sequence[tuple[float, int]]
+) -> dict[str, Any]:
+    """
+    Two-sample Kolmogorov-Smirnov test from CDF points (value, samples <= value).
+
+    With DDSketch points the CDFs are compared at the shared bucket bounds, so
+    the statistic is exact for the bucketed data (values within a bucket are
+    indistinguishable, which can only lower it).
+
+    Args:
+        baseline: Ascending CDF points of the baseline (e.g. estimator.cdf_points())
+        candidate: Ascending CDF points of the candidate
+
+    Returns:
+        {"statistic", "p_value"} (asymptotic Kolmogorov distribution)
+    """
+    n_base = baseline[-1][1] if baseline else 0
+    n_cand = candidate[-1][1] if candidate else 0
+    if not n_base or not n_cand:
+        return {"statistic": 0.0, "p_value": 1.0}
+    i = j = 0
+    f_base = f_cand = 0
+    statistic = 0.0
+    while i < len(baseline) or j < len(candidate):
+        x = min(
+            baseline[i][0] if i < len(baseline) else math.inf,
+            candidate[j][0] if j < len(candidate) else math.inf,
+        )
+        while i < len(baseline) and baseline[i][0] <= x:
+            f_base = baseline[i][1]
+            i += 1
+        while j < len(candidate) and candidate[j][0] <= x:
+            f_cand = candidate[j][1]
+            j += 1
+        statistic = max(statistic, abs(f_base / n_base - f_cand / n_cand))
+    effective = math.sqrt(n_base * n_cand / (n_base + n_cand))
+    return {
+        "statistic": statistic,
+        "p_value": kolmogorov_sf((effective + 0.12 + 0.11 / effective) * statistic),
+    }
+
+
+def kolmogorov_sf(lam: float) -> float:
+    """Survival function of the Kolmogorov distribution, Q_KS(lam)."""
+    if lam < 0.2:
+        return 1.0
+    total = 0.0
+    sign = 2.0
+    previous = 0.0
+    for j in range(1, 101):
+        term = sign * math.exp(-2.0 * j * j * lam * lam)
+        total += term
+        if abs(term) <= 1e-3 * previous or abs(term) <= 1e-8 * abs(total):
+            return min(max(total, 0.0), 1.0)
+        sign = -sign
+        previous = abs(term)
+    return 1.0
+
+
+def chi2_sf(x: float, dof: int) -> float:
+    """Survival function of the chi-square distribution (regularized upper gamma Q)."""
+    if x <= 0.0:
+        return 1.0
+    a, x = dof / 2.0, x / 2.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1.0:
+        # Series for the lower incomplete gamma
+        term = total = 1.0 / a
+        ap = a
+        for _ in range(1000):
+            ap += 1.0
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * _EPS:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Continued fraction for the upper incomplete gamma (modified Lentz)
+    b = x + 1.0 - a
+    c = 1.0 / _FPMIN
+    d = 1.0 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = d if abs(d) >= _FPMIN else _FPMIN
+        c = b + an / c
+        c = c if abs(c) >= _FPMIN else _FPMIN
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < _EPS:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
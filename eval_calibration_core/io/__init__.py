@@ -3,7 +3,24 @@
 # SPDX-License-Identifier: MIT
 """I/O utilities for reading PacketV2 traces and fixtures."""
 
-from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.io.arrow_reader import ArrowPacketReader, convert_trace
+from eval_calibration_core.io.columns import PacketColumns
 from eval_calibration_core.io.fixtures import load_fixture_suite
+from eval_calibration_core.io.indexed_reader import IndexedPacketReader, compress_trace
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.io.readers import open_packet_reader
+from eval_calibration_core.io.records import Interner, PacketRecord, record_builder
 
-__all__ = ["PacketReader", "load_fixture_suite"]
+__all__ = [
+    "ArrowPacketReader",
+    "IndexedPacketReader",
+    "Interner",
+    "PacketColumns",
+    "PacketReader",
+    "PacketRecord",
+    "compress_trace",
+    "convert_trace",
+    "load_fixture_suite",
+    "open_packet_reader",
+    "record_builder",
+]
@@ -0,0 +1,378 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Binary columnar traces (Arrow IPC / Parquet): converter and ArrowPacketReader."""
+
+from __future__ import annotations
+
+import json
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.io.columns import PacketColumns, Vocabulary
+from eval_calibration_core.io.indexed_reader import IndexedPacketReader, detect_compression
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.io.records import record_builder
+from eval_calibration_core.registry import PACKET_FIELDS
+
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+PARQUET_SUFFIXES = (".parquet",)
+
+# Lossless payload: full PacketV2 fields (nested dicts as JSON text)
+PAYLOAD_COLUMNS = (
+    "run_id",
+    "step",
+    "schema_version",
+    "input",
+    "external",
+    "mdm",
+    "final_action",
+    "latency_ms",
+    "latency_ms_is_int",
+    "mismatch",
+)
+
+# Columns each metric / invariant reads (PacketColumns attribute names)
+COLUMN_REQUIREMENTS: dict[str, tuple[str, ...]] = {
+    "action_distribution": ("final_action_code",),
+    "guard_trigger_rates": ("reason_codes",),
+    "safety_invariant_pass_rate": ("allowed", "has_flags", "mismatch_present"),
+    "latency_percentiles": ("latency_ms", "latency_ms_is_int"),
+    "total_steps": (),
+    "contract_closure": ("final_action_code", "mdm_action_code"),
+    "confidence_clamp": ("confidence",),
+    "fail_closed": ("allowed", "has_flags", "mismatch_present", "fail_closed_marker"),
+    "packet_version": ("schema_version_ok",),
+}
+
+# Payload columns holding JSON text
+_JSON_COLUMNS = ("input", "external", "mdm", "final_action", "mismatch")
+
+_FLAG_COLUMNS = (
+    "allowed",
+    "mismatch_present",
+    "mismatch_truthy",
+    "has_flags",
+    "fail_closed_marker",
+    "schema_version_ok",
+)
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow/Parquet traces require pyarrow: pip install evaluation-calibration-core[arrow]"
+        ) from e
+    return pyarrow
+
+
+def _trace_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in ARROW_SUFFIXES:
+        return "arrow"
+    if suffix in PARQUET_SUFFIXES:
+        return "parquet"
+    raise ValueError(
+        f"Unknown columnar trace format: {path}. "
+        f"Expected one of {[*ARROW_SUFFIXES, *PARQUET_SUFFIXES]}"
+    )
+
+
+def _schema() -> Any:
+    pa = _require_pyarrow()
+    fields = [
+        pa.field("run_id", pa.string()),
+        pa.field("step", pa.int64()),
+        pa.field("schema_version", pa.string()),
+        pa.field("input", pa.string()),
+        pa.field("external", pa.string()),
+        pa.field("mdm", pa.string()),
+        pa.field("final_action", pa.string()),
+        pa.field("latency_ms", pa.float64()),
+        pa.field("latency_ms_is_int", pa.uint8()),
+        pa.field("mismatch", pa.string()),
+        # Projections read by metrics and invariants (see PacketColumns)
+        pa.field("final_action_code", pa.string()),
+        pa.field("mdm_action_code", pa.string()),
+        pa.field("confidence", pa.float64()),
+        pa.field("flags", pa.large_list(pa.string())),
+        pa.field("reason_codes", pa.large_list(pa.string())),
+    ]
+    fields.extend(pa.field(name, pa.uint8()) for name in _FLAG_COLUMNS)
+    return pa.schema(fields)
+
+
+def _as_text(value: Any) -> str:
+    """Action / code values as text (non-strings as JSON, which is how report.json keys them)."""
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _batch(packets: list[PacketV2], schema: Any) -> Any:
+    """Build one RecordBatch (payload + projections) from PacketV2 instances."""
+    pa = _require_pyarrow()
+    columns = PacketColumns.from_packets(packets)
+    final_vocab = [_as_text(v) for v in columns.final_actions.values]
+    mdm_vocab = [_as_text(v) for v in columns.mdm_actions.values]
+    flag_vocab = [_as_text(v) for v in columns.flags.values]
+    reason_vocab = [_as_text(v) for v in columns.reason_codes.values]
+
+    def csr(values: Any, offsets: Any, vocab: list[str]) -> Any:
+        return pa.LargeListArray.from_arrays(
+            pa.array(offsets, type=pa.int64()),
+            pa.array([vocab[code] for code in values], type=pa.string()),
+        )
+
+    data = {
+        "run_id": [p.run_id for p in packets],
+        "step": columns.step,
+        "schema_version": [p.schema_version for p in packets],
+        "input": [json.dumps(p.input) for p in packets],
+        "external": [json.dumps(p.external) for p in packets],
+        "mdm": [json.dumps(p.mdm) for p in packets],
+        "final_action": [json.dumps(p.final_action) for p in packets],
+        "latency_ms": array("d", columns.latency_ms),  # int64 while all ints; stored as float64
+        "latency_ms_is_int": columns.latency_int,
+        "mismatch": [None if p.mismatch is None else json.dumps(p.mismatch) for p in packets],
+        "final_action_code": [final_vocab[c] for c in columns.final_action],
+        "mdm_action_code": [mdm_vocab[c] for c in columns.mdm_action],
+        "confidence": columns.confidence,
+        "flags": csr(columns.flag_values, columns.flag_offsets, flag_vocab),
+        "reason_codes": csr(columns.reason_values, columns.reason_offsets, reason_vocab),
+    }
+    for name in _FLAG_COLUMNS:
+        data[name] = getattr(columns, name)
+    arrays = [
+        data[field.name]
+        if isinstance(data[field.name], pa.Array)
+        else pa.array(data[field.name], type=field.type)
+        for field in schema
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def convert_trace(
+    src: Path | str,
+    dst: Path | str,
+    fmt: str | None = None,
+    batch_size: int = 65536,
+    decoder: str = "auto",
+) -> int:
+    """
+    Convert a PacketV2 JSONL trace to Arrow IPC or Parquet.
+
+    Packets are validated through PacketV2 while converting. Each row stores the
+    full packet (nested dicts as JSON text, so read() round-trips losslessly) plus
+    flat projection columns that metrics and invariants read directly.
+
+    Args:
+        src: Input JSONL path (optionally .gz / .zst)
+        dst: Output path
+        fmt: "arrow" or "parquet" (default: inferred from dst suffix)
+        batch_size: Packets per record batch / row group
+        decoder: JSON decoder backend for the input (see io/decoders.py)
+
+    Returns:
+        Number of packets written
+    """
+    pa = _require_pyarrow()
+    dst = Path(dst)
+    fmt = fmt or _trace_format(dst)
+    schema = _schema()
+    if fmt == "arrow":
+        writer = pa.ipc.new_file(str(dst), schema)
+    elif fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(str(dst), schema)
+    else:
+        raise ValueError(f"Unknown columnar format: {fmt}. Available: ['arrow', 'parquet']")
+
+    total = 0
+    batch: list[PacketV2] = []
+    with writer:
+        if detect_compression(src) is not None:
+            reader = IndexedPacketReader(src, decoder=decoder)
+        else:
+            reader = PacketReader(src, decoder=decoder)
+        for packet in reader.read():
+            batch.append(packet)
+            if len(batch) >= batch_size:
+                writer.write_batch(_batch(batch, schema))
+                total += len(batch)
+                batch = []
+        if batch or total == 0:
+            writer.write_batch(_batch(batch, schema))
+            total += len(batch)
+    return total
+
+
+class ArrowPacketReader:
+    """Read PacketV2 traces stored as Arrow IPC (memory-mapped) or Parquet."""
+
+    def __init__(
+        self, path: Path | str, fields: Iterable[str] | None = None, compact: bool = False
+    ):
+        """
+        Initialize reader.
+
+        Args:
+            path: Path to a trace written by convert_trace (.arrow/.feather/.ipc or .parquet)
+            fields: Optional projection: read() loads and decodes only these payload
+                columns and yields PacketRecord instances (see PacketReader)
+            compact: Yield compact PacketRecord instances (see PacketReader)
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Packet file not found: {self.path}")
+        self.format = _trace_format(self.path)
+        if fields is None and compact:
+            fields = PACKET_FIELDS
+        self.fields = None if fields is None else tuple(fields)
+        self._build = record_builder(self.fields, compact)
+
+    def _table(self, columns: Iterable[str]) -> Any:
+        """Load only the given columns (IPC: memory-mapped, buffers reference the map)."""
+        pa = _require_pyarrow()
+        columns = list(dict.fromkeys(columns))
+        if self.format == "arrow":
+            source = pa.memory_map(str(self.path), "r")
+            return pa.ipc.open_file(source).read_all().select(columns)
+        import pyarrow.parquet as pq
+
+        return pq.read_table(str(self.path), columns=columns, memory_map=True)
+
+    def read(self) -> Iterator[PacketV2]:
+        """
+        Read packets (lossless round-trip of the converted JSONL).
+
+        Yields:
+            PacketV2 instances (PacketRecord instances with a field projection)
+        """
+        if self.fields is not None:
+            yield from self._read_projected()
+            return
+        table = self._table(PAYLOAD_COLUMNS)
+        for batch in table.to_batches():
+            rows = batch.to_pydict()
+            for i in range(batch.num_rows):
+                data = {
+                    "run_id": rows["run_id"][i],
+                    "step": rows["step"][i],
+                    "input": json.loads(rows["input"][i]),
+                    "external": json.loads(rows["external"][i]),
+                    "mdm": json.loads(rows["mdm"][i]),
+                    "final_action": json.loads(rows["final_action"][i]),
+                    "latency_ms": (
+                        int(rows["latency_ms"][i])
+                        if rows["latency_ms_is_int"][i]
+                        else rows["latency_ms"][i]
+                    ),
+                    "mismatch": (
+                        None if rows["mismatch"][i] is None else json.loads(rows["mismatch"][i])
+                    ),
+                }
+                if rows["schema_version"][i] is not None:
+                    data["schema_version"] = rows["schema_version"][i]
+                yield PacketV2.from_dict(data)
+
+    def _read_projected(self) -> Iterator[Any]:
+        """read() over the projected payload columns only."""
+        columns = list(self.fields)
+        if "latency_ms" in self.fields:
+            columns.append("latency_ms_is_int")
+        table = self._table(columns)
+        for batch in table.to_batches():
+            rows = batch.to_pydict()
+            for i in range(batch.num_rows):
+                data = {}
+                for name in self.fields:
+                    value = rows[name][i]
+                    if name in _JSON_COLUMNS and value is not None:
+                        value = json.loads(value)
+                    elif name == "latency_ms" and rows["latency_ms_is_int"][i]:
+                        value = int(value)
+                    if value is not None or name != "schema_version":
+                        data[name] = value
+                yield self._build(data)
+
+    def read_all(self) -> list[PacketV2]:
+        """
+        Read all packets into a list.
+
+        Returns:
+            List of PacketV2 instances
+        """
+        return list(self.read())
+
+    def read_columns(self, needs: Iterable[str] | None = None) -> PacketColumns:
+        """
+        Load a PacketColumns store with only the columns the given metrics/invariants read.
+
+        Numeric and flag columns are NumPy views of the Arrow buffers (zero-copy for
+        single-chunk files); action and reason code columns are dictionary-encoded
+        into Vocabulary codes. Columns not needed stay empty.
+
+        Args:
+            needs: Metric / invariant names (keys of COLUMN_REQUIREMENTS); None loads all
+
+        Returns:
+            PacketColumns
+        """
+        import numpy as np
+
+        needs = list(COLUMN_REQUIREMENTS) if needs is None else list(needs)
+        unknown = [name for name in needs if name not in COLUMN_REQUIREMENTS]
+        if unknown:
+            raise ValueError(f"Unknown metric/invariant: {unknown}")
+        wanted = ["step"] + [c for name in needs for c in COLUMN_REQUIREMENTS[name]]
+        table = self._table(wanted)
+        columns = PacketColumns()
+
+        def numeric(name: str) -> Any:
+            column = table.column(name)
+            if column.num_chunks == 1:
+                # Single chunk without nulls: a view of the (memory-mapped) buffer
+                return column.chunk(0).to_numpy(zero_copy_only=False)
+            return column.to_numpy()
+
+        columns.step = numeric("step")
+        for name in set(wanted):
+            if name in ("step", "latency_ms_is_int"):
+                continue
+            if name == "latency_ms":
+                columns.latency_ms = numeric("latency_ms")
+                if "latency_ms_is_int" in wanted:
+                    columns.latency_int = numeric("latency_ms_is_int")
+                    columns.latency_is_int = bool(np.all(columns.latency_int))
+            elif name in ("final_action_code", "mdm_action_code"):
+                vocab, codes = _encode(table.column(name))
+                if name == "final_action_code":
+                    columns.final_actions, columns.final_action = vocab, codes
+                else:
+                    columns.mdm_actions, columns.mdm_action = vocab, codes
+            elif name == "reason_codes":
+                lists = table.column(name).combine_chunks()
+                columns.reason_codes, columns.reason_values = _encode(lists.flatten())
+                columns.reason_offsets = lists.offsets.to_numpy().astype(np.uint64)
+            else:
+                setattr(columns, name, numeric(name))
+        return columns
+
+
+def _encode(values: Any) -> tuple[Vocabulary, Any]:
+    """Dictionary-encode an Arrow string column into (Vocabulary, codes) in first-seen order."""
+    import pyarrow.compute as pc
+
+    encoded = pc.dictionary_encode(values)
+    if hasattr(encoded, "combine_chunks"):
+        encoded = encoded.combine_chunks()
+    vocab = Vocabulary()
+    for value in encoded.dictionary.to_pylist():
+        vocab.encode(value)
+    return vocab, encoded.indices.to_numpy()
@@ -0,0 +1,181 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Columnar (struct-of-arrays) in-memory packet store."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.io.records import OPTIONAL_DEFAULTS
+
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+class Vocabulary:
+    """Interning table: value -> small int code, codes assigned in first-seen order."""
+
+    def __init__(self) -> None:
+        """Initialize empty vocabulary."""
+        self.values: list[Any] = []
+        self.codes: dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        """Return the code for value, assigning the next code if it is new."""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class PacketColumns:
+    """
+    Struct-of-arrays view of a PacketV2 trace holding only what metrics and invariants read.
+
+    Scalar fields are stdlib `array` columns (zero-copy convertible to NumPy);
+    actions and reason codes are interned into Vocabulary codes; mismatch flags
+    and reason codes use CSR layout (values + offsets, row i spans
+    offsets[i]:offsets[i + 1]).
+
+    Columns:
+        step, latency_ms: per-row numbers (latency_ms is int64 while every latency
+            fits one, so large integer latencies stay exact, and float64 after)
+        latency_int: latency_ms was an int (latency_is_int: every row was)
+        final_action, mdm_action: action codes (final defaults to "UNKNOWN")
+        confidence: mdm.confidence, NaN when missing or None
+        allowed: final_action.allowed (default True)
+        mismatch_present: mismatch is not None
+        mismatch_truthy: mismatch is a non-empty dict (reason codes are counted)
+        has_flags: mismatch.flags is non-empty
+        fail_closed_marker: external has a "fail_closed" / "*.fail_closed" key
+        schema_version_ok: schema_version is present
+        flag_values/flag_offsets: CSR mismatch.flags
+        reason_values/reason_offsets: CSR mismatch.reason_codes (only for truthy mismatch)
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.final_actions = Vocabulary()
+        self.mdm_actions = Vocabulary()
+        self.flags = Vocabulary()
+        self.reason_codes = Vocabulary()
+
+        self.step = array("q")
+        self.latency_ms = array("q")
+        self.latency_int = array("B")
+        self.latency_is_int = True
+        self.final_action = array("I")
+        self.mdm_action = array("I")
+        self.confidence = array("d")
+        self.allowed = array("B")
+        self.mismatch_present = array("B")
+        self.mismatch_truthy = array("B")
+        self.has_flags = array("B")
+        self.fail_closed_marker = array("B")
+        self.schema_version_ok = array("B")
+        self.flag_values = array("I")
+        self.flag_offsets = array("Q", [0])
+        self.reason_values = array("I")
+        self.reason_offsets = array("Q", [0])
+
+    def __len__(self) -> int:
+        return len(self.step)
+
+    @classmethod
+    def from_packets(cls, packets: Iterable[PacketV2]) -> PacketColumns:
+        """Build columns from PacketV2 instances."""
+        columns = cls()
+        for packet in packets:
+            columns.append(
+                packet.step,
+                packet.final_action,
+                packet.mdm,
+                packet.mismatch,
+                packet.external,
+                packet.latency_ms,
+                packet.schema_version,
+            )
+        return columns
+
+    def append_dict(self, data: dict[str, Any]) -> None:
+        """
+        Append one serialized PacketV2 dict (as decoded from JSONL) without building a PacketV2.
+
+        Raises:
+            KeyError: If a required PacketV2 field is missing
+        """
+        self.append(
+            data["step"],
+            data["final_action"],
+            data["mdm"],
+            data.get("mismatch"),
+            data["external"],
+            data["latency_ms"],
+            data.get("schema_version", OPTIONAL_DEFAULTS["schema_version"]),
+        )
+
+    def append(
+        self,
+        step: int,
+        final_action: dict[str, Any],
+        mdm: dict[str, Any],
+        mismatch: dict[str, Any] | None,
+        external: dict[str, Any] | None,
+        latency_ms: float,
+        schema_version: str | None,
+    ) -> None:
+        """
+        Append one packet's fields.
+
+        Raises:
+            TypeError: If confidence or latency_ms is not a number
+        """
+        self.step.append(step)
+        is_int = isinstance(latency_ms, int)
+        if self.latency_is_int and not is_int:
+            self.latency_is_int = False
+        latencies = self.latency_ms
+        if latencies.typecode == "q" and not (is_int and _INT64_MIN <= latency_ms <= _INT64_MAX):
+            # First float (or int beyond int64): the column switches to float64 once
+            latencies = self.latency_ms = array("d", latencies)
+        latencies.append(latency_ms)
+        self.latency_int.append(is_int)
+
+        self.final_action.append(self.final_actions.encode(final_action.get("action", "UNKNOWN")))
+        self.mdm_action.append(self.mdm_actions.encode(mdm.get("action")))
+        confidence = mdm.get("confidence")
+        if confidence is not None and not isinstance(confidence, (int, float)):
+            raise TypeError(f"confidence must be a number, got {type(confidence).__name__}")
+        self.confidence.append(math.nan if confidence is None else confidence)
+        self.allowed.append(1 if final_action.get("allowed", True) else 0)
+
+        self.mismatch_present.append(mismatch is not None)
+        self.mismatch_truthy.append(bool(mismatch))
+        flags = mismatch.get("flags", []) if mismatch is not None else []
+        self.has_flags.append(bool(flags))
+        for flag in flags or ():
+            self.flag_values.append(self.flags.encode(flag))
+        self.flag_offsets.append(len(self.flag_values))
+        if mismatch:
+            for code in mismatch.get("reason_codes", []):
+                self.reason_values.append(self.reason_codes.encode(code))
+        self.reason_offsets.append(len(self.reason_values))
+
+        self.fail_closed_marker.append(
+            external is not None
+            and any(
+                isinstance(key, str) and (key.endswith(".fail_closed") or key == "fail_closed")
+                for key in external
+            )
+        )
+        self.schema_version_ok.append(bool(schema_version))
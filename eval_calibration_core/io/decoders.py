@@ -0,0 +1,91 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""JSON decoding backends for JSONL traces (orjson -> msgspec -> stdlib json)."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+DECODER_BACKENDS = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True)
+class Decoder:
+    """
+    A JSON decoding backend.
+
+    decode() accepts one JSONL line as bytes. If the fast backend rejects a line,
+    it is re-decoded with stdlib json, so inputs stdlib accepts (NaN, Infinity,
+    integers beyond 64 bits) still decode, and invalid lines raise the same
+    json.JSONDecodeError for every backend.
+    """
+
+    name: str
+    loads: Callable[[bytes], Any]
+    errors: tuple[type[Exception], ...]
+
+    def decode(self, line: bytes) -> Any:
+        """
+        Decode one JSON document.
+
+        Raises:
+            json.JSONDecodeError: If the line is not valid JSON
+            UnicodeDecodeError: If the line is not valid UTF-8
+        """
+        try:
+            return self.loads(line)
+        except self.errors:
+            if self.name == "json":
+                raise
+            return json.loads(line)
+
+
+def get_decoder(backend: str = "auto") -> Decoder:
+    """
+    Resolve a decoder backend.
+
+    Args:
+        backend: "auto" (first installed of orjson, msgspec, json) or a backend name
+
+    Returns:
+        Decoder instance
+
+    Raises:
+        ValueError: If backend is unknown
+        ImportError: If an explicitly requested backend is not installed
+    """
+    if backend == "auto":
+        for name in DECODER_BACKENDS:
+            try:
+                return get_decoder(name)
+            except ImportError:
+                continue
+    if backend == "orjson":
+        import orjson
+
+        return Decoder("orjson", orjson.loads, (orjson.JSONDecodeError,))
+    if backend == "msgspec":
+        import msgspec
+
+        return Decoder("msgspec", msgspec.json.Decoder().decode, (msgspec.DecodeError,))
+    if backend == "json":
+        return Decoder("json", json.loads, (json.JSONDecodeError, UnicodeDecodeError))
+    raise ValueError(
+        f"Unknown decoder backend: {backend}. Available: {['auto', *DECODER_BACKENDS]}"
+    )
+
+
+def available_decoders() -> list[str]:
+    """Names of the decoder backends installed in this environment."""
+    names = []
+    for name in DECODER_BACKENDS:
+        try:
+            get_decoder(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
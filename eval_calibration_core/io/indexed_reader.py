@@ -0,0 +1,567 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Random-access JSONL reader: mmap + cached line-offset index, gzip/zstd frame index."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from collections.abc import Generator, Iterable, Iterator
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.io.columns import PacketColumns
+from eval_calibration_core.io.decoders import get_decoder
+from eval_calibration_core.io.records import record_builder
+
+COMPRESSIONS = ("gzip", "zstd")
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+
+_MAGIC = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+_HASH_SPAN = 1 << 16
+_CHUNK = 1 << 20
+# Compressed bytes per decompress() call when streaming (bounds each output chunk)
+_COMPRESSED_CHUNK = 1 << 16
+
+
+def detect_compression(path: Path | str) -> str | None:
+    """Return "gzip" or "zstd" from the file's magic bytes, None for plain files."""
+    with open(path, "rb") as f:
+        head = f.read(4)
+    for magic, name in _MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _decompressor(compression: str) -> Any:
+    """One-frame decompressor with decompress() / eof / unused_data."""
+    if compression == "gzip":
+        return zlib.decompressobj(wbits=31)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd traces require zstandard: pip install evaluation-calibration-core[zstd]"
+            ) from e
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise ValueError(f"Unknown compression: {compression}. Available: {list(COMPRESSIONS)}")
+
+
+def _decompressed_chunks(
+    path: Path | str,
+    compression: str,
+    start: int = 0,
+    position: int = 0,
+    frames: tuple[array, array] | None = None,
+) -> Generator[tuple[int, bytes], None, int]:
+    """
+    Stream the frames of a gzip/zstd file from a frame boundary on.
+
+    Args:
+        path: Compressed trace
+        compression: "gzip" or "zstd"
+        start: Compressed offset of the first frame to read
+        position: Uncompressed offset of that frame
+        frames: (compressed, uncompressed) start offset arrays each frame is appended to
+
+    Yields:
+        (uncompressed offset, bytes); returns the uncompressed end offset
+
+    Raises:
+        ValueError: If the last frame is truncated
+    """
+    consumed = start
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(_COMPRESSED_CHUNK)
+        decompressor = None
+        while data:
+            if decompressor is None:
+                decompressor = _decompressor(compression)
+                if frames is not None:
+                    frames[0].append(consumed)
+                    frames[1].append(position)
+            out = decompressor.decompress(data)
+            if out:
+                yield position, out
+                position += len(out)
+            if decompressor.eof:
+                unused = decompressor.unused_data
+                consumed += len(data) - len(unused)
+                decompressor = None
+                data = unused or f.read(_COMPRESSED_CHUNK)
+            else:
+                consumed += len(data)
+                data = f.read(_COMPRESSED_CHUNK)
+        if decompressor is not None:
+            raise ValueError(f"Truncated {compression} trace")
+    return position
+
+
+def _compress_frame(data: bytes, compression: str) -> bytes:
+    """Compress data as one independent gzip member / zstd frame."""
+    if compression == "gzip":
+        compressor = zlib.compressobj(wbits=31)
+        return compressor.compress(data) + compressor.flush()
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd traces require zstandard: pip install evaluation-calibration-core[zstd]"
+            ) from e
+        return zstandard.ZstdCompressor().compress(data)
+    raise ValueError(f"Unknown compression: {compression}. Available: {list(COMPRESSIONS)}")
+
+
+def compress_trace(
+    src: Path | str,
+    dst: Path | str,
+    compression: str = "gzip",
+    frame_size: int = _CHUNK,
+) -> int:
+    """
+    Compress a JSONL trace as a sequence of independent frames (seekable).
+
+    Each gzip member / zstd frame holds whole lines (about frame_size uncompressed
+    bytes), so IndexedPacketReader decompresses only the frame holding a packet.
+    The output is a regular .gz / .zst file for other tools.
+
+    Args:
+        src: Input JSONL path
+        dst: Output path
+        compression: "gzip" or "zstd"
+        frame_size: Target uncompressed bytes per frame
+
+    Returns:
+        Number of frames written
+    """
+    frames = 0
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        buffer: list[bytes] = []
+        buffered = 0
+        for line in fin:
+            buffer.append(line)
+            buffered += len(line)
+            if buffered >= frame_size:
+                fout.write(_compress_frame(b"".join(buffer), compression))
+                frames += 1
+                buffer, buffered = [], 0
+        if buffer or frames == 0:
+            fout.write(_compress_frame(b"".join(buffer), compression))
+            frames += 1
+    return frames
+
+
+class LineIndex:
+    """
+    Byte offsets of the non-empty lines of a JSONL trace.
+
+    Attributes:
+        offsets: Start offset of packet i (in the uncompressed stream)
+        line_numbers: 1-based file line of packet i; empty when the file has no
+            blank lines (then packet i is on line i + 1)
+        compression: None, "gzip" or "zstd"
+        frame_offsets: Compressed start offset of each frame
+        frame_starts: Uncompressed start offset of each frame
+        size: Uncompressed stream length
+    """
+
+    def __init__(self, compression: str | None = None) -> None:
+        """Initialize an empty index."""
+        self.offsets = array("Q")
+        self.line_numbers = array("Q")
+        self.compression = compression
+        self.frame_offsets = array("Q")
+        self.frame_starts = array("Q")
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def line_number(self, i: int) -> int:
+        """File line number of packet i."""
+        return self.line_numbers[i] if self.line_numbers else i + 1
+
+    @classmethod
+    def build(cls, path: Path | str) -> LineIndex:
+        """
+        Scan a trace once and record packet (and frame) offsets.
+
+        Args:
+            path: Plain, gzip or zstd JSONL file
+
+        Returns:
+            LineIndex
+        """
+        compression = detect_compression(path)
+        index = cls(compression)
+        if compression is None:
+            with open(path, "rb") as f:
+                index._scan(((0, line) for line in f), lines=True)
+        else:
+            index._scan(index._decompress_chunks(path), lines=False)
+        return index
+
+    def _decompress_chunks(self, path: Path | str) -> Iterator[tuple[int, bytes]]:
+        """Yield (uncompressed offset, bytes) while recording frame boundaries."""
+        frames = (self.frame_offsets, self.frame_starts)
+        self.size = yield from _decompressed_chunks(path, self.compression, frames=frames)
+
+    def _scan(self, chunks: Iterator[tuple[int, bytes]], lines: bool) -> None:
+        """Record offsets of non-empty lines from whole lines or arbitrary chunks."""
+        offsets = self.offsets
+        line_numbers = array("Q")
+        has_blank = False
+        line_num = 1
+        line_start = 0
+        content = False
+        position = 0
+        for base, chunk in chunks:
+            if lines:
+                # Plain files: chunk is one line (fast path, C-level line splitting)
+                if chunk.strip():
+                    offsets.append(position)
+                    line_numbers.append(line_num)
+                else:
+                    has_blank = True
+                position += len(chunk)
+                line_num += 1
+                continue
+            pos = 0
+            while True:
+                newline = chunk.find(b"\n", pos)
+                segment_end = len(chunk) if newline < 0 else newline
+                if not content and chunk[pos:segment_end].strip():
+                    content = True
+                if newline < 0:
+                    break
+                if content:
+                    offsets.append(line_start)
+                    line_numbers.append(line_num)
+                else:
+                    has_blank = True
+                line_num += 1
+                line_start = base + newline + 1
+                content = False
+                pos = newline + 1
+        if content:
+            offsets.append(line_start)
+            line_numbers.append(line_num)
+        if lines:
+            self.size = position
+        if has_blank:
+            self.line_numbers = line_numbers
+
+    def save(self, path: Path | str, key: dict[str, Any]) -> None:
+        """
+        Write the index atomically (temp file + os.replace).
+
+        Args:
+            path: Sidecar path
+            key: Source file key (see file_key())
+        """
+        header = {
+            "version": INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "key": key,
+            "compression": self.compression,
+            "size": self.size,
+            "packets": len(self.offsets),
+            "line_numbers": len(self.line_numbers),
+            "frames": len(self.frame_offsets),
+        }
+        tmp = Path(f"{path}.tmp{os.getpid()}")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                for column in (
+                    self.offsets,
+                    self.line_numbers,
+                    self.frame_offsets,
+                    self.frame_starts,
+                ):
+                    column.tofile(f)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path | str, key: dict[str, Any]) -> LineIndex | None:
+        """
+        Read a sidecar index if it matches the source file key.
+
+        Returns:
+            LineIndex, or None if missing, stale or unreadable
+        """
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                if (
+                    header.get("version") != INDEX_VERSION
+                    or header.get("byteorder") != sys.byteorder
+                    or header.get("key") != key
+                ):
+                    return None
+                index = cls(header["compression"])
+                index.size = header["size"]
+                index.offsets.fromfile(f, header["packets"])
+                index.line_numbers.fromfile(f, header["line_numbers"])
+                index.frame_offsets.fromfile(f, header["frames"])
+                index.frame_starts.fromfile(f, header["frames"])
+        except (OSError, EOFError, ValueError, KeyError, TypeError):
+            return None
+        return index
+
+
+def file_key(path: Path | str) -> dict[str, Any]:
+    """Cache key of a trace: size, mtime and a BLAKE2 hash of its first and last 64 KiB."""
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        digest.update(f.read(_HASH_SPAN))
+        if stat.st_size > _HASH_SPAN:
+            f.seek(max(_HASH_SPAN, stat.st_size - _HASH_SPAN))
+            digest.update(f.read(_HASH_SPAN))
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest.hexdigest()}
+
+
+class IndexedPacketReader:
+    """
+    Random-access PacketV2 reader over a JSONL trace (plain, gzip or zstd).
+
+    The line-offset index is built on first use and cached next to the trace in
+    `<trace>.idx`; it is rebuilt when the trace's size, mtime or head/tail hash
+    change. Plain files are memory-mapped. Compressed files are streamed from the
+    frame holding the first requested packet, so read() keeps memory constant;
+    single-packet access decompresses (and caches) only the frame(s) holding it
+    (write seekable traces with compress_trace; a single-member .gz is one frame).
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        decoder: str = "auto",
+        cache_index: bool = True,
+        fields: Iterable[str] | None = None,
+        compact: bool = False,
+    ):
+        """
+        Initialize reader and load or build the index.
+
+        Args:
+            path: Path to JSONL file (optionally .gz / .zst)
+            decoder: JSON backend (see PacketReader)
+            cache_index: Read/write the `.idx` sidecar (False: build in memory only)
+            fields: Optional projection into PacketRecord instances (see PacketReader)
+            compact: Yield compact PacketRecord instances (see PacketReader)
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Packet file not found: {self.path}")
+        self.decoder = get_decoder(decoder)
+        self.fields = None if fields is None else tuple(fields)
+        self._build = record_builder(self.fields, compact)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.index = self._load_index(cache_index)
+        self._frame: tuple[int, bytes] | None = None
+
+    def _load_index(self, cache_index: bool) -> LineIndex:
+        if not cache_index:
+            return LineIndex.build(self.path)
+        key = file_key(self.path)
+        index = LineIndex.load(self.index_path, key)
+        if index is None:
+            index = LineIndex.build(self.path)
+            try:
+                index.save(self.index_path, key)
+            except OSError:
+                pass  # Read-only location: keep the in-memory index
+        return index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, i: int) -> PacketV2:
+        """Packet i (negative indices count from the end)."""
+        n = len(self.index)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f"packet index out of range: {i}")
+        return next(self.read_slice(i, i + 1))
+
+    def read(self) -> Iterator[PacketV2]:
+        """
+        Read all packets in order.
+
+        Yields:
+            PacketV2 instances
+
+        Raises:
+            ValueError: If packet format is invalid
+        """
+        return self.read_slice(0, len(self.index))
+
+    def read_all(self) -> list[PacketV2]:
+        """
+        Read all packets into a list.
+
+        Returns:
+            List of PacketV2 instances
+        """
+        return list(self.read())
+
+    def read_slice(self, start: int, stop: int) -> Iterator[PacketV2]:
+        """
+        Read packets [start, stop) by seeking straight to packet start.
+
+        Yields:
+            PacketV2 instances
+
+        Raises:
+            ValueError: If packet format is invalid (with the line number in the file)
+        """
+        for i, line in self._lines(start, stop):
+            yield self._decode(line, i)
+
+    def read_columns(self) -> PacketColumns:
+        """
+        Read the trace straight into dictionary-encoded columns (see PacketReader.read_columns).
+
+        Returns:
+            PacketColumns with one row per packet
+
+        Raises:
+            ValueError: If a line is not valid JSON or lacks PacketV2 fields
+        """
+        columns = PacketColumns()
+        decode = self.decoder.decode
+        for i, line in self._lines(0, len(self.index)):
+            try:
+                columns.append_dict(decode(line.strip()))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                line_num = self.index.line_number(i)
+                raise ValueError(f"Invalid packet at line {line_num}: {e}") from e
+        return columns
+
+    def _lines(self, start: int, stop: int) -> Iterator[tuple[int, bytes]]:
+        """(packet index, raw line) for packets [start, stop)."""
+        stop = min(stop, len(self.index))
+        if start >= stop:
+            return
+        if self.index.compression is None:
+            with (
+                open(self.path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                for i in range(start, stop):
+                    offset = self.index.offsets[i]
+                    end = mm.find(b"\n", offset)
+                    yield i, mm[offset : end if end >= 0 else len(mm)]
+        elif stop - start == 1:
+            yield start, self._compressed_line(start)
+        else:
+            yield from self._streamed_lines(start, stop)
+
+    def _streamed_lines(self, start: int, stop: int) -> Iterator[tuple[int, bytes]]:
+        """(packet index, raw line) for packets [start, stop) of a compressed trace."""
+        index = self.index
+        offsets = index.offsets
+        frame = bisect_right(index.frame_starts, offsets[start]) - 1
+        chunks = _decompressed_chunks(
+            self.path, index.compression, index.frame_offsets[frame], index.frame_starts[frame]
+        )
+        i = start
+        buffer = b""
+        base = index.frame_starts[frame]  # uncompressed offset of buffer[0]
+        for position, chunk in chunks:
+            # Keep only the partial line of the next packet, then add the new bytes
+            keep = min(max(offsets[i] - base, 0), len(buffer))
+            buffer = buffer[keep:] + chunk
+            base = position - (len(buffer) - len(chunk))
+            while i < stop:
+                line_start = offsets[i] - base
+                end = buffer.find(b"\n", line_start)
+                if line_start >= len(buffer) or end < 0:
+                    break
+                yield i, buffer[line_start:end]
+                i += 1
+            if i == stop:
+                chunks.close()
+                return
+        if i < stop:
+            # Last line without a trailing newline
+            yield i, buffer[offsets[i] - base :]
+
+    def shards(self, count: int) -> list[tuple[int, int]]:
+        """
+        Split the packets into contiguous [start, stop) index ranges of near-equal size.
+
+        Args:
+            count: Desired number of shards (fewer are returned for small traces)
+
+        Returns:
+            Ordered, non-empty (start, stop) packet index ranges covering the trace
+        """
+        n = len(self.index)
+        count = max(1, min(count, n))
+        bounds = [n * i // count for i in range(count + 1)]
+        return [(start, stop) for start, stop in pairwise(bounds) if stop > start]
+
+    def _decode(self, line: bytes, i: int) -> PacketV2:
+        try:
+            return self._build(self.decoder.decode(line.strip()))
+        except (ValueError, KeyError) as e:
+            raise ValueError(f"Invalid packet at line {self.index.line_number(i)}: {e}") from e
+
+    def _compressed_line(self, i: int) -> bytes:
+        """Line of packet i, decompressing the frame(s) it spans."""
+        index = self.index
+        offset = index.offsets[i]
+        frame = bisect_right(index.frame_starts, offset) - 1
+        data = self._frame_data(frame)
+        start = offset - index.frame_starts[frame]
+        parts = []
+        while True:
+            end = data.find(b"\n", start)
+            if end >= 0:
+                parts.append(data[start:end])
+                break
+            parts.append(data[start:])
+            frame += 1
+            if frame >= len(index.frame_starts):
+                break
+            data = self._frame_data(frame)
+            start = 0
+        return b"".join(parts)
+
+    def _frame_data(self, frame: int) -> bytes:
+        """Decompressed bytes of one frame (the most recent frame is cached)."""
+        if self._frame is not None and self._frame[0] == frame:
+            return self._frame[1]
+        index = self.index
+        start = index.frame_offsets[frame]
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            if frame + 1 < len(index.frame_offsets):
+                compressed = f.read(index.frame_offsets[frame + 1] - start)
+            else:
+                compressed = f.read()
+        data = _decompressor(index.compression).decompress(compressed)
+        self._frame = (frame, data)
+        return data
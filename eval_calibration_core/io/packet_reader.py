@@ -3,25 +3,52 @@
 # SPDX-License-Identifier: MIT
 """Read PacketV2 from JSONL files."""
 
+import time
+from collections.abc import Iterable, Iterator
+from itertools import pairwise
 from pathlib import Path
-from typing import Iterator
+from typing import Any
 
 from decision_schema.packet_v2 import PacketV2
 
+from eval_calibration_core.io.columns import PacketColumns
+from eval_calibration_core.io.decoders import get_decoder
+from eval_calibration_core.io.records import record_builder
+from eval_calibration_core.profiling import NULL_PROFILER
+
 
 class PacketReader:
     """Read PacketV2 packets from JSONL file."""
 
-    def __init__(self, path: Path | str):
+    def __init__(
+        self,
+        path: Path | str,
+        decoder: str = "auto",
+        profiler: Any = None,
+        fields: Iterable[str] | None = None,
+        compact: bool = False,
+    ):
         """
         Initialize reader.
 
         Args:
             path: Path to JSONL file containing PacketV2 dicts
+            decoder: JSON backend: "auto" (orjson, then msgspec, then stdlib json),
+                "orjson", "msgspec" or "json"
+            profiler: Optional Profiler; read() then records "read.parse_json" and
+                "read.from_dict" time
+            fields: Optional projection (e.g. Registry.fields()): yield PacketRecord
+                instances holding only these fields instead of validated PacketV2
+            compact: Yield PacketRecord instances sharing equal values between packets
+                (interned strings, read-only dicts, tuples for lists; see io/records.py)
         """
         self.path = Path(path)
         if not self.path.exists():
             raise FileNotFoundError(f"Packet file not found: {self.path}")
+        self.decoder = get_decoder(decoder)
+        self.profiler = profiler or NULL_PROFILER
+        self.fields = None if fields is None else tuple(fields)
+        self._build = record_builder(self.fields, compact)
 
     def read(self) -> Iterator[PacketV2]:
         """
@@ -33,19 +60,151 @@ class PacketReader:
         Raises:
             ValueError: If packet format is invalid
         """
-        import json
-
-        with open(self.path, "r", encoding="utf-8") as f:
+        if self.profiler.enabled:
+            yield from self._read_profiled()
+            return
+        with open(self.path, "rb") as f:
             for line_num, line in enumerate(f, start=1):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    data = json.loads(line)
-                    packet = PacketV2.from_dict(data)
+                    packet = self._decode(line)
+                except (ValueError, KeyError) as e:
+                    # json.JSONDecodeError and UnicodeDecodeError are ValueErrors
+                    raise ValueError(f"Invalid packet at line {line_num}: {e}") from e
+                yield packet
+
+    def _read_profiled(self) -> Iterator[PacketV2]:
+        """read() with JSON parsing and packet construction timed separately."""
+        clock, cpu_clock = time.perf_counter, time.process_time
+        parse_wall = parse_cpu = build_wall = build_cpu = 0.0
+        count = 0
+        try:
+            with open(self.path, "rb") as f:
+                for line_num, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    t0, c0 = clock(), cpu_clock()
+                    try:
+                        data = self.decoder.decode(line)
+                        t1, c1 = clock(), cpu_clock()
+                        packet = self._build(data)
+                    except (ValueError, KeyError) as e:
+                        raise ValueError(f"Invalid packet at line {line_num}: {e}") from e
+                    t2, c2 = clock(), cpu_clock()
+                    parse_wall += t1 - t0
+                    parse_cpu += c1 - c0
+                    build_wall += t2 - t1
+                    build_cpu += c2 - c1
+                    count += 1
                     yield packet
-                except (json.JSONDecodeError, ValueError, KeyError) as e:
+        finally:
+            self.profiler.add("read.parse_json", parse_wall, parse_cpu, count)
+            self.profiler.add("read.from_dict", build_wall, build_cpu, count)
+
+    def read_columns(self) -> PacketColumns:
+        """
+        Read the file straight into a columnar store, without creating PacketV2 instances.
+
+        Decoded dicts are appended field by field (PacketColumns.append_dict), so
+        PacketV2 validation is skipped; missing required fields still fail.
+
+        Returns:
+            PacketColumns with one row per packet
+
+        Raises:
+            ValueError: If a line is not valid JSON or lacks PacketV2 fields
+        """
+        columns = PacketColumns()
+        with open(self.path, "rb") as f:
+            for line_num, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    columns.append_dict(self.decoder.decode(line))
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
                     raise ValueError(f"Invalid packet at line {line_num}: {e}") from e
+        return columns
+
+    def shards(self, count: int) -> list[tuple[int, int]]:
+        """
+        Split the file into byte ranges that start and end at line boundaries.
+
+        Args:
+            count: Desired number of shards (fewer are returned for small files)
+
+        Returns:
+            Ordered, non-empty, contiguous (start, end) byte ranges covering the file
+        """
+        size = self.path.stat().st_size
+        count = max(1, min(count, size))
+        bounds = [0]
+        with open(self.path, "rb") as f:
+            for i in range(1, count):
+                target = size * i // count
+                if target <= bounds[-1]:
+                    continue
+                # Byte target-1 belongs to the previous shard; skip to the next line start
+                f.seek(target - 1)
+                f.readline()
+                offset = f.tell()
+                if bounds[-1] < offset < size:
+                    bounds.append(offset)
+        bounds.append(size)
+        return [(start, end) for start, end in pairwise(bounds) if end > start]
+
+    def read_range(self, start: int, end: int) -> Iterator[PacketV2]:
+        """
+        Read packets from lines starting in the byte range [start, end).
+
+        start must be a line boundary (see shards()). Error messages report the
+        line number within the whole file.
+
+        Yields:
+            PacketV2 instances
+
+        Raises:
+            ValueError: If packet format is invalid
+        """
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            local_line = 0
+            while offset < end:
+                line = f.readline()
+                if not line:
+                    break
+                offset += len(line)
+                local_line += 1
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    packet = self._decode(line)
+                except (ValueError, KeyError) as e:
+                    line_num = self._count_lines(start) + local_line
+                    raise ValueError(f"Invalid packet at line {line_num}: {e}") from e
+                yield packet
+
+    def _decode(self, line: bytes) -> PacketV2:
+        """Decode one non-empty JSONL line into a PacketV2 (or PacketRecord)."""
+        return self._build(self.decoder.decode(line))
+
+    def _count_lines(self, end: int) -> int:
+        """Count newlines in the first `end` bytes (used only to report errors)."""
+        count = 0
+        with open(self.path, "rb") as f:
+            remaining = end
+            while remaining > 0:
+                chunk = f.read(min(remaining, 1 << 20))
+                if not chunk:
+                    break
+                count += chunk.count(b"\n")
+                remaining -= len(chunk)
+        return count
 
     def read_all(self) -> list[PacketV2]:
         """
@@ -0,0 +1,46 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Pick the packet reader for a trace file by format."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from eval_calibration_core.io.arrow_reader import (
+    ARROW_SUFFIXES,
+    PARQUET_SUFFIXES,
+    ArrowPacketReader,
+)
+from eval_calibration_core.io.indexed_reader import IndexedPacketReader, detect_compression
+from eval_calibration_core.io.packet_reader import PacketReader
+
+
+def open_packet_reader(
+    path: Path | str,
+    decoder: str = "auto",
+    fields: Iterable[str] | None = None,
+    compact: bool = False,
+) -> Any:
+    """
+    Reader for any supported trace format; every reader has read() and read_all().
+
+    Args:
+        path: JSONL (optionally .gz / .zst), Arrow IPC or Parquet trace
+        decoder: JSON decoder backend for JSONL traces (see io/decoders.py)
+        fields: Optional projection into PacketRecord instances (see PacketReader)
+        compact: Yield compact PacketRecord instances (see PacketReader)
+
+    Returns:
+        ArrowPacketReader, IndexedPacketReader (gzip/zstd) or PacketReader
+
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    if Path(path).suffix.lower() in (*ARROW_SUFFIXES, *PARQUET_SUFFIXES):
+        return ArrowPacketReader(path, fields=fields, compact=compact)
+    if Path(path).exists() and detect_compression(path) is not None:
+        return IndexedPacketReader(path, decoder=decoder, fields=fields, compact=compact)
+    return PacketReader(path, decoder=decoder, fields=fields, compact=compact)
@@ -0,0 +1,235 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Projected and compact packet records: slotted stand-ins for PacketV2."""
+
+from __future__ import annotations
+
+import inspect
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.registry import PACKET_FIELDS
+
+PacketBuilder = Callable[[dict[str, Any]], Any]
+
+
+def _schema_version_default() -> Any:
+    """PacketV2's default schema_version (used when a line omits it)."""
+    try:
+        default = inspect.signature(PacketV2).parameters["schema_version"].default
+    except (KeyError, TypeError, ValueError):
+        return None
+    return None if default is inspect.Parameter.empty else default
+
+
+# Fields PacketV2.from_dict fills in when a line omits them
+OPTIONAL_DEFAULTS: dict[str, Any] = {
+    "mismatch": None,
+    "schema_version": _schema_version_default(),
+}
+
+
+# Distinct values an Interner shares (later new values are stored unshared)
+MAX_INTERNED = 1 << 16
+
+# Fields a compact builder interns; input is per-packet payload and kept as decoded
+INTERNED_FIELDS = ("run_id", "external", "mdm", "final_action", "latency_ms", "mismatch")
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict shared between compact records.
+
+    It is a real dict, so .get(), iteration and isinstance(value, dict) behave
+    as for the decoded value; mutating methods raise TypeError.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Compact packet values are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+class Interner:
+    """
+    Share equal packet values between records.
+
+    Strings are interned with sys.intern, lists become tuples and dicts become
+    FrozenDict. Equal dicts (same items in the same order), tuples and numbers
+    map to one shared object. Only the first max_size distinct values are kept
+    in the table, so high-cardinality values cannot grow it without bound.
+    """
+
+    def __init__(self, max_size: int = MAX_INTERNED) -> None:
+        """
+        Initialize.
+
+        Args:
+            max_size: Distinct values kept in the sharing table
+        """
+        self.max_size = max_size
+        self._table: dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def freeze(self, value: Any) -> Any:
+        """
+        Shared, read-only equivalent of a decoded JSON value.
+
+        Returns:
+            The value itself for None, bools and other immutables, an interned
+            str, a tuple for a list or a FrozenDict for a dict
+        """
+        if isinstance(value, str):
+            return sys.intern(value)
+        if isinstance(value, dict):
+            frozen = FrozenDict((self.freeze(k), self.freeze(v)) for k, v in value.items())
+            key: Any = (dict, tuple((k, _item_key(v)) for k, v in frozen.items()))
+        elif isinstance(value, list):
+            frozen = tuple(self.freeze(item) for item in value)
+            key = (tuple, tuple(_item_key(item) for item in frozen))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            frozen = value
+            key = _scalar_key(value)
+        else:
+            return value
+        try:
+            shared = self._table.get(key)
+        except TypeError:  # unhashable leftovers (e.g. sets from a custom decoder)
+            return frozen
+        if shared is not None:
+            return shared
+        if len(self._table) < self.max_size:
+            self._table[key] = frozen
+        return frozen
+
+
+def _item_key(value: Any) -> Any:
+    """
+    Sharing-table key of a frozen element.
+
+    Containers are keyed by identity (equal nested values are already one shared
+    object, and the table entry keeps them alive); scalars as in _scalar_key.
+    """
+    if isinstance(value, (dict, tuple)):
+        return (type(value), id(value))
+    return _scalar_key(value)
+
+
+def _scalar_key(value: Any) -> Any:
+    """
+    Sharing-table key of a scalar: type and value, so True, 1 and 1.0 stay distinct.
+
+    Floats are keyed by repr: NaN never equals itself, so every NaN would miss
+    the table and take a new entry, and -0.0 would be shared as 0.0.
+    """
+    if isinstance(value, float):
+        return (float, repr(value))
+    return (type(value), value)
+
+
+def _thaw(value: Any) -> Any:
+    """Plain JSON equivalent of a frozen value (dicts and lists again)."""
+    if isinstance(value, dict):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class PacketRecord:
+    """
+    Packet with PacketV2's attribute names but only the projected fields set.
+
+    Records skip PacketV2 validation and allocate one slotted object per packet.
+    A field outside the projection is not set, so reading it raises
+    AttributeError (and hasattr() is False) instead of returning a wrong default.
+    Compact records (record_builder(compact=True)) hold shared read-only values
+    (see Interner).
+    """
+
+    __slots__ = PACKET_FIELDS
+
+    def to_dict(self) -> dict[str, Any]:
+        """Projected fields as a dict (PacketV2.to_dict() key names, plain dicts and lists)."""
+        return {name: _thaw(getattr(self, name)) for name in PACKET_FIELDS if hasattr(self, name)}
+
+    def to_packet(self) -> PacketV2:
+        """
+        Equivalent PacketV2 (validated, with its own mutable dicts).
+
+        Raises:
+            KeyError: If the record lacks a required PacketV2 field (a projection)
+        """
+        return PacketV2.from_dict(self.to_dict())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"PacketRecord({fields})"
+
+
+def record_builder(fields: Iterable[str] | None = None, compact: bool = False) -> PacketBuilder:
+    """
+    Dict -> packet constructor for a field projection.
+
+    Args:
+        fields: PacketV2 fields to keep (e.g. Registry.fields()); None builds full
+            PacketV2 instances (or records of every field when compact)
+        compact: Build PacketRecord instances whose INTERNED_FIELDS values are
+            shared between packets through one Interner per builder
+
+    Returns:
+        PacketV2.from_dict, or a function building PacketRecord instances that
+        raises KeyError for a missing required field
+
+    Raises:
+        ValueError: If a field is not a PacketV2 field
+    """
+    if fields is None:
+        if not compact:
+            return PacketV2.from_dict
+        fields = PACKET_FIELDS
+    fields = tuple(dict.fromkeys(fields))
+    unknown = [name for name in fields if name not in PACKET_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown packet fields: {unknown}. Available: {list(PACKET_FIELDS)}")
+    required = tuple(name for name in fields if name not in OPTIONAL_DEFAULTS)
+    optional = tuple(
+        (name, OPTIONAL_DEFAULTS[name]) for name in fields if name in OPTIONAL_DEFAULTS
+    )
+    new = PacketRecord.__new__
+
+    if compact:
+        freeze = Interner().freeze
+        required = tuple((name, name in INTERNED_FIELDS) for name in required)
+        optional = tuple((name, default, name in INTERNED_FIELDS) for name, default in optional)
+
+        def build_compact(data: dict[str, Any]) -> PacketRecord:
+            record = new(PacketRecord)
+            for name, interned in required:
+                value = data[name]
+                setattr(record, name, freeze(value) if interned else value)
+            for name, default, interned in optional:
+                value = data.get(name, default)
+                setattr(record, name, freeze(value) if interned else value)
+            return record
+
+        return build_compact
+
+    def build(data: dict[str, Any]) -> PacketRecord:
+        record = new(PacketRecord)
+        for name in required:
+            setattr(record, name, data[name])
+        for name, default in optional:
+            setattr(record, name, data.get(name, default))
+        return record
+
+    return build
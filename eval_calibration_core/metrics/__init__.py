@@ -3,7 +3,16 @@
 # SPDX-License-Identifier: MIT
 """Metrics computation."""
 
-from eval_calibration_core.metrics.compute import compute_metrics
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
+from eval_calibration_core.metrics.compute import compute_metrics, compute_metrics_columns
 from eval_calibration_core.metrics.definitions import MetricDefinitions
+from eval_calibration_core.metrics.windows import WindowedMetrics, WindowSpec
 
-__all__ = ["compute_metrics", "MetricDefinitions"]
+__all__ = [
+    "MetricDefinitions",
+    "MetricsAccumulator",
+    "WindowSpec",
+    "WindowedMetrics",
+    "compute_metrics",
+    "compute_metrics_columns",
+]
@@ -0,0 +1,180 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Single-pass, mergeable metrics accumulator."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from eval_calibration_core.metrics.quantiles import (
+    DEFAULT_PERCENTILES,
+    make_quantile_estimator,
+    quantile_estimator_from_state,
+)
+
+
+class MetricsAccumulator:
+    """
+    Accumulate all canonical metrics in one pass over PacketV2 packets.
+
+    Implements the formulas of MetricDefinitions incrementally: feed packets with
+    update(), combine partial states (e.g. from shards) with merge(), and call
+    finalize() to get the same dict compute_metrics() returns.
+
+    Latencies go into a mergeable quantile estimator (see metrics/quantiles.py). The
+    default exact backend keeps value -> count, so nearest-rank percentiles need
+    O(distinct latencies) memory instead of O(packets). That is small for integer
+    millisecond latencies but grows with the trace for float latencies, where
+    nearly every value is distinct; "ddsketch" bounds memory regardless of the
+    value distribution at a configurable relative error.
+
+    Plugin metrics (see registry.py) are updated, merged and finalized along
+    with the built-in ones and reported under their own keys.
+    """
+
+    def __init__(
+        self,
+        latency_backend: str | None = None,
+        relative_accuracy: float = 0.01,
+        percentiles: Sequence[float | str] | None = None,
+        plugins: Mapping[str, type] | None = None,
+    ) -> None:
+        """
+        Initialize empty state.
+
+        Args:
+            latency_backend: "exact" or "ddsketch". None means exact without the
+                latency_estimator metadata block (canonical INVARIANT 5 key set).
+            relative_accuracy: Relative error bound for "ddsketch"
+            percentiles: Percentiles to report (default p50, p95, p99; "max" allowed)
+            plugins: Metric name -> plugin accumulator class (Registry.metric_classes())
+        """
+        self.latency_backend = latency_backend
+        self.percentiles = tuple(percentiles) if percentiles else DEFAULT_PERCENTILES
+        self.total_steps = 0
+        self.action_counts: dict[str, int] = {}
+        self.trigger_counts: dict[str, int] = {}
+        self.safety_passed = 0
+        self.latency = make_quantile_estimator(latency_backend or "exact", relative_accuracy)
+        self.plugins = {name: plugin() for name, plugin in (plugins or {}).items()}
+
+    def update(self, packet: Any) -> None:
+        """
+        Add one packet to the state.
+
+        Args:
+            packet: PacketV2 packet
+        """
+        self.total_steps += 1
+
+        action = packet.final_action.get("action", "UNKNOWN")
+        self.action_counts[action] = self.action_counts.get(action, 0) + 1
+
+        mismatch = packet.mismatch
+        if mismatch:
+            for code in mismatch.get("reason_codes", []):
+                self.trigger_counts[code] = self.trigger_counts.get(code, 0) + 1
+
+        # Safety invariant: allowed implies no deny flags, denied implies mismatch
+        if packet.final_action.get("allowed", True):
+            if mismatch is None or not mismatch.get("flags", []):
+                self.safety_passed += 1
+        elif mismatch is not None:
+            self.safety_passed += 1
+
+        if hasattr(packet, "latency_ms"):
+            self.latency.add(packet.latency_ms)
+
+        for plugin in self.plugins.values():
+            plugin.update(packet)
+
+    def merge(self, other: MetricsAccumulator) -> MetricsAccumulator:
+        """
+        Merge another accumulator into this one.
+
+        The result equals accumulating this state's packets followed by other's
+        packets (key order of the distributions is preserved).
+
+        Args:
+            other: Accumulator over the packets that follow this one's
+
+        Returns:
+            self
+        """
+        self.total_steps += other.total_steps
+        for action, count in other.action_counts.items():
+            self.action_counts[action] = self.action_counts.get(action, 0) + count
+        for code, count in other.trigger_counts.items():
+            self.trigger_counts[code] = self.trigger_counts.get(code, 0) + count
+        self.safety_passed += other.safety_passed
+        self.latency.merge(other.latency)
+        for name, plugin in self.plugins.items():
+            plugin.merge(other.plugins[name])
+        return self
+
+    def to_state(self) -> dict[str, Any]:
+        """
+        JSON-serializable state, restorable with from_state().
+
+        Distributions are stored as [key, count] pairs so key types and
+        first-seen order survive the round trip. Plugin metrics must implement
+        to_state() / from_state() to be persisted.
+        """
+        state = {
+            "latency_backend": self.latency_backend,
+            "percentiles": list(self.percentiles),
+            "total_steps": self.total_steps,
+            "action_counts": [[a, c] for a, c in self.action_counts.items()],
+            "trigger_counts": [[code, c] for code, c in self.trigger_counts.items()],
+            "safety_passed": self.safety_passed,
+            "latency": self.latency.to_state(),
+        }
+        if self.plugins:
+            state["plugins"] = {name: plugin.to_state() for name, plugin in self.plugins.items()}
+        return state
+
+    @classmethod
+    def from_state(
+        cls, state: dict[str, Any], plugins: Mapping[str, type] | None = None
+    ) -> MetricsAccumulator:
+        """Restore an accumulator saved with to_state() (plugins: as passed to __init__)."""
+        accumulator = cls(state["latency_backend"], percentiles=state["percentiles"])
+        accumulator.total_steps = state["total_steps"]
+        accumulator.action_counts = {a: c for a, c in state["action_counts"]}
+        accumulator.trigger_counts = {code: c for code, c in state["trigger_counts"]}
+        accumulator.safety_passed = state["safety_passed"]
+        accumulator.latency = quantile_estimator_from_state(state["latency"])
+        plugin_states = state.get("plugins", {})
+        accumulator.plugins = {
+            name: plugin.from_state(plugin_states[name]) for name, plugin in (plugins or {}).items()
+        }
+        return accumulator
+
+    def finalize(self) -> dict[str, Any]:
+        """
+        Produce the metrics dict.
+
+        Returns:
+            Dict containing all computed metrics (same keys as compute_metrics)
+        """
+        total = self.total_steps
+        metrics = {
+            "action_distribution": dict(self.action_counts),
+            "guard_trigger_rates": {
+                code: count / total for code, count in self.trigger_counts.items()
+            },
+            "safety_invariant_pass_rate": self.safety_passed / total if total > 0 else 1.0,
+            "latency_percentiles": self.latency.quantiles(self.percentiles),
+            "total_steps": total,
+        }
+        if self.latency_backend is not None:
+            metrics["latency_estimator"] = {
+                "backend": self.latency.backend,
+                "relative_accuracy": self.latency.relative_accuracy,
+                "samples": self.latency.count,
+            }
+        for name, plugin in self.plugins.items():
+            metrics[name] = plugin.finalize()
+        return metrics
@@ -3,36 +3,63 @@
 # SPDX-License-Identifier: MIT
 """Compute metrics from PacketV2 traces."""
 
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from decision_schema.packet_v2 import PacketV2
 
+from eval_calibration_core.io.columns import PacketColumns
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
 from eval_calibration_core.metrics.definitions import MetricDefinitions
+from eval_calibration_core.metrics.quantiles import DEFAULT_PERCENTILES
 
 
-def compute_metrics(packets: list[PacketV2]) -> dict[str, Any]:
+def compute_metrics(
+    packets: Iterable[PacketV2],
+    latency_backend: str | None = None,
+    relative_accuracy: float = 0.01,
+    percentiles: Sequence[float | str] | None = None,
+) -> dict[str, Any]:
     """
-    Compute all metrics from packets.
+    Compute all metrics from packets in a single pass.
 
     Args:
-        packets: List of PacketV2 packets
+        packets: Iterable of PacketV2 packets
+        latency_backend: Quantile backend ("exact" or "ddsketch"); when set, a
+            latency_estimator block records the backend and its error bound
+        relative_accuracy: Relative error bound for "ddsketch"
+        percentiles: Latency percentiles to report (default p50, p95, p99)
 
     Returns:
         Dict containing all computed metrics
     """
-    if not packets:
-        return {
-            "action_distribution": {},
-            "guard_trigger_rates": {},
-            "safety_invariant_pass_rate": 1.0,
-            "latency_percentiles": {"p50": 0.0, "p95": 0.0, "p99": 0.0},
-            "total_steps": 0,
-        }
+    accumulator = MetricsAccumulator(latency_backend, relative_accuracy, percentiles)
+    for packet in packets:
+        accumulator.update(packet)
+    return accumulator.finalize()
 
+
+def compute_metrics_columns(
+    columns: PacketColumns, percentiles: Sequence[float | str] | None = None
+) -> dict[str, Any]:
+    """
+    Compute all metrics from a columnar packet store with vectorized kernels.
+
+    Output is identical to compute_metrics over the same packets (exact backend).
+
+    Args:
+        columns: PacketColumns (e.g. from PacketReader.read_columns())
+        percentiles: Latency percentiles to report (default p50, p95, p99)
+
+    Returns:
+        Dict containing all computed metrics
+    """
     return {
-        "action_distribution": MetricDefinitions.action_distribution(packets),
-        "guard_trigger_rates": MetricDefinitions.guard_trigger_rate(packets),
-        "safety_invariant_pass_rate": MetricDefinitions.safety_invariant_pass_rate(packets),
-        "latency_percentiles": MetricDefinitions.latency_percentiles(packets),
-        "total_steps": len(packets),
+        "action_distribution": MetricDefinitions.action_distribution_columns(columns),
+        "guard_trigger_rates": MetricDefinitions.guard_trigger_rate_columns(columns),
+        "safety_invariant_pass_rate": MetricDefinitions.safety_invariant_pass_rate_columns(columns),
+        "latency_percentiles": MetricDefinitions.latency_percentiles_columns(
+            columns, percentiles or DEFAULT_PERCENTILES
+        ),
+        "total_steps": len(columns),
     }
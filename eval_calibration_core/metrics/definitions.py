@@ -3,9 +3,13 @@
 # SPDX-License-Identifier: MIT
 """Metric definitions and mathematical formulas."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+from eval_calibration_core.metrics import vectorized
+from eval_calibration_core.metrics.quantiles import percentile_key
+
 
 @dataclass
 class MetricDefinitions:
@@ -138,3 +142,51 @@ class MetricDefinitions:
             "p95": percentile(95),
             "p99": percentile(99),
         }
+
+    # Vectorized implementations over PacketColumns (same formulas and output)
+
+    @staticmethod
+    def action_distribution_columns(columns: Any) -> dict[str, int]:
+        """action_distribution over PacketColumns: bincount of interned final actions."""
+        vocab = columns.final_actions.values
+        counts = vectorized.bincount(columns.final_action, len(vocab))
+        return dict(zip(vocab, counts))
+
+    @staticmethod
+    def guard_trigger_rate_columns(columns: Any) -> dict[str, float]:
+        """guard_trigger_rate over PacketColumns: bincount of CSR reason codes / total_steps."""
+        total_steps = len(columns)
+        if total_steps == 0:
+            return {}
+        vocab = columns.reason_codes.values
+        counts = vectorized.bincount(columns.reason_values, len(vocab))
+        return {code: count / total_steps for code, count in zip(vocab, counts)}
+
+    @staticmethod
+    def safety_invariant_pass_rate_columns(columns: Any) -> float:
+        """safety_invariant_pass_rate over PacketColumns."""
+        total = len(columns)
+        if total == 0:
+            return 1.0
+        passed = vectorized.count_safety_passed(
+            columns.allowed, columns.has_flags, columns.mismatch_present
+        )
+        return passed / total
+
+    @staticmethod
+    def latency_percentiles_columns(
+        columns: Any, percentiles: Sequence[float | str] = (50, 95, 99)
+    ) -> dict[str, float]:
+        """latency_percentiles over PacketColumns (nearest-rank via numpy.partition)."""
+        keys = [percentile_key(p) for p in percentiles]
+        if len(columns) == 0:
+            return {key: 0.0 for key in keys}
+        values = vectorized.nearest_rank(columns.latency_ms, percentiles)
+        if columns.latency_is_int:
+            return {key: int(v) for key, v in zip(keys, values)}
+        # The object path types a value like the first packet that had it (3 vs 3.0)
+        rows = vectorized.first_rows(columns.latency_ms, values)
+        return {
+            key: int(v) if columns.latency_int[rows[v]] else float(v)
+            for key, v in zip(keys, values)
+        }
@@ -0,0 +1,338 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Mergeable quantile estimators for latency percentiles."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+QUANTILE_BACKENDS = ("exact", "ddsketch")
+DEFAULT_PERCENTILES: tuple[float, ...] = (50, 95, 99)
+
+
+def percentile_key(p: float | str) -> str:
+    """
+    Report key for a percentile: 50 -> "p50", 99.9 -> "p99.9", "max"/100 -> "max".
+
+    Args:
+        p: Percentile in [0, 100] or "max"
+
+    Returns:
+        Key used in the latency_percentiles dict
+    """
+    if p == "max" or float(p) >= 100.0:
+        return "max"
+    return f"p{float(p):g}"
+
+
+def parse_percentiles(spec: str) -> list[float | str]:
+    """
+    Parse a comma-separated percentile list (e.g. "50,90,99.9,max").
+
+    Raises:
+        ValueError: If an entry is not a number in [0, 100] or "max", or two
+            entries share a report key (e.g. "100,max" or "50,p50")
+    """
+    result: list[float | str] = []
+    seen: dict[str, str] = {}
+    for item in spec.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        if item == "max":
+            value: float | str = "max"
+        else:
+            value = float(item.lstrip("p"))
+            if not 0.0 <= value <= 100.0:
+                raise ValueError(f"Percentile out of range [0, 100]: {item}")
+        key = percentile_key(value)
+        if key in seen:
+            raise ValueError(f"Duplicate percentile {item} (same key {key!r} as {seen[key]})")
+        seen[key] = item
+        result.append(value)
+    return result
+
+
+def make_quantile_estimator(
+    backend: str = "exact", relative_accuracy: float = 0.01
+) -> ExactQuantiles | DDSketch:
+    """
+    Create an empty quantile estimator.
+
+    Args:
+        backend: "exact" (nearest-rank over a value histogram) or "ddsketch"
+        relative_accuracy: Relative error bound for "ddsketch" (ignored for "exact")
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    if backend == "exact":
+        return ExactQuantiles()
+    if backend == "ddsketch":
+        return DDSketch(relative_accuracy)
+    raise ValueError(f"Unknown quantile backend: {backend}. Available: {list(QUANTILE_BACKENDS)}")
+
+
+class ExactQuantiles:
+    """
+    Exact nearest-rank quantiles over a value -> count histogram.
+
+    Memory is O(distinct values); merging adds counts.
+    """
+
+    backend = "exact"
+    relative_accuracy = 0.0
+
+    def __init__(self) -> None:
+        """Initialize empty histogram."""
+        self.counts: dict[Any, int] = {}
+        self.count = 0
+
+    def add(self, value: Any, count: int = 1) -> None:
+        """Add a sample."""
+        self.counts[value] = self.counts.get(value, 0) + count
+        self.count += count
+
+    def merge(self, other: ExactQuantiles) -> ExactQuantiles:
+        """Merge another histogram into this one; returns self."""
+        if not isinstance(other, ExactQuantiles):
+            # ValueError like DDSketch.merge: a backend mismatch is a configuration error
+            raise ValueError(  # noqa: TRY004
+                f"Cannot merge {other.backend} estimator into exact estimator"
+            )
+        for value, count in other.counts.items():
+            self.add(value, count)
+        return self
+
+    def quantiles(self, percentiles: Sequence[float | str]) -> dict[str, float]:
+        """
+        Nearest-rank percentiles: value at index = floor((p/100) * n), clamped to n-1.
+
+        Args:
+            percentiles: Percentiles in [0, 100] or "max"
+
+        Returns:
+            Dict mapping percentile key -> value (0.0 for every key when empty)
+        """
+        n = self.count
+        keys = [percentile_key(p) for p in percentiles]
+        if n == 0:
+            return {key: 0.0 for key in keys}
+
+        ranks = {key: _nearest_rank(p, n) for key, p in zip(keys, percentiles)}
+        result: dict[str, float] = {}
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            for key, rank in ranks.items():
+                if key not in result and rank < seen:
+                    result[key] = value
+            if len(result) == len(ranks):
+                break
+        return {key: result[key] for key in keys}
+
+    def cdf_points(self) -> list[tuple[float, int]]:
+        """(value, samples <= value) for every distinct value, ascending."""
+        points = []
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            points.append((value, seen))
+        return points
+
+    def to_state(self) -> dict[str, Any]:
+        """JSON-serializable state (values keep their int/float type and order)."""
+        return {"backend": self.backend, "counts": [[v, c] for v, c in self.counts.items()]}
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> ExactQuantiles:
+        """Restore an estimator saved with to_state()."""
+        estimator = cls()
+        for value, count in state["counts"]:
+            estimator.add(value, count)
+        return estimator
+
+
+class DDSketch:
+    """
+    DDSketch: log-bucketed, fully mergeable quantile sketch.
+
+    Every returned quantile q' satisfies |q' - q| <= relative_accuracy * |q| for the
+    true nearest-rank value q. Memory is O(log(max/min) / relative_accuracy), not
+    O(samples). The exact minimum and maximum are tracked as well.
+    """
+
+    backend = "ddsketch"
+    # Values closer to zero than this are counted in the zero bucket
+    MIN_INDEXABLE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """
+        Initialize empty sketch.
+
+        Args:
+            relative_accuracy: Relative error bound, in (0, 1)
+
+        Raises:
+            ValueError: If relative_accuracy is out of range
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: dict[int, int] = {}
+        self.negative: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2.0 * self._gamma**index / (self._gamma + 1.0)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a sample."""
+        if value > self.MIN_INDEXABLE:
+            k = self._index(value)
+            self.positive[k] = self.positive.get(k, 0) + count
+        elif value < -self.MIN_INDEXABLE:
+            k = self._index(-value)
+            self.negative[k] = self.negative.get(k, 0) + count
+        else:
+            self.zero_count += count
+        self.count += count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: DDSketch) -> DDSketch:
+        """
+        Merge another sketch into this one; returns self.
+
+        Raises:
+            ValueError: If other is not a DDSketch with the same relative accuracy
+        """
+        if not isinstance(other, DDSketch) or other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"Cannot merge {other.backend} estimator "
+                f"(relative_accuracy={other.relative_accuracy}) into ddsketch "
+                f"(relative_accuracy={self.relative_accuracy})"
+            )
+        for k, c in other.positive.items():
+            self.positive[k] = self.positive.get(k, 0) + c
+        for k, c in other.negative.items():
+            self.negative[k] = self.negative.get(k, 0) + c
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantiles(self, percentiles: Sequence[float | str]) -> dict[str, float]:
+        """
+        Approximate nearest-rank percentiles ("max" is exact).
+
+        Args:
+            percentiles: Percentiles in [0, 100] or "max"
+
+        Returns:
+            Dict mapping percentile key -> value (0.0 for every key when empty)
+        """
+        keys = [percentile_key(p) for p in percentiles]
+        if self.count == 0:
+            return {key: 0.0 for key in keys}
+        return {
+            key: self._quantile_at(_nearest_rank(p, self.count))
+            for key, p in zip(keys, percentiles)
+        }
+
+    def cdf_points(self) -> list[tuple[float, int]]:
+        """
+        (upper bucket bound, samples <= bound) for every non-empty bucket, ascending.
+
+        Sketches with the same relative accuracy share bucket bounds, so their
+        CDFs can be compared point by point (e.g. a two-sample KS statistic).
+        """
+        points: list[tuple[float, int]] = []
+        seen = 0
+        for k in sorted(self.negative, reverse=True):
+            seen += self.negative[k]
+            points.append((-(self._gamma ** (k - 1)), seen))
+        if self.zero_count:
+            seen += self.zero_count
+            points.append((self.MIN_INDEXABLE, seen))
+        for k in sorted(self.positive):
+            seen += self.positive[k]
+            points.append((self._gamma**k, seen))
+        return points
+
+    def to_state(self) -> dict[str, Any]:
+        """JSON-serializable state (bucket indices as [index, count] pairs)."""
+        return {
+            "backend": self.backend,
+            "relative_accuracy": self.relative_accuracy,
+            "positive": [[k, c] for k, c in self.positive.items()],
+            "negative": [[k, c] for k, c in self.negative.items()],
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> DDSketch:
+        """Restore a sketch saved with to_state()."""
+        sketch = cls(state["relative_accuracy"])
+        sketch.positive = {k: c for k, c in state["positive"]}
+        sketch.negative = {k: c for k, c in state["negative"]}
+        sketch.zero_count = state["zero_count"]
+        sketch.count = state["count"]
+        sketch.min = state["min"]
+        sketch.max = state["max"]
+        return sketch
+
+    def _quantile_at(self, rank: int) -> float:
+        if rank >= self.count - 1:
+            return float(self.max)
+        if rank == 0:
+            return float(self.min)
+        seen = 0
+        for k in sorted(self.negative, reverse=True):
+            seen += self.negative[k]
+            if rank < seen:
+                return max(-self._value(k), self.min)
+        seen += self.zero_count
+        if rank < seen:
+            return 0.0
+        for k in sorted(self.positive):
+            seen += self.positive[k]
+            if rank < seen:
+                return min(self._value(k), self.max)
+        return float(self.max)
+
+
+def quantile_estimator_from_state(state: dict[str, Any]) -> ExactQuantiles | DDSketch:
+    """
+    Restore an estimator saved with to_state().
+
+    Raises:
+        ValueError: If the state's backend is unknown
+    """
+    if state.get("backend") == "exact":
+        return ExactQuantiles.from_state(state)
+    if state.get("backend") == "ddsketch":
+        return DDSketch.from_state(state)
+    raise ValueError(f"Unknown quantile backend: {state.get('backend')}")
+
+
+def _nearest_rank(p: float | str, n: int) -> int:
+    """0-based nearest-rank index: floor((p/100) * n), clamped to n-1 ("max" -> n-1)."""
+    if p == "max":
+        return n - 1
+    return min(int((float(p) / 100.0) * n), n - 1)
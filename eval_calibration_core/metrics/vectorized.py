@@ -0,0 +1,108 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Array kernels over PacketColumns (NumPy when installed, stdlib fallback)."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency: pip install evaluation-calibration-core[numpy]
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def _np(column: array):
+    """Zero-copy NumPy view of an array column."""
+    return np.asarray(memoryview(column))
+
+
+def _bools(column: array):
+    return _np(column).view(np.bool_)
+
+
+def bincount(codes: array, size: int) -> list[int]:
+    """Count occurrences of each code in [0, size)."""
+    if HAS_NUMPY:
+        return np.bincount(_np(codes), minlength=size).tolist()
+    counts = Counter(codes)
+    return [counts.get(code, 0) for code in range(size)]
+
+
+def count_nonzero(column: array) -> int:
+    """Number of non-zero entries."""
+    if HAS_NUMPY:
+        return int(np.count_nonzero(_np(column)))
+    return len(column) - column.count(0)
+
+
+def all_in(codes: array, valid: set[int]) -> bool:
+    """True if every code is in valid."""
+    if HAS_NUMPY:
+        return bool(np.isin(_np(codes), np.fromiter(valid, dtype=np.int64)).all())
+    return set(codes) <= valid
+
+
+def all_within_unit_interval(values: array) -> bool:
+    """True if every value is NaN (missing) or within [0, 1]."""
+    if HAS_NUMPY:
+        v = _np(values)
+        return bool((np.isnan(v) | ((v >= 0.0) & (v <= 1.0))).all())
+    return all(math.isnan(v) or 0.0 <= v <= 1.0 for v in values)
+
+
+def count_safety_passed(allowed: array, has_flags: array, mismatch_present: array) -> int:
+    """Rows where allowed => no deny flags, and denied => mismatch present."""
+    if HAS_NUMPY:
+        a = _bools(allowed)
+        passed = (a & ~_bools(has_flags)) | (~a & _bools(mismatch_present))
+        return int(np.count_nonzero(passed))
+    return sum(
+        1 for a, f, m in zip(allowed, has_flags, mismatch_present) if (a and not f) or (not a and m)
+    )
+
+
+def any_fail_open(
+    allowed: array, has_flags: array, mismatch_present: array, fail_closed_marker: array
+) -> bool:
+    """Rows violating fail-closed: allowed with deny flags, or denied without mismatch or marker."""
+    if HAS_NUMPY:
+        a = _bools(allowed)
+        unmarked = ~a & ~_bools(mismatch_present) & ~_bools(fail_closed_marker)
+        return bool(((_bools(has_flags) & a) | unmarked).any())
+    return any(
+        (f and a) or (not a and not m and not k)
+        for a, f, m, k in zip(allowed, has_flags, mismatch_present, fail_closed_marker)
+    )
+
+
+def nearest_rank(values: array, percentiles: Sequence[float | str]) -> list[float]:
+    """
+    Nearest-rank percentiles (index = floor((p/100) * n), clamped to n-1; "max" = n-1).
+
+    Uses numpy.partition (O(n)) when available, otherwise a full sort. Values keep
+    the column type (int for an int64 column, so large integers stay exact).
+    """
+    n = len(values)
+    ranks = [n - 1 if p == "max" else min(int((float(p) / 100.0) * n), n - 1) for p in percentiles]
+    if HAS_NUMPY:
+        partitioned = np.partition(_np(values), sorted(set(ranks)))
+        return [partitioned[rank].item() for rank in ranks]
+    ordered = sorted(values)
+    return [ordered[rank] for rank in ranks]
+
+
+def first_rows(values: array, wanted: Sequence[float]) -> dict[float, int]:
+    """Index of the first row holding each wanted value (one scan for all of them)."""
+    if HAS_NUMPY:
+        v = _np(values)
+        rows = np.flatnonzero(np.isin(v, np.asarray(list(wanted), dtype=v.dtype)))
+        found, first = np.unique(v[rows], return_index=True)
+        return {value: int(rows[i]) for value, i in zip(found.tolist(), first.tolist())}
+    return {value: values.index(value) for value in set(wanted)}
@@ -0,0 +1,203 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tumbling and sliding window metrics keyed by input["ts"] (or step)."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
+
+
+@dataclass(frozen=True)
+class WindowSpec:
+    """
+    Window layout.
+
+    Attributes:
+        size: Window length in key units
+        step: Distance between window starts (default: size, i.e. tumbling);
+            size must be a multiple of step
+        key: "step" (packet.step) or an input field holding a number (default "ts")
+    """
+
+    size: float
+    step: float | None = None
+    key: str = "ts"
+
+    def __post_init__(self) -> None:
+        if self.step is None:
+            object.__setattr__(self, "step", self.size)
+        if not (self.size > 0 and self.step > 0):
+            raise ValueError(f"Window size and step must be positive, got {self.size}, {self.step}")
+        ratio = self.size / self.step
+        if abs(ratio - round(ratio)) > 1e-9:
+            raise ValueError(f"Window size {self.size} must be a multiple of step {self.step}")
+
+    @property
+    def panes(self) -> int:
+        """Panes (step-long buckets) per window."""
+        return round(self.size / self.step)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable spec."""
+        return {"size": self.size, "step": self.step, "key": self.key}
+
+
+class WindowedMetrics:
+    """
+    Per-window metrics, accumulated incrementally in panes.
+
+    Every packet updates the one pane (step-long bucket) its key falls into;
+    a window is the merge of `size / step` consecutive panes, done once in
+    finalize(). State is one MetricsAccumulator per non-empty pane, so memory
+    grows with the number of windows rather than packets (use the default
+    "ddsketch" latency backend to bound each pane). Packets without a finite
+    numeric key are counted in `unkeyed`.
+    """
+
+    def __init__(
+        self,
+        spec: WindowSpec,
+        latency_backend: str = "ddsketch",
+        relative_accuracy: float = 0.01,
+        percentiles: Sequence[float | str] | None = None,
+    ) -> None:
+        """
+        Initialize empty windows.
+
+        Args:
+            spec: Window layout
+            latency_backend: Per-pane latency estimator ("ddsketch" or "exact")
+            relative_accuracy: Relative error bound for "ddsketch"
+            percentiles: Latency percentiles per window (default p50, p95, p99)
+        """
+        self.spec = spec
+        self.options = {
+            "latency_backend": latency_backend,
+            "relative_accuracy": relative_accuracy,
+            "percentiles": percentiles,
+        }
+        self.pane_metrics: dict[int, MetricsAccumulator] = {}
+        self.unkeyed = 0
+
+    def _key(self, packet: Any) -> float | None:
+        if self.spec.key == "step":
+            return packet.step
+        value = packet.input.get(self.spec.key) if isinstance(packet.input, dict) else None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        if isinstance(value, float) and not math.isfinite(value):
+            return None  # NaN / +-Infinity (accepted by the stdlib JSON fallback)
+        return value
+
+    def update(self, packet: Any) -> None:
+        """
+        Add one packet to its pane.
+
+        Args:
+            packet: PacketV2 packet
+        """
+        key = self._key(packet)
+        try:
+            pane = None if key is None else math.floor(key / self.spec.step)
+        except OverflowError:
+            pane = None  # Finite key whose pane index does not fit a float
+        if pane is None:
+            self.unkeyed += 1
+            return
+        metrics = self.pane_metrics.get(pane)
+        if metrics is None:
+            metrics = self.pane_metrics[pane] = MetricsAccumulator(**self.options)
+        metrics.update(packet)
+
+    def merge(self, other: WindowedMetrics) -> WindowedMetrics:
+        """
+        Merge another instance over the packets that follow this one's; returns self.
+
+        Raises:
+            ValueError: If the window specs differ
+        """
+        if other.spec != self.spec:
+            raise ValueError(f"Cannot merge windows {other.spec} into {self.spec}")
+        for pane, metrics in other.pane_metrics.items():
+            if pane in self.pane_metrics:
+                self.pane_metrics[pane].merge(metrics)
+            else:
+                self.pane_metrics[pane] = metrics
+        self.unkeyed += other.unkeyed
+        return self
+
+    def to_state(self) -> dict[str, Any]:
+        """JSON-serializable state, restorable with from_state()."""
+        return {
+            "spec": self.spec.to_dict(),
+            "options": {**self.options, "percentiles": self._percentiles()},
+            "panes": [[pane, m.to_state()] for pane, m in self.pane_metrics.items()],
+            "unkeyed": self.unkeyed,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> WindowedMetrics:
+        """Restore an instance saved with to_state()."""
+        windows = cls(WindowSpec(**state["spec"]), **state["options"])
+        windows.pane_metrics = {
+            pane: MetricsAccumulator.from_state(metrics) for pane, metrics in state["panes"]
+        }
+        windows.unkeyed = state["unkeyed"]
+        return windows
+
+    def _percentiles(self) -> list[float | str] | None:
+        percentiles = self.options["percentiles"]
+        return list(percentiles) if percentiles else None
+
+    def finalize(self) -> dict[str, Any]:
+        """
+        Produce the windowed time series (Report.windows).
+
+        Windows are listed by start (key units) and include every window that
+        covers at least one packet. Series are columnar: one list per metric,
+        aligned with "start"; distributions are dicts of such lists (0 where
+        an action or guard code does not occur in a window).
+
+        Returns:
+            Dict with spec, latency_backend, unkeyed, start, total_steps,
+            action_distribution, guard_trigger_rates, safety_invariant_pass_rate
+            and latency_percentiles
+        """
+        panes = self.spec.panes
+        starts = sorted({pane - i for pane in self.pane_metrics for i in range(panes)})
+        finalized = []
+        for start in starts:
+            window = MetricsAccumulator(**self.options)
+            for pane in range(start, start + panes):
+                if pane in self.pane_metrics:
+                    window.merge(self.pane_metrics[pane])
+            finalized.append(window.finalize())
+
+        count = len(finalized)
+        actions: dict[str, list[int]] = {}
+        triggers: dict[str, list[float]] = {}
+        latency: dict[str, list[float]] = {}
+        for i, metrics in enumerate(finalized):
+            for action, value in metrics["action_distribution"].items():
+                actions.setdefault(action, [0] * count)[i] = value
+            for code, value in metrics["guard_trigger_rates"].items():
+                triggers.setdefault(code, [0.0] * count)[i] = value
+            for key, value in metrics["latency_percentiles"].items():
+                latency.setdefault(key, [0.0] * count)[i] = value
+        return {
+            **self.spec.to_dict(),
+            "latency_backend": self.options["latency_backend"],
+            "unkeyed": self.unkeyed,
+            "start": [start * self.spec.step for start in starts],
+            "total_steps": [m["total_steps"] for m in finalized],
+            "action_distribution": actions,
+            "guard_trigger_rates": triggers,
+            "safety_invariant_pass_rate": [m["safety_invariant_pass_rate"] for m in finalized],
+            "latency_percentiles": latency,
+        }
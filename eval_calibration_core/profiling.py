@@ -0,0 +1,148 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Per-stage wall time, CPU time, throughput and peak traced memory (Report.perf)."""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class StageStats:
+    """Accumulated measurements of one stage."""
+
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    packets: int = 0
+    peak_traced_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for Report.perf."""
+        result = {
+            "wall_s": round(self.wall_s, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "packets": self.packets,
+            "packets_per_s": (
+                round(self.packets / self.wall_s, 1) if self.packets and self.wall_s > 0 else None
+            ),
+        }
+        if self.peak_traced_bytes is not None:
+            result["peak_traced_mb"] = round(self.peak_traced_bytes / (1 << 20), 3)
+        return result
+
+
+class Profiler:
+    """
+    Collect per-stage measurements.
+
+    Sequential stages use stage() (wall, CPU and, with trace_memory, the peak
+    tracemalloc size reached inside the stage). Work interleaved per packet
+    (e.g. JSON parsing vs PacketV2.from_dict inside one read loop) is summed
+    with add(); such sub-stages are named "<stage>.<part>" and carry no memory
+    peak. Use NULL_PROFILER (enabled=False) when profiling is off: hot loops
+    check `profiler.enabled` once and keep their uninstrumented path.
+    """
+
+    enabled = True
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        """
+        Initialize.
+
+        Args:
+            trace_memory: Record peak tracemalloc per stage (starts tracemalloc;
+                slows allocation-heavy code noticeably)
+        """
+        self.trace_memory = trace_memory
+        self.stages: dict[str, StageStats] = {}
+        self._peaks: list[int] = []
+        self._started_tracing = False
+
+    def _stats(self, name: str) -> StageStats:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        return stats
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        """
+        Measure a sequential stage; set `.packets` on the yielded stats for packets/sec.
+
+        Args:
+            name: Stage name (repeated stages accumulate)
+        """
+        stats = self._stats(name)
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            if self._peaks:
+                # Keep the enclosing stage's peak before resetting it for this one
+                self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield stats
+        finally:
+            stats.wall_s += time.perf_counter() - wall
+            stats.cpu_s += time.process_time() - cpu
+            if self.trace_memory:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                stats.peak_traced_bytes = max(stats.peak_traced_bytes or 0, peak)
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+
+    def add(self, name: str, wall_s: float, cpu_s: float, packets: int = 0) -> None:
+        """
+        Add time measured elsewhere (interleaved sub-stage).
+
+        Args:
+            name: Stage name, conventionally "<stage>.<part>"
+            wall_s: Wall seconds
+            cpu_s: CPU seconds
+            packets: Packets processed
+        """
+        stats = self._stats(name)
+        stats.wall_s += wall_s
+        stats.cpu_s += cpu_s
+        stats.packets += packets
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize as the Report.perf block.
+
+        Stops tracemalloc if this profiler started it.
+        """
+        if self._started_tracing and not self._peaks:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return {
+            "trace_memory": self.trace_memory,
+            "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+        }
+
+
+class _NullProfiler:
+    """Disabled profiler: stage() is a shared no-op context, add() does nothing."""
+
+    enabled = False
+
+    def __init__(self) -> None:
+        self._context = nullcontext(StageStats())
+
+    def stage(self, name: str) -> nullcontext[StageStats]:
+        return self._context
+
+    def add(self, name: str, wall_s: float, cpu_s: float, packets: int = 0) -> None:
+        return None
+
+
+NULL_PROFILER: Any = _NullProfiler()
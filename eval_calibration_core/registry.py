@@ -0,0 +1,216 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Registry of pluggable metrics and invariants, evaluated in the report's single pass."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Entry point group scanned by load_entry_points(); each entry names a register(registry) callable
+ENTRY_POINT_GROUP = "eval_calibration_core.plugins"
+
+# Top-level PacketV2 fields a plugin may declare
+PACKET_FIELDS = (
+    "run_id",
+    "step",
+    "schema_version",
+    "input",
+    "external",
+    "mdm",
+    "final_action",
+    "latency_ms",
+    "mismatch",
+)
+
+# Fields read by the built-in metrics, invariants and calibration
+CORE_FIELDS = (
+    "run_id",
+    "step",
+    "schema_version",
+    "external",
+    "mdm",
+    "final_action",
+    "latency_ms",
+    "mismatch",
+)
+
+# Keys of the built-in metrics dict and invariant results (plugins may not reuse them)
+RESERVED_NAMES = frozenset(
+    {
+        "action_distribution",
+        "guard_trigger_rates",
+        "safety_invariant_pass_rate",
+        "latency_percentiles",
+        "latency_estimator",
+        "total_steps",
+        "contract_closure",
+        "confidence_clamp",
+        "fail_closed",
+        "packet_version",
+    }
+)
+
+
+@dataclass(frozen=True)
+class MetricPlugin:
+    """
+    A registered metric.
+
+    Attributes:
+        name: Key in Report.metrics
+        accumulator: Class with update(packet), merge(other) -> self and finalize();
+            to_state() / from_state(state) make it usable in incremental runs
+        fields: PacketV2 fields update() reads
+    """
+
+    name: str
+    accumulator: type
+    fields: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class InvariantPlugin:
+    """
+    A registered invariant.
+
+    Attributes:
+        name: Key in Report.invariant_results
+        check: Per-packet predicate (True: packet satisfies the invariant)
+        fields: PacketV2 fields check() reads
+    """
+
+    name: str
+    check: Callable[[Any], bool]
+    fields: tuple[str, ...]
+
+
+@dataclass
+class Registry:
+    """
+    Metrics and invariants added to every report built with this registry.
+
+    Registered metrics are updated inside MetricsAccumulator.update() and
+    invariants inside InvariantAccumulator, so they share the single pass over
+    the packets (and its sharding, incremental state and invariant modes)
+    instead of adding passes of their own. A plugin invariant short-circuits
+    like a built-in one: each check runs until it first fails.
+    """
+
+    metrics: dict[str, MetricPlugin] = field(default_factory=dict)
+    invariants: dict[str, InvariantPlugin] = field(default_factory=dict)
+
+    def metric(self, name: str, fields: Iterable[str]) -> Callable[[type], type]:
+        """
+        Class decorator registering a metric accumulator.
+
+        Args:
+            name: Key in Report.metrics
+            fields: PacketV2 fields the accumulator reads
+
+        Returns:
+            Decorator returning the class unchanged
+
+        Raises:
+            ValueError: If the name is taken or a field is not a PacketV2 field
+        """
+        fields = self._check(name, fields)
+
+        def register(accumulator: type) -> type:
+            self.metrics[name] = MetricPlugin(name, accumulator, fields)
+            return accumulator
+
+        return register
+
+    def invariant(self, name: str, fields: Iterable[str]) -> Callable[[Callable], Callable]:
+        """
+        Function decorator registering a per-packet invariant check.
+
+        Args:
+            name: Key in Report.invariant_results
+            fields: PacketV2 fields the check reads
+
+        Returns:
+            Decorator returning the function unchanged
+
+        Raises:
+            ValueError: If the name is taken or a field is not a PacketV2 field
+        """
+        fields = self._check(name, fields)
+
+        def register(check: Callable[[Any], bool]) -> Callable[[Any], bool]:
+            self.invariants[name] = InvariantPlugin(name, check, fields)
+            return check
+
+        return register
+
+    def _check(self, name: str, fields: Iterable[str]) -> tuple[str, ...]:
+        if name in RESERVED_NAMES or name in self.metrics or name in self.invariants:
+            raise ValueError(f"Plugin name already in use: {name!r}")
+        fields = tuple(fields)
+        unknown = [f for f in fields if f not in PACKET_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown packet fields for {name!r}: {unknown}")
+        return fields
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric or invariant (no-op if it is not registered)."""
+        self.metrics.pop(name, None)
+        self.invariants.pop(name, None)
+
+    def names(self) -> list[str]:
+        """Registered metric and invariant names, in registration order."""
+        return [*self.metrics, *self.invariants]
+
+    def fields(self) -> tuple[str, ...]:
+        """PacketV2 fields a report pass reads: built-ins plus every plugin's fields."""
+        wanted = set(CORE_FIELDS)
+        for plugin in (*self.metrics.values(), *self.invariants.values()):
+            wanted.update(plugin.fields)
+        return tuple(f for f in PACKET_FIELDS if f in wanted)
+
+    def metric_classes(self) -> dict[str, type]:
+        """Metric name -> accumulator class (MetricsAccumulator plugins)."""
+        return {name: plugin.accumulator for name, plugin in self.metrics.items()}
+
+    def invariant_checks(self) -> dict[str, Callable[[Any], bool]]:
+        """Invariant name -> check (InvariantAccumulator checks)."""
+        return {name: plugin.check for name, plugin in self.invariants.items()}
+
+
+# Process-wide registry used by the report builders unless one is passed explicitly
+REGISTRY = Registry()
+register_metric = REGISTRY.metric
+register_invariant = REGISTRY.invariant
+
+_loaded_entry_points: set[str] = set()
+
+
+def load_entry_points(registry: Registry = REGISTRY) -> list[str]:
+    """
+    Register the plugins installed under the ENTRY_POINT_GROUP entry point group.
+
+    Each entry point names a callable taking the registry, e.g. in a plugin's
+    pyproject.toml: `[project.entry-points."eval_calibration_core.plugins"]`
+    `latency_slo = "my_plugin:register"`. Entry points already loaded into the
+    default registry are skipped.
+
+    Args:
+        registry: Registry to populate
+
+    Returns:
+        Names of the entry points loaded by this call
+    """
+    from importlib.metadata import entry_points
+
+    loaded = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if registry is REGISTRY and entry_point.name in _loaded_entry_points:
+            continue
+        entry_point.load()(registry)
+        if registry is REGISTRY:
+            _loaded_entry_points.add(entry_point.name)
+        loaded.append(entry_point.name)
+    return loaded
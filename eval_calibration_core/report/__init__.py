@@ -3,8 +3,32 @@
 # SPDX-License-Identifier: MIT
 """Report generation."""
 
-from eval_calibration_core.report.builder import build_report
+from eval_calibration_core.report.batch import build_report_batch, expand_inputs
+from eval_calibration_core.report.builder import (
+    build_report,
+    build_report_columns,
+    build_report_parallel,
+    build_report_streaming,
+    report_fields,
+)
+from eval_calibration_core.report.cached import build_report_cached, report_cache_key
+from eval_calibration_core.report.groups import GroupedAccumulator
+from eval_calibration_core.report.incremental import build_report_incremental
 from eval_calibration_core.report.model import Report
 from eval_calibration_core.report.writer import write_report
 
-__all__ = ["Report", "build_report", "write_report"]
+__all__ = [
+    "GroupedAccumulator",
+    "Report",
+    "build_report",
+    "build_report_batch",
+    "build_report_cached",
+    "build_report_columns",
+    "build_report_incremental",
+    "build_report_parallel",
+    "build_report_streaming",
+    "expand_inputs",
+    "report_cache_key",
+    "report_fields",
+    "write_report",
+]
@@ -0,0 +1,312 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Evaluate many trace files concurrently, one report per trace plus an index report."""
+
+from __future__ import annotations
+
+import glob
+import json
+import pickle
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from eval_calibration_core.cache import ContentCache
+from eval_calibration_core.io.arrow_reader import ARROW_SUFFIXES, PARQUET_SUFFIXES
+from eval_calibration_core.registry import REGISTRY, Registry
+from eval_calibration_core.report.builder import build_report_streaming, report_fields
+from eval_calibration_core.report.cached import build_report_cached
+from eval_calibration_core.report.writer import _atomic_open, _write_lines, write_report
+
+INDEX_VERSION = "0.1.0"
+
+# Trace files picked up from a directory or glob (JSONL may be .gz / .zst compressed)
+TRACE_SUFFIXES = (".jsonl", *ARROW_SUFFIXES, *PARQUET_SUFFIXES)
+_COMPRESSED_SUFFIXES = (".gz", ".zst")
+
+# Raised by future.result() when a worker died or a result could not be pickled;
+# errors inside a worker are already index entries (see _evaluate_input), and jobs
+# are checked with pickle before they are submitted (see _pickling_error)
+_POOL_ERRORS = (BrokenProcessPool, pickle.PicklingError)
+
+
+def expand_inputs(spec: Path | str) -> list[Path]:
+    """
+    Trace files named by a path, a directory or a glob pattern.
+
+    Args:
+        spec: A file, a directory (its trace files, see TRACE_SUFFIXES) or a glob
+            pattern such as "traces/*" ("**" matches subdirectories); only trace
+            files are kept from a directory or pattern, so `.idx` sidecars and
+            state files are skipped
+
+    Returns:
+        Sorted trace paths (a single file is returned as is)
+
+    Raises:
+        FileNotFoundError: If a directory or pattern matches no file
+    """
+    text = str(spec)
+    path = Path(spec)
+    if path.is_dir():
+        paths = [p for p in path.iterdir() if p.is_file() and _is_trace(p)]
+    elif glob.has_magic(text):
+        matches = (Path(p) for p in glob.glob(text, recursive=True))
+        paths = [p for p in matches if p.is_file() and _is_trace(p)]
+    else:
+        return [path]
+    if not paths:
+        raise FileNotFoundError(f"No trace files match: {text}")
+    return sorted(paths)
+
+
+def is_multi_input(spec: Path | str) -> bool:
+    """True if spec is a directory or a glob pattern rather than one trace file."""
+    return Path(spec).is_dir() or glob.has_magic(str(spec))
+
+
+def report_name(path: Path | str) -> str:
+    """
+    Report directory and suite name of a trace: its name without trace and
+    compression suffixes ("a.jsonl.gz" -> "a").
+    """
+    return _split_trace_name(Path(path).name)[0]
+
+
+def _is_trace(path: Path) -> bool:
+    """True for files with a trace suffix (see TRACE_SUFFIXES)."""
+    return _split_trace_name(path.name)[1]
+
+
+def _split_trace_name(name: str) -> tuple[str, bool]:
+    """(name without compression and trace suffixes, whether it had a trace suffix)."""
+    for suffix in _COMPRESSED_SUFFIXES:
+        if name.lower().endswith(suffix) and len(name) > len(suffix):
+            name = name[: -len(suffix)]
+            break
+    for suffix in TRACE_SUFFIXES:
+        if name.lower().endswith(suffix) and len(name) > len(suffix):
+            return name[: -len(suffix)], True
+    return name, False
+
+
+def build_report_batch(
+    inputs: Sequence[Path | str],
+    output_dir: Path | str,
+    workers: int = 1,
+    decoder: str = "auto",
+    registry: Registry | None = None,
+    project_fields: bool = False,
+    cache: ContentCache | None = None,
+    quick: bool = False,
+    write_options: dict[str, Any] | None = None,
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Evaluate trace files in a bounded process pool and write one report per trace.
+
+    Each trace is streamed into its own report under output_dir/<name>/ (see
+    report_name; clashing names get a numeric suffix), and index.json /
+    index.md summarizing every trace are written to output_dir. A trace that
+    fails (invalid packet, fail-fast violation, unreadable file, crashed
+    worker) is recorded in the index and does not stop the others.
+
+    Args:
+        inputs: Trace files (see expand_inputs)
+        output_dir: Directory for the per-trace reports and the index
+        workers: Number of worker processes (1 evaluates in-process)
+        decoder: JSON decoder backend for JSONL traces (see io/decoders.py)
+        registry: Plugin metrics and invariants (default: the process-wide REGISTRY);
+            plugins must be picklable (module-level) when workers > 1
+        project_fields: Read only the packet fields the report needs (see report_fields)
+        cache: ContentCache of reports (see build_report_cached; None: always build)
+        quick: Key the cache on trace path, size and mtime instead of content
+        write_options: write_report keyword arguments (compact, compression)
+        **options: build_report_streaming keyword arguments (metric, window,
+            invariant and group options), applied to every trace
+
+    Returns:
+        The index document (also written to output_dir/index.json)
+    """
+    output_dir = Path(output_dir)
+    registry = REGISTRY if registry is None else registry
+    jobs = []
+    for path, name in zip(inputs, _unique_names(inputs)):
+        job = {
+            "path": Path(path),
+            "out": output_dir / name,
+            "decoder": decoder,
+            "registry": registry,
+            "project_fields": project_fields,
+            "cache": cache,
+            "quick": quick,
+            "write_options": write_options or {},
+            "options": options,
+        }
+        jobs.append(job)
+
+    start = time.perf_counter()
+    if workers <= 1 or len(jobs) <= 1:
+        entries = [_evaluate_input(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures: list[Any] = []
+            for job in jobs:
+                error = _pickling_error(job)
+                futures.append(error if error is not None else pool.submit(_evaluate_input, job))
+            entries = []
+            for job, future in zip(jobs, futures):
+                if isinstance(future, Exception):
+                    entries.append(_failed_entry(job, future, 0.0))
+                    continue
+                try:
+                    entries.append(future.result())
+                except _POOL_ERRORS as e:
+                    entries.append(_failed_entry(job, e, 0.0))
+
+    index = {
+        "index_version": INDEX_VERSION,
+        "inputs": len(entries),
+        "ok": sum(entry["status"] == "ok" for entry in entries),
+        "failed": sum(entry["status"] == "failed" for entry in entries),
+        "total_packets": sum(entry["total_packets"] or 0 for entry in entries),
+        "wall_s": round(time.perf_counter() - start, 6),
+        "reports": entries,
+    }
+    write_index(index, output_dir)
+    return index
+
+
+def _unique_names(inputs: Iterable[Path | str]) -> list[str]:
+    """report_name of each input, with "-2", "-3", ... appended to repeated names."""
+    seen: dict[str, int] = {}
+    names = []
+    for path in inputs:
+        name = report_name(path)
+        seen[name] = seen.get(name, 0) + 1
+        names.append(name if seen[name] == 1 else f"{name}-{seen[name]}")
+    return names
+
+
+def _pickling_error(job: dict[str, Any]) -> Exception | None:
+    """
+    Error pickling a job for a worker (e.g. a plugin or outcome defined in a
+    function raises AttributeError or TypeError), or None if it pickles.
+    """
+    try:
+        pickle.dumps(job)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        return e
+    return None
+
+
+def _evaluate_input(job: dict[str, Any]) -> dict[str, Any]:
+    """Worker: build and write one trace's report; failures become index entries."""
+    from eval_calibration_core.io.readers import open_packet_reader
+
+    path, options, registry = job["path"], job["options"], job["registry"]
+    start = time.perf_counter()
+    try:
+        if job["cache"] is not None:
+            report = build_report_cached(
+                path,
+                job["cache"],
+                suite_name=report_name(path),
+                quick=job["quick"],
+                decoder=job["decoder"],
+                registry=registry,
+                project_fields=job["project_fields"],
+                **options,
+            )
+        else:
+            fields = None
+            if job["project_fields"]:
+                fields = report_fields(
+                    registry,
+                    options.get("window"),
+                    options.get("group_by"),
+                    options.get("outcome"),
+                )
+            report = build_report_streaming(
+                open_packet_reader(path, job["decoder"], fields).read(),
+                suite_name=report_name(path),
+                registry=registry,
+                **options,
+            )
+        json_path = write_report(report, job["out"], **job["write_options"])
+    except Exception as e:  # noqa: BLE001 - recorded with its type in the index entry
+        return _failed_entry(job, e, time.perf_counter() - start)
+    failed = [name for name, passed in report.invariant_results.items() if not passed]
+    return {
+        "input": str(path),
+        "report": str(json_path),
+        "status": "ok",
+        "error": None,
+        "total_packets": report.input_stats.get("total_packets", 0),
+        "failed_invariants": failed,
+        "contract_ok": report.contract_ok,
+        "wall_s": round(time.perf_counter() - start, 6),
+    }
+
+
+def _failed_entry(job: dict[str, Any], error: BaseException, wall_s: float) -> dict[str, Any]:
+    """Index entry of a trace that could not be evaluated."""
+    return {
+        "input": str(job["path"]),
+        "report": None,
+        "status": "failed",
+        "error": f"{type(error).__name__}: {error}",
+        "total_packets": None,
+        "failed_invariants": None,
+        "contract_ok": None,
+        "wall_s": round(wall_s, 6),
+    }
+
+
+def write_index(index: dict[str, Any], output_dir: Path | str) -> Path:
+    """
+    Write the batch index to index.json and index.md (atomically, like write_report).
+
+    Args:
+        index: build_report_batch result
+        output_dir: Output directory path
+
+    Returns:
+        Path of index.json
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    json_path = output_dir / "index.json"
+    with _atomic_open(json_path) as f:
+        json.dump(index, f, indent=2)
+    with _atomic_open(output_dir / "index.md") as f:
+        _write_lines(f, _iter_index_markdown(index))
+    return json_path
+
+
+def _iter_index_markdown(index: dict[str, Any]) -> Iterator[str]:
+    """Index Markdown, one line at a time."""
+    yield "# Evaluation Index"
+    yield ""
+    yield (
+        f"**Inputs**: {index['inputs']} ({index['ok']} ok, {index['failed']} failed), "
+        f"**packets**: {index['total_packets']}, **wall**: {index['wall_s']:.1f}s"
+    )
+    yield ""
+    yield "| Input | Status | Packets | Failed invariants | Report |"
+    yield "|-------|--------|--------:|-------------------|--------|"
+    for entry in index["reports"]:
+        if entry["status"] == "ok":
+            failed = ", ".join(entry["failed_invariants"]) or "-"
+            yield (
+                f"| {entry['input']} | ✅ ok | {entry['total_packets']} | {failed} | "
+                f"{entry['report']} |"
+            )
+        else:
+            error = entry["error"].replace("|", "\\|").replace("\n", " ")
+            yield f"| {entry['input']} | ❌ failed | - | {error} | - |"
+    yield ""
@@ -5,37 +5,510 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from decision_schema import __version__ as schema_version
 
+from eval_calibration_core.calibration.reliability import (
+    DEFAULT_BINS,
+    CalibrationAccumulator,
+    OutcomeFn,
+    calibration_columns,
+)
 from eval_calibration_core.contracts import check_expected_minor_range
-from eval_calibration_core.metrics.compute import compute_metrics
+from eval_calibration_core.io.indexed_reader import IndexedPacketReader, detect_compression
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
+from eval_calibration_core.metrics.compute import compute_metrics_columns
+from eval_calibration_core.metrics.windows import WindowedMetrics, WindowSpec
+from eval_calibration_core.profiling import NULL_PROFILER
+from eval_calibration_core.registry import PACKET_FIELDS, REGISTRY, Registry
+from eval_calibration_core.report.groups import GroupedAccumulator
 from eval_calibration_core.report.model import Report
-from eval_calibration_core.suites.invariants import check_invariants
+from eval_calibration_core.suites.invariants import InvariantAccumulator, check_invariants_columns
 
 if TYPE_CHECKING:
     from decision_schema.packet_v2 import PacketV2
 
+    from eval_calibration_core.io.columns import PacketColumns
+
+# End-of-iteration sentinel for the profiled loop
+_END = object()
+
 
 def build_report(
     packets: list["PacketV2"],
     suite_name: str = "default",
     expected_schema_minor: int = 2,
+    latency_backend: str | None = None,
+    relative_accuracy: float = 0.01,
+    percentiles: Sequence[float | str] | None = None,
+    calibration_bins: int = DEFAULT_BINS,
+    outcome: OutcomeFn | None = None,
+    window: WindowSpec | None = None,
+    invariant_mode: str = "summary",
+    group_by: str | None = None,
+    max_groups: int | None = None,
+    spill_dir: Path | str | None = None,
+    registry: Registry | None = None,
+    profiler: Any = None,
 ) -> Report:
     """
     Build a Report from packets: compute metrics, check invariants, check schema compat.
 
+    Metrics and invariants are accumulated together in a single pass over packets.
+
     Args:
         packets: List of PacketV2 instances
         suite_name: Suite identifier
         expected_schema_minor: Expected decision-schema minor (default 2 for 0.2.x)
+        latency_backend: Latency quantile backend ("exact" or "ddsketch"), see compute_metrics
+        relative_accuracy: Relative error bound for "ddsketch"
+        percentiles: Latency percentiles to report (default p50, p95, p99)
+        calibration_bins: Confidence bins of Report.calibration_summary
+        outcome: Calibration outcome extractor (default: proposal action == final action)
+        window: Optional window layout for Report.windows (see build_report_streaming)
+        invariant_mode: "summary", "fail_fast" or "audit" (see build_report_streaming)
+        group_by: Optional group key for Report.groups (see build_report_streaming)
+        max_groups: Groups held in memory before spilling to disk (with group_by)
+        spill_dir: Parent directory of the group spill files (default: system temp dir)
+        registry: Plugin metrics and invariants (default: the process-wide REGISTRY)
+        profiler: Optional Profiler (see build_report_streaming)
 
     Returns:
         Report instance (use write_report(report, output_dir) to write files)
     """
-    metrics = compute_metrics(packets)
-    invariant_results = check_invariants(packets)
+    return build_report_streaming(
+        packets,
+        suite_name,
+        expected_schema_minor,
+        latency_backend=latency_backend,
+        relative_accuracy=relative_accuracy,
+        percentiles=percentiles,
+        calibration_bins=calibration_bins,
+        outcome=outcome,
+        window=window,
+        invariant_mode=invariant_mode,
+        group_by=group_by,
+        max_groups=max_groups,
+        spill_dir=spill_dir,
+        registry=registry,
+        profiler=profiler,
+    )
+
+
+def build_report_streaming(
+    packets: Iterable[PacketV2],
+    suite_name: str = "default",
+    expected_schema_minor: int = 2,
+    latency_backend: str | None = None,
+    relative_accuracy: float = 0.01,
+    percentiles: Sequence[float | str] | None = None,
+    calibration_bins: int = DEFAULT_BINS,
+    outcome: OutcomeFn | None = None,
+    window: WindowSpec | None = None,
+    invariant_mode: str = "summary",
+    group_by: str | None = None,
+    max_groups: int | None = None,
+    spill_dir: Path | str | None = None,
+    registry: Registry | None = None,
+    profiler: Any = None,
+) -> Report:
+    """
+    Build a Report from a lazily consumed packet iterable (e.g. PacketReader.read()).
+
+    Packets are never materialized: each one is folded into the metric,
+    invariant and calibration accumulators and dropped, so peak memory does not grow with the
+    trace length. The one exception is the default exact latency backend, which keeps a
+    count per distinct latency: with continuous (float) latencies that is one entry per
+    packet, so pass latency_backend="ddsketch" for a hard bound. Output is identical to
+    build_report(list(packets)).
+
+    Args:
+        packets: Iterable of PacketV2 instances (consumed once)
+        suite_name: Suite identifier
+        expected_schema_minor: Expected decision-schema minor (default 2 for 0.2.x)
+        latency_backend: Latency quantile backend ("exact" or "ddsketch"), see compute_metrics
+        relative_accuracy: Relative error bound for "ddsketch"
+        percentiles: Latency percentiles to report (default p50, p95, p99)
+        calibration_bins: Confidence bins of Report.calibration_summary
+        outcome: Calibration outcome extractor (default: proposal action == final action)
+        window: Optional window layout: per-window metrics go to Report.windows
+            (latencies in a DDSketch unless latency_backend is set)
+        invariant_mode: "summary" (pass/fail per invariant), "fail_fast" (raise
+            InvariantViolation at the first violating packet, which stops reading)
+            or "audit" (violating packet offsets per invariant in Report.violations)
+        group_by: Optional packet attribute (e.g. "run_id") or input field: per-group
+            metrics and invariants go to Report.groups, the top-level report being
+            the rollup over all groups (latencies in a DDSketch unless latency_backend is set)
+        max_groups: Groups held in memory before the least recently updated one is
+            spilled to disk (with group_by; None: unbounded)
+        spill_dir: Parent directory of the group spill files (default: system temp dir)
+        registry: Plugin metrics and invariants, evaluated in the same pass (default:
+            the process-wide REGISTRY, see registry.py)
+        profiler: Optional Profiler: records the "evaluate" stage with "evaluate.read"
+            (time spent producing packets), "evaluate.metrics", "evaluate.invariants"
+            and "evaluate.calibration", and "finalize"
+
+    Returns:
+        Report instance
+
+    Raises:
+        InvariantViolation: At the first violating packet in "fail_fast" mode
+    """
+    profiler = profiler or NULL_PROFILER
+    registry = REGISTRY if registry is None else registry
+    metrics = MetricsAccumulator(
+        latency_backend, relative_accuracy, percentiles, registry.metric_classes()
+    )
+    invariants = InvariantAccumulator(mode=invariant_mode, checks=registry.invariant_checks())
+    calibration = CalibrationAccumulator(calibration_bins, outcome)
+    windows = _make_windows(window, latency_backend, relative_accuracy, percentiles)
+    groups = None
+    if group_by is not None:
+        groups = GroupedAccumulator(
+            group_by,
+            latency_backend or "ddsketch",
+            relative_accuracy,
+            percentiles,
+            max_groups,
+            spill_dir,
+        )
+    try:
+        if profiler.enabled:
+            with profiler.stage("evaluate") as stats:
+                _accumulate_profiled(
+                    packets, metrics, invariants, calibration, windows, groups, profiler
+                )
+                stats.packets += metrics.total_steps
+        elif windows is None and groups is None:
+            for packet in packets:
+                metrics.update(packet)
+                invariants.update(packet)
+                calibration.update(packet)
+        else:
+            for packet in packets:
+                metrics.update(packet)
+                if windows is not None:
+                    windows.update(packet)
+                if groups is not None:
+                    groups.update(packet)
+                invariants.update(packet)
+                calibration.update(packet)
+        with profiler.stage("finalize"):
+            report = _report_from_accumulators(
+                metrics, invariants, suite_name, expected_schema_minor, calibration, windows
+            )
+            if groups is not None:
+                report.groups = groups.finalize()
+            return report
+    finally:
+        if groups is not None:
+            groups.close()
+
+
+def _make_windows(
+    window: WindowSpec | None,
+    latency_backend: str | None,
+    relative_accuracy: float,
+    percentiles: Sequence[float | str] | None,
+) -> WindowedMetrics | None:
+    """WindowedMetrics for a window spec (None without one)."""
+    if window is None:
+        return None
+    return WindowedMetrics(window, latency_backend or "ddsketch", relative_accuracy, percentiles)
+
+
+def report_fields(
+    registry: Registry | None = None,
+    window: WindowSpec | None = None,
+    group_by: str | None = None,
+    outcome: OutcomeFn | None = None,
+) -> tuple[str, ...] | None:
+    """
+    Packet fields a report pass reads, for reader projection (PacketReader fields=).
+
+    Args:
+        registry: Plugin metrics and invariants (default: the process-wide REGISTRY)
+        window: Window layout (its key is read from input unless it is "step")
+        group_by: Group key (read from input unless it is a packet field)
+        outcome: Calibration outcome extractor; a custom one may read any field
+
+    Returns:
+        Field names in PacketV2 order, or None (no projection) with a custom outcome
+    """
+    if outcome is not None:
+        return None
+    fields = set((REGISTRY if registry is None else registry).fields())
+    if window is not None and window.key != "step":
+        fields.add("input")
+    if group_by is not None:
+        fields.add(group_by if group_by in PACKET_FIELDS else "input")
+    return tuple(name for name in PACKET_FIELDS if name in fields)
+
+
+def _accumulate_profiled(
+    packets: Iterable[PacketV2],
+    metrics: MetricsAccumulator,
+    invariants: InvariantAccumulator,
+    calibration: CalibrationAccumulator,
+    windows: WindowedMetrics | None,
+    groups: GroupedAccumulator | None,
+    profiler: Any,
+) -> None:
+    """The fused accumulation loop with per-part wall and CPU time (windows, groups: metrics)."""
+    clock, cpu_clock = time.perf_counter, time.process_time
+    totals = [0.0] * 8
+    count = 0
+    iterator = iter(packets)
+    try:
+        while True:
+            t0, c0 = clock(), cpu_clock()
+            packet = next(iterator, _END)
+            if packet is _END:
+                break
+            t1, c1 = clock(), cpu_clock()
+            metrics.update(packet)
+            if windows is not None:
+                windows.update(packet)
+            if groups is not None:
+                groups.update(packet)
+            t2, c2 = clock(), cpu_clock()
+            invariants.update(packet)
+            t3, c3 = clock(), cpu_clock()
+            calibration.update(packet)
+            t4, c4 = clock(), cpu_clock()
+            totals[0] += t1 - t0
+            totals[1] += c1 - c0
+            totals[2] += t2 - t1
+            totals[3] += c2 - c1
+            totals[4] += t3 - t2
+            totals[5] += c3 - c2
+            totals[6] += t4 - t3
+            totals[7] += c4 - c3
+            count += 1
+    finally:
+        profiler.add("evaluate.read", totals[0], totals[1], count)
+        profiler.add("evaluate.metrics", totals[2], totals[3], count)
+        profiler.add("evaluate.invariants", totals[4], totals[5], count)
+        profiler.add("evaluate.calibration", totals[6], totals[7], count)
+
+
+def build_report_parallel(
+    path: Path | str,
+    workers: int,
+    suite_name: str = "default",
+    expected_schema_minor: int = 2,
+    latency_backend: str | None = None,
+    relative_accuracy: float = 0.01,
+    percentiles: Sequence[float | str] | None = None,
+    calibration_bins: int = DEFAULT_BINS,
+    outcome: OutcomeFn | None = None,
+    window: WindowSpec | None = None,
+    invariant_mode: str = "summary",
+    registry: Registry | None = None,
+    project_fields: bool = False,
+    decoder: str = "auto",
+) -> Report:
+    """
+    Build a Report from a JSONL trace evaluated in byte-range shards across processes.
+
+    The file is split at line boundaries (PacketReader.shards), each shard is
+    accumulated in a ProcessPoolExecutor worker, and partial states are merged
+    in file order. gzip/zstd traces are split by packet index instead
+    (IndexedPacketReader.shards, using the cached line-offset index). The result
+    is identical to build_report_streaming over the whole file, including
+    per-invariant short-circuiting.
+
+    Args:
+        path: Path to JSONL file containing PacketV2 dicts (optionally .gz / .zst)
+        workers: Number of worker processes (1 evaluates in-process)
+        suite_name: Suite identifier
+        expected_schema_minor: Expected decision-schema minor (default 2 for 0.2.x)
+        latency_backend: Latency quantile backend ("exact" or "ddsketch"), see compute_metrics
+        relative_accuracy: Relative error bound for "ddsketch"
+        percentiles: Latency percentiles to report (default p50, p95, p99)
+        calibration_bins: Confidence bins of Report.calibration_summary
+        outcome: Calibration outcome extractor (default: proposal action == final
+            action); must be picklable (a module-level function) when workers > 1
+        window: Optional window layout for Report.windows (see build_report_streaming)
+        invariant_mode: "summary", "fail_fast" or "audit" (see build_report_streaming);
+            a fail-fast worker stops at its shard's first violation, and the first
+            one in file order is raised with its offset in the whole trace
+        registry: Plugin metrics and invariants (default: the process-wide REGISTRY);
+            plugins must be picklable (module-level) when workers > 1
+        project_fields: Read only the packet fields the report needs into PacketRecord
+            instances (skips PacketV2 validation; see report_fields)
+        decoder: JSON decoder backend for PacketReader (see io/decoders.py)
+
+    Returns:
+        Report instance
+
+    Raises:
+        ValueError: If a packet is invalid (first invalid line in file order)
+        InvariantViolation: At the first violating packet in "fail_fast" mode
+    """
+    indexed = detect_compression(path) is not None
+    if indexed:
+        reader = IndexedPacketReader(path, decoder=decoder)
+    else:
+        reader = PacketReader(path, decoder=decoder)
+    decoder = reader.decoder.name
+    options = {
+        "latency_backend": latency_backend,
+        "relative_accuracy": relative_accuracy,
+        "percentiles": percentiles,
+    }
+    extra_options = {
+        "bins": calibration_bins,
+        "outcome": outcome,
+        "window": window,
+        "invariant_mode": invariant_mode,
+        "registry": REGISTRY if registry is None else registry,
+        "fields": report_fields(registry, window, outcome=outcome) if project_fields else None,
+    }
+    shards = reader.shards(workers) or [(0, 0)]
+    if workers <= 1 or len(shards) == 1:
+        partials = [
+            _evaluate_shard(reader.path, start, end, decoder, options, extra_options, indexed)
+            for start, end in shards
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            futures = [
+                pool.submit(
+                    _evaluate_shard,
+                    reader.path,
+                    start,
+                    end,
+                    decoder,
+                    options,
+                    extra_options,
+                    indexed,
+                )
+                for start, end in shards
+            ]
+            # Collect in file order so the first failing shard's error is raised
+            partials = [future.result() for future in futures]
+
+    metrics, invariants, calibration, windows = partials[0]
+    for shard_metrics, shard_invariants, shard_calibration, shard_windows in partials[1:]:
+        metrics.merge(shard_metrics)
+        invariants.merge(shard_invariants)
+        calibration.merge(shard_calibration)
+        if windows is not None:
+            windows.merge(shard_windows)
+    return _report_from_accumulators(
+        metrics, invariants, suite_name, expected_schema_minor, calibration, windows
+    )
+
+
+def _evaluate_shard(
+    path: Path,
+    start: int,
+    end: int,
+    decoder: str,
+    options: dict[str, Any],
+    extra_options: dict[str, Any],
+    indexed: bool = False,
+) -> tuple[
+    MetricsAccumulator, InvariantAccumulator, CalibrationAccumulator, WindowedMetrics | None
+]:
+    """Worker: accumulate metrics, invariants, calibration and windows over one shard."""
+    registry = extra_options["registry"]
+    metrics = MetricsAccumulator(**options, plugins=registry.metric_classes())
+    invariants = InvariantAccumulator(
+        defer_errors=True,
+        mode=extra_options["invariant_mode"],
+        checks=registry.invariant_checks(),
+    )
+    calibration = CalibrationAccumulator(extra_options["bins"], extra_options["outcome"])
+    windows = _make_windows(extra_options["window"], **options)
+    fields = extra_options["fields"]
+    if indexed:
+        packets = IndexedPacketReader(path, decoder=decoder, fields=fields).read_slice(start, end)
+    else:
+        packets = PacketReader(path, decoder=decoder, fields=fields).read_range(start, end)
+    for packet in packets:
+        metrics.update(packet)
+        invariants.update(packet)
+        calibration.update(packet)
+        if windows is not None:
+            windows.update(packet)
+        if invariants.violation is not None:
+            break  # fail-fast: the rest of the shard cannot change the outcome
+    return metrics, invariants, calibration, windows
+
+
+def build_report_columns(
+    columns: PacketColumns,
+    suite_name: str = "default",
+    expected_schema_minor: int = 2,
+    percentiles: Sequence[float | str] | None = None,
+    calibration_bins: int = DEFAULT_BINS,
+) -> Report:
+    """
+    Build a Report from a columnar packet store with vectorized metrics and invariants.
+
+    Output equals build_report over the same packets (exact latency percentiles,
+    default calibration outcome).
+
+    Args:
+        columns: PacketColumns (e.g. from ArrowPacketReader.read_columns())
+        suite_name: Suite identifier
+        expected_schema_minor: Expected decision-schema minor (default 2 for 0.2.x)
+        percentiles: Latency percentiles to report (default p50, p95, p99)
+        calibration_bins: Confidence bins of Report.calibration_summary
+
+    Returns:
+        Report instance
+    """
+    return _assemble_report(
+        suite_name,
+        expected_schema_minor,
+        total_packets=len(columns),
+        metrics=compute_metrics_columns(columns, percentiles),
+        invariant_results=check_invariants_columns(columns),
+        calibration_summary=calibration_columns(columns, calibration_bins),
+    )
+
+
+def _report_from_accumulators(
+    metrics: MetricsAccumulator,
+    invariants: InvariantAccumulator,
+    suite_name: str,
+    expected_schema_minor: int,
+    calibration: CalibrationAccumulator | None = None,
+    windows: WindowedMetrics | None = None,
+) -> Report:
+    """Finalize accumulators and attach the contract matrix check."""
+    report = _assemble_report(
+        suite_name,
+        expected_schema_minor,
+        total_packets=metrics.total_steps,
+        metrics=metrics.finalize(),
+        invariant_results=invariants.finalize(),
+        calibration_summary=calibration.finalize() if calibration is not None else None,
+    )
+    report.violations = invariants.violation_summary()
+    if windows is not None:
+        report.windows = windows.finalize()
+    return report
+
+
+def _assemble_report(
+    suite_name: str,
+    expected_schema_minor: int,
+    total_packets: int,
+    metrics: dict[str, Any],
+    invariant_results: dict[str, bool],
+    calibration_summary: dict[str, Any] | None = None,
+) -> Report:
+    """Attach the contract matrix check to computed metrics and invariant results."""
     contract_ok, contract_details = check_expected_minor_range(
         expected_major=0, min_minor=expected_schema_minor, max_minor=expected_schema_minor
     )
@@ -43,9 +516,10 @@ def build_report(
         report_version="0.1.0",
         schema_version=schema_version,
         suite_name=suite_name,
-        input_stats={"total_packets": len(packets)},
+        input_stats={"total_packets": total_packets},
         metrics=metrics,
         invariant_results=invariant_results,
+        calibration_summary=calibration_summary,
         contract_matrix_check=contract_details,
         contract_ok=contract_ok,
     )
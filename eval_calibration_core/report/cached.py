@@ -0,0 +1,131 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Content-addressed cache of finalized reports keyed by trace hash and configuration."""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from decision_schema import __version__ as schema_version
+
+from eval_calibration_core.cache import ContentCache, cache_key, file_digest
+from eval_calibration_core.registry import REGISTRY, Registry
+from eval_calibration_core.report.builder import build_report_streaming, report_fields
+from eval_calibration_core.report.model import Report
+from eval_calibration_core.version import __version__
+
+REPORT_CACHE_NAMESPACE = "reports"
+# Bump when report content changes without a package version bump
+REPORT_CACHE_VERSION = 1
+
+# Options that change how a report is computed but not what it contains
+_UNKEYED_OPTIONS = frozenset({"decoder", "profiler", "project_fields", "spill_dir", "workers"})
+
+
+def report_cache_key(
+    digest: str,
+    suite_name: str,
+    options: Mapping[str, Any],
+    registry: Registry | None = None,
+) -> str:
+    """
+    Cache key of a report: trace hash, versions, metric configuration and plugins.
+
+    Args:
+        digest: Trace hash (cache.file_digest)
+        suite_name: Report suite name
+        options: build_report keyword arguments (metric, window, invariant and
+            group options; a custom outcome is keyed by its name)
+        registry: Plugin registry (default: the process-wide REGISTRY)
+
+    Returns:
+        Hex digest (40 characters)
+    """
+    config = {
+        name: _config_value(value)
+        for name, value in options.items()
+        if name not in _UNKEYED_OPTIONS
+    }
+    return cache_key(
+        REPORT_CACHE_NAMESPACE,
+        REPORT_CACHE_VERSION,
+        __version__,
+        schema_version,
+        digest,
+        suite_name,
+        config,
+        (REGISTRY if registry is None else registry).names(),
+    )
+
+
+def _config_value(value: Any) -> Any:
+    """JSON-serializable stand-in for an option value."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if callable(value):
+        return getattr(value, "__name__", type(value).__name__)
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def build_report_cached(
+    path: Path | str,
+    cache: ContentCache | None = None,
+    suite_name: str | None = None,
+    quick: bool = False,
+    decoder: str = "auto",
+    registry: Registry | None = None,
+    project_fields: bool = False,
+    **options: Any,
+) -> Report:
+    """
+    build_report over a trace file, served from the cache when the trace is unchanged.
+
+    A hit costs one hash of the trace (or a stat() with quick) and skips
+    reading and parsing entirely. Plugin code is keyed by plugin name only:
+    clear the cache after changing a plugin's logic.
+
+    Args:
+        path: JSONL (optionally .gz / .zst), Arrow IPC or Parquet trace
+        cache: ContentCache for reports (default: default_cache_dir(), "reports")
+        suite_name: Suite name (default: the trace file stem)
+        quick: Key on the trace's path, size and mtime instead of its content
+        decoder: JSON decoder backend for JSONL traces (see io/decoders.py)
+        registry: Plugin registry (default: the process-wide REGISTRY)
+        project_fields: Read only the packet fields the report needs on a miss
+            (see report_fields)
+        **options: build_report_streaming keyword arguments
+
+    Returns:
+        Report (rebuilt from the cached document on a hit)
+
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    from eval_calibration_core.io.readers import open_packet_reader
+
+    if cache is None:
+        cache = ContentCache(namespace=REPORT_CACHE_NAMESPACE)
+    suite_name = suite_name or Path(path).stem
+    key = report_cache_key(file_digest(path, quick), suite_name, options, registry)
+    cached = cache.get(key)
+    if cached is not None:
+        return Report.from_dict(cached)
+    fields = None
+    if project_fields:
+        fields = report_fields(
+            registry, options.get("window"), options.get("group_by"), options.get("outcome")
+        )
+    report = build_report_streaming(
+        open_packet_reader(path, decoder, fields).read(),
+        suite_name=suite_name,
+        registry=registry,
+        **options,
+    )
+    cache.put(key, report.to_dict())
+    return report
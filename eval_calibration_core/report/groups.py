@@ -0,0 +1,192 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Per-group (e.g. per run_id) metrics and invariants with bounded memory."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import zlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import IO, Any
+
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
+from eval_calibration_core.suites.invariants import INVARIANT_NAMES, InvariantAccumulator
+
+# Spilled group states are hash-partitioned so finalize() loads one partition at a time
+SPILL_PARTITIONS = 64
+
+
+class GroupedAccumulator:
+    """
+    Metrics and invariants per group key, accumulated in the same pass as the report.
+
+    Each packet updates the accumulators of its group (packet attribute such
+    as run_id, or an input field); packets without a key are counted in
+    `ungrouped`. With max_groups set, at most that many groups are held in
+    memory: the least recently updated one is spilled (to_state() as a JSON
+    line in a hash-partitioned temp file) and a fresh accumulator starts if the
+    group comes back. finalize() merges each group's spilled chunks in order,
+    partition by partition, so results equal an uncapped run.
+    """
+
+    def __init__(
+        self,
+        key: str = "run_id",
+        latency_backend: str = "ddsketch",
+        relative_accuracy: float = 0.01,
+        percentiles: Sequence[float | str] | None = None,
+        max_groups: int | None = None,
+        spill_dir: Path | str | None = None,
+    ) -> None:
+        """
+        Initialize empty groups.
+
+        Args:
+            key: Packet attribute (e.g. "run_id") or input field to group by
+            latency_backend: Per-group latency estimator ("ddsketch" or "exact")
+            relative_accuracy: Relative error bound for "ddsketch"
+            percentiles: Latency percentiles per group (default p50, p95, p99)
+            max_groups: Groups held in memory before spilling (None: unbounded)
+            spill_dir: Parent directory of the spill files (default: system temp dir)
+
+        Raises:
+            ValueError: If max_groups is not positive
+        """
+        if max_groups is not None and max_groups < 1:
+            raise ValueError(f"max_groups must be positive, got {max_groups}")
+        self.key = key
+        self.options = {
+            "latency_backend": latency_backend,
+            "relative_accuracy": relative_accuracy,
+            "percentiles": percentiles,
+        }
+        self.max_groups = max_groups
+        self.spill_dir = spill_dir
+        self.groups: OrderedDict[str, tuple[MetricsAccumulator, InvariantAccumulator]] = (
+            OrderedDict()
+        )
+        self.seen: dict[str, None] = {}  # first-seen order of all group keys
+        self.ungrouped = 0
+        self.spilled = 0
+        self._spill_root: Path | None = None
+        self._spill_files: dict[int, IO[str]] = {}
+
+    def _key(self, packet: Any) -> str | None:
+        value = getattr(packet, self.key, None)
+        if value is None and isinstance(packet.input, dict):
+            value = packet.input.get(self.key)
+        return None if value is None else str(value)
+
+    def update(self, packet: Any) -> None:
+        """
+        Add one packet to its group.
+
+        Args:
+            packet: PacketV2 packet
+        """
+        key = self._key(packet)
+        if key is None:
+            self.ungrouped += 1
+            return
+        entry = self.groups.get(key)
+        if entry is None:
+            self.seen.setdefault(key, None)
+            entry = self.groups[key] = (MetricsAccumulator(**self.options), InvariantAccumulator())
+            if self.max_groups is not None and len(self.groups) > self.max_groups:
+                self._spill()
+        elif self.max_groups is not None:
+            self.groups.move_to_end(key)
+        entry[0].update(packet)
+        entry[1].update(packet)
+
+    def _spill(self) -> None:
+        """Write the least recently updated group to its spill partition."""
+        key, (metrics, invariants) = self.groups.popitem(last=False)
+        if self._spill_root is None:
+            self._spill_root = Path(tempfile.mkdtemp(prefix="eval-cal-groups-", dir=self.spill_dir))
+        partition = zlib.crc32(key.encode("utf-8")) % SPILL_PARTITIONS
+        handle = self._spill_files.get(partition)
+        if handle is None:
+            path = self._spill_root / f"{partition:02d}.jsonl"
+            # Kept open across updates; closed by close()
+            handle = open(path, "a", encoding="utf-8")  # noqa: SIM115
+            self._spill_files[partition] = handle
+        record = {"key": key, "metrics": metrics.to_state(), "invariants": invariants.to_state()}
+        handle.write(json.dumps(record) + "\n")
+        self.spilled += 1
+
+    def close(self) -> None:
+        """Remove the spill files (finalize() does this; call it when abandoning a pass)."""
+        for handle in self._spill_files.values():
+            handle.close()
+        self._spill_files.clear()
+        if self._spill_root is not None:
+            shutil.rmtree(self._spill_root, ignore_errors=True)
+            self._spill_root = None
+
+    def finalize(self) -> dict[str, Any]:
+        """
+        Produce the per-group results (Report.groups).
+
+        Returns:
+            Dict with by, count, ungrouped, max_groups, spilled, invariant_failures
+            (invariant -> number of failing groups) and groups (key -> total_packets,
+            metrics, invariant_results, in first-seen order)
+        """
+        finalized: dict[str, dict[str, Any]] = {}
+        try:
+            for handle in self._spill_files.values():
+                handle.flush()
+            for partition in sorted(self._spill_files):
+                path = self._spill_root / f"{partition:02d}.jsonl"
+                chunks: dict[str, tuple[MetricsAccumulator, InvariantAccumulator]] = {}
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        record = json.loads(line)
+                        metrics = MetricsAccumulator.from_state(record["metrics"])
+                        invariants = InvariantAccumulator.from_state(record["invariants"])
+                        if record["key"] in chunks:
+                            merged = chunks[record["key"]]
+                            merged[0].merge(metrics)
+                            merged[1].merge(invariants)
+                        else:
+                            chunks[record["key"]] = (metrics, invariants)
+                for key, (metrics, invariants) in chunks.items():
+                    latest = self.groups.pop(key, None)
+                    if latest is not None:
+                        metrics.merge(latest[0])
+                        invariants.merge(latest[1])
+                    finalized[key] = _finalize_group(metrics, invariants)
+        finally:
+            self.close()
+        for key, (metrics, invariants) in self.groups.items():
+            finalized[key] = _finalize_group(metrics, invariants)
+
+        groups = {key: finalized[key] for key in self.seen}
+        return {
+            "by": self.key,
+            "count": len(groups),
+            "ungrouped": self.ungrouped,
+            "max_groups": self.max_groups,
+            "spilled": self.spilled,
+            "invariant_failures": {
+                name: sum(not group["invariant_results"][name] for group in groups.values())
+                for name in INVARIANT_NAMES
+            },
+            "groups": groups,
+        }
+
+
+def _finalize_group(
+    metrics: MetricsAccumulator, invariants: InvariantAccumulator
+) -> dict[str, Any]:
+    return {
+        "total_packets": metrics.total_steps,
+        "metrics": metrics.finalize(),
+        "invariant_results": invariants.finalize(),
+    }
@@ -0,0 +1,248 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Incremental reports for append-only JSONL traces (persisted accumulator state)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.calibration.reliability import (
+    DEFAULT_BINS,
+    CalibrationAccumulator,
+    OutcomeFn,
+)
+from eval_calibration_core.io.indexed_reader import detect_compression
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
+from eval_calibration_core.metrics.windows import WindowedMetrics, WindowSpec
+from eval_calibration_core.registry import REGISTRY, Registry
+from eval_calibration_core.report.builder import (
+    _make_windows,
+    _report_from_accumulators,
+    report_fields,
+)
+from eval_calibration_core.report.model import Report
+from eval_calibration_core.suites.invariants import InvariantAccumulator
+
+STATE_FILENAME = "report.state.json"
+STATE_VERSION = 5
+
+_CHUNK_SIZE = 1 << 20
+
+
+def build_report_incremental(
+    path: Path | str,
+    state_path: Path | str,
+    suite_name: str = "default",
+    expected_schema_minor: int = 2,
+    latency_backend: str | None = None,
+    relative_accuracy: float = 0.01,
+    percentiles: Sequence[float | str] | None = None,
+    calibration_bins: int = DEFAULT_BINS,
+    outcome: OutcomeFn | None = None,
+    window: WindowSpec | None = None,
+    invariant_mode: str = "summary",
+    registry: Registry | None = None,
+    project_fields: bool = False,
+    decoder: str = "auto",
+) -> Report:
+    """
+    Build a Report from an append-only JSONL trace, parsing only bytes added since the last run.
+
+    The accumulator state and the byte offset consumed so far are saved in
+    state_path. On the next call, if the trace still starts with the consumed
+    bytes (BLAKE2 digest of the whole prefix, read without parsing) and the
+    metric configuration is unchanged, only the lines after that offset are
+    parsed; otherwise the trace is evaluated from the start. A trailing line
+    without a newline is included in the report if it decodes as a packet
+    (otherwise it is treated as still being written and skipped), but the saved
+    offset stops before it, so the next run reads it again whether or not it
+    has grown. The report is identical to build_report_streaming over the
+    packets read.
+
+    Args:
+        path: Path to JSONL file containing PacketV2 dicts
+        state_path: State file (conventionally <report dir>/report.state.json)
+        suite_name: Suite identifier
+        expected_schema_minor: Expected decision-schema minor (default 2 for 0.2.x)
+        latency_backend: Latency quantile backend ("exact" or "ddsketch"), see compute_metrics
+        relative_accuracy: Relative error bound for "ddsketch"
+        percentiles: Latency percentiles to report (default p50, p95, p99)
+        calibration_bins: Confidence bins of Report.calibration_summary
+        outcome: Calibration outcome extractor (default: proposal action == final
+            action); saved state is only reused for an extractor of the same name
+        window: Optional window layout for Report.windows (see build_report_streaming)
+        invariant_mode: "summary", "fail_fast" or "audit" (see build_report_streaming);
+            violation offsets count packets from the start of the trace
+        registry: Plugin metrics and invariants (default: the process-wide REGISTRY);
+            plugin metrics must implement to_state() / from_state()
+        project_fields: Read only the packet fields the report needs (see
+            build_report_parallel)
+        decoder: JSON decoder backend for PacketReader (see io/decoders.py)
+
+    Returns:
+        Report instance
+
+    Raises:
+        ValueError: If a new complete line is an invalid packet (the state file is
+            left unchanged) or the trace is compressed
+        InvariantViolation: At the first violating packet in "fail_fast" mode
+            (the state file is left unchanged)
+    """
+    if detect_compression(path) is not None:
+        raise ValueError(f"Incremental mode needs an uncompressed JSONL trace: {path}")
+    fields = report_fields(registry, window, outcome=outcome) if project_fields else None
+    reader = PacketReader(path, decoder=decoder, fields=fields)
+    state_path = Path(state_path)
+    registry = REGISTRY if registry is None else registry
+    plugins, checks = registry.metric_classes(), registry.invariant_checks()
+    metrics = MetricsAccumulator(latency_backend, relative_accuracy, percentiles, plugins)
+    calibration = CalibrationAccumulator(calibration_bins, outcome)
+    config = {
+        "latency_backend": latency_backend,
+        "relative_accuracy": relative_accuracy,
+        "percentiles": list(metrics.percentiles),
+        "calibration_bins": calibration_bins,
+        "outcome": calibration.outcome_name,
+        "window": window.to_dict() if window is not None else None,
+        "invariant_mode": invariant_mode,
+        "plugins": registry.names(),
+    }
+    invariants = InvariantAccumulator(mode=invariant_mode, checks=checks)
+    windows = _make_windows(window, latency_backend, relative_accuracy, percentiles)
+    offset = 0
+    size = reader.path.stat().st_size
+    # Running digest of the consumed prefix: checked at the saved offset, then fed
+    # the new complete lines, so each run reads the old prefix once
+    digest = hashlib.blake2b(digest_size=16)
+
+    state = _load_state(state_path)
+    try:
+        if (
+            state is not None
+            and state["config"] == config
+            and state["offset"] <= size
+            and _update_digest(digest, reader.path, 0, state["offset"]) == state["digest"]
+        ):
+            metrics = MetricsAccumulator.from_state(state["metrics"], plugins)
+            invariants = InvariantAccumulator.from_state(state["invariants"], checks)
+            calibration = CalibrationAccumulator.from_state(state["calibration"], outcome)
+            if windows is not None:
+                windows = WindowedMetrics.from_state(state["windows"])
+            offset = state["offset"]
+    except (KeyError, TypeError, ValueError):
+        # Corrupt state: fall back to a full recompute
+        metrics = MetricsAccumulator(latency_backend, relative_accuracy, percentiles, plugins)
+        invariants = InvariantAccumulator(mode=invariant_mode, checks=checks)
+        calibration = CalibrationAccumulator(calibration_bins, outcome)
+        windows = _make_windows(window, latency_backend, relative_accuracy, percentiles)
+        offset = 0
+    if not offset:
+        digest = hashlib.blake2b(digest_size=16)
+
+    end = _complete_lines_end(reader.path, offset, size)
+    accumulators = [metrics, invariants, calibration]
+    if windows is not None:
+        accumulators.append(windows)
+    for packet in reader.read_range(offset, end):
+        for accumulator in accumulators:
+            accumulator.update(packet)
+
+    # Serialized before the unterminated tail is added: the next run re-reads it
+    saved = {
+        "version": STATE_VERSION,
+        "config": config,
+        "offset": end,
+        "tail": size - end,
+        "digest": _update_digest(digest, reader.path, offset, end),
+        "metrics": metrics.to_state(),
+        "invariants": invariants.to_state(),
+        "calibration": calibration.to_state(),
+        "windows": windows.to_state() if windows is not None else None,
+    }
+    text = json.dumps(saved)
+    for packet in _read_tail(reader, end, size):
+        for accumulator in accumulators:
+            accumulator.update(packet)
+    _save_state(state_path, text)
+    return _report_from_accumulators(
+        metrics, invariants, suite_name, expected_schema_minor, calibration, windows
+    )
+
+
+def _complete_lines_end(path: Path, start: int, size: int) -> int:
+    """Offset just past the last newline in [start, size) (start if there is none)."""
+    with open(path, "rb") as f:
+        position = size
+        while position > start:
+            chunk_start = max(start, position - _CHUNK_SIZE)
+            f.seek(chunk_start)
+            newline = f.read(position - chunk_start).rfind(b"\n")
+            if newline >= 0:
+                return chunk_start + newline + 1
+            position = chunk_start
+    return start
+
+
+def _read_tail(reader: PacketReader, start: int, end: int) -> list[PacketV2]:
+    """
+    Packet on an unterminated last line in [start, end), if it decodes.
+
+    Returns:
+        The packet in a one-element list, or an empty list if there is no tail or
+        it does not decode yet (a line still being written)
+    """
+    if end <= start:
+        return []
+    try:
+        return list(reader.read_range(start, end))
+    except ValueError:
+        return []
+
+
+def _update_digest(digest: Any, path: Path, start: int, end: int) -> str:
+    """
+    Feed bytes [start, end) of path to a running BLAKE2 digest of the prefix.
+
+    Returns:
+        Hex digest of everything fed so far (any rewrite of the prefix changes it)
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(remaining, _CHUNK_SIZE))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def _load_state(state_path: Path) -> dict[str, Any] | None:
+    """Read a state file; None if missing, unreadable or from another state version."""
+    try:
+        with open(state_path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return None
+    return state
+
+
+def _save_state(state_path: Path, text: str) -> None:
+    """Write serialized state to the state file atomically (temp file + os.replace)."""
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = state_path.with_name(f"{state_path.name}.tmp{os.getpid()}")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, state_path)
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: MIT
 """Report data model."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 
@@ -25,6 +25,11 @@ class Report:
     explanation: dict[str, Any] | None = (
         None  # Optional; set by harness when explainability-audit-core is used
     )
+    perf: dict[str, Any] | None = None  # Optional; per-stage timings when run with --profile
+    drift: dict[str, Any] | None = None  # Optional; set by the drift command (vs a baseline trace)
+    windows: dict[str, Any] | None = None  # Optional; per-window time series when a window is set
+    violations: dict[str, Any] | None = None  # Optional; violating packet offsets in audit mode
+    groups: dict[str, Any] | None = None  # Optional; per-group results when grouped (group_by)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -45,4 +50,20 @@ class Report:
             result["contract_ok"] = self.contract_ok
         if self.explanation is not None:
             result["explanation"] = self.explanation
+        if self.perf is not None:
+            result["perf"] = self.perf
+        if self.drift is not None:
+            result["drift"] = self.drift
+        if self.windows is not None:
+            result["windows"] = self.windows
+        if self.violations is not None:
+            result["violations"] = self.violations
+        if self.groups is not None:
+            result["groups"] = self.groups
         return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Report":
+        """Rebuild a report from to_dict() output (e.g. a cached report.json)."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
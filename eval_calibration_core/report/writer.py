@@ -3,37 +3,215 @@
 # SPDX-License-Identifier: MIT
 """Write reports to JSON and Markdown."""
 
+from __future__ import annotations
+
+import gzip
+import io
 import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, TextIO
 
+from eval_calibration_core.registry import RESERVED_NAMES
 from eval_calibration_core.report.model import Report
 
+# Windows listed in report.md (report.json has all of them)
+MAX_WINDOW_ROWS = 100
+
+# Groups listed in report.md (report.json has all of them)
+MAX_GROUP_ROWS = 100
+
+# Full --profile measurements, written after the report (see write_perf)
+PERF_FILENAME = "perf.json"
+
+# report.json suffix per output compression
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+_BUFFER = 1 << 20
+
+# Compact report.json: nesting levels written entry by entry, list items per write
+_STREAM_DEPTH = 4
+_LIST_CHUNK = 1 << 10
+
 
-def write_report(report: Report, output_dir: Path | str) -> None:
+def write_report(
+    report: Report,
+    output_dir: Path | str,
+    compact: bool = False,
+    compression: str | None = None,
+) -> Path:
     """
     Write report to JSON and Markdown files.
 
+    Both files are written to a temporary file in output_dir and moved into
+    place with os.replace, so readers never see a partially written report.
+
     Args:
         report: Report instance
         output_dir: Output directory path
+        compact: Write report.json without indentation, streaming nested sections
+            entry by entry (with orjson when installed); the document is the same
+        compression: "gzip" or "zstd" to write report.json.gz / report.json.zst
+
+    Returns:
+        Path of the JSON report
+
+    Raises:
+        ValueError: If compression is unknown
+        ImportError: If compression is "zstd" and zstandard is not installed
     """
+    if compression is not None and compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(
+            f"Unknown report compression: {compression}. Available: {list(COMPRESSION_SUFFIXES)}"
+        )
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Write JSON
-    json_path = output_dir / "report.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(report.to_dict(), f, indent=2)
+    json_path = output_dir / ("report.json" + COMPRESSION_SUFFIXES.get(compression, ""))
+    with _atomic_open(json_path, compression) as f:
+        if compact:
+            _write_compact_json(f, report.to_dict())
+        else:
+            json.dump(report.to_dict(), f, indent=2)
 
     # Write Markdown
-    md_path = output_dir / "report.md"
-    with open(md_path, "w", encoding="utf-8") as f:
-        f.write(_format_markdown(report))
+    with _atomic_open(output_dir / "report.md") as f:
+        _write_lines(f, _iter_markdown(report))
+    return json_path
+
+
+def write_perf(perf: dict[str, Any], output_dir: Path | str) -> Path:
+    """
+    Write a Report.perf block to perf.json next to the report.
+
+    report.json cannot time its own write; the CLI writes the complete
+    measurements, write_report stage included, here once the report is written.
+
+    Args:
+        perf: Profiler.to_dict()
+        output_dir: Output directory path
+
+    Returns:
+        Path of perf.json
+    """
+    path = Path(output_dir) / PERF_FILENAME
+    with _atomic_open(path) as f:
+        json.dump(perf, f, indent=2)
+    return path
+
+
+@contextmanager
+def _atomic_open(path: Path, compression: str | None = None) -> Iterator[TextIO]:
+    """Text file that replaces path only once it has been written completely."""
+    tmp = path.with_name(f".{path.name}.tmp{os.getpid()}")
+    try:
+        with _open_text(tmp, compression) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _open_text(path: Path, compression: str | None) -> TextIO:
+    """UTF-8 text file for writing, optionally gzip or zstd compressed."""
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd reports require zstandard: pip install evaluation-calibration-core[zstd]"
+            ) from e
+        raw = open(path, "wb")  # noqa: SIM115 - closed with the returned stream writer
+        return io.TextIOWrapper(zstandard.ZstdCompressor().stream_writer(raw), encoding="utf-8")
+    return open(path, "w", encoding="utf-8", buffering=_BUFFER)
+
+
+def _write_compact_json(f: TextIO, data: dict[str, Any]) -> None:
+    """Write a dict without whitespace, streaming nested sections entry by entry."""
+    _write_compact_value(f, data, _compact_dumps(), 0)
+
+
+def _write_compact_value(f: TextIO, value: Any, dumps: Callable[[Any], str], depth: int) -> None:
+    """
+    Write one JSON value. Dicts are written key by key and lists in slices of
+    _LIST_CHUNK items down to _STREAM_DEPTH, so no string holds a whole section
+    (windows, groups, violation runs); deeper values are serialized whole.
+    """
+    if depth < _STREAM_DEPTH and isinstance(value, dict):
+        f.write("{")
+        for i, (key, item) in enumerate(value.items()):
+            if i:
+                f.write(",")
+            # Non-string keys are converted the way json.dump converts them
+            f.write(json.dumps(key if isinstance(key, str) else json.dumps(key)))
+            f.write(":")
+            _write_compact_value(f, item, dumps, depth + 1)
+        f.write("}")
+    elif depth < _STREAM_DEPTH and isinstance(value, (list, tuple)):
+        f.write("[")
+        for start in range(0, len(value), _LIST_CHUNK):
+            if start:
+                f.write(",")
+            f.write(dumps(value[start : start + _LIST_CHUNK])[1:-1])
+        f.write("]")
+    else:
+        f.write(dumps(value))
+
+
+def _compact_dumps() -> Callable[[Any], str]:
+    """
+    orjson-backed compact serializer, or stdlib json without whitespace.
+
+    orjson writes NaN and Infinity as null (and rejects integers beyond 64 bits),
+    so values whose orjson output holds a null are serialized again with stdlib
+    json: compact and indented reports are the same document.
+    """
+
+    def stdlib_dumps(value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+    try:
+        import orjson
+    except ImportError:
+        return stdlib_dumps
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def orjson_dumps(value: Any) -> str:
+        try:
+            data = orjson.dumps(value, option=options)
+        except orjson.JSONEncodeError:
+            return stdlib_dumps(value)
+        if b"null" in data:
+            return stdlib_dumps(value)
+        return data.decode("utf-8")
+
+    return orjson_dumps
+
+
+def _write_lines(f: TextIO, lines: Iterable[str]) -> None:
+    """Write lines separated by newlines (no trailing newline), as they are produced."""
+    first = True
+    for line in lines:
+        if not first:
+            f.write("\n")
+        f.write(line)
+        first = False
 
 
 def _format_markdown(report: Report) -> str:
     """Format report as Markdown."""
-    lines = [
+    return "\n".join(_iter_markdown(report))
+
+
+def _iter_markdown(report: Report) -> Iterator[str]:
+    """Report Markdown, one line at a time (no trailing newline after the last)."""
+    yield from [
         "# Evaluation Report",
         "",
         f"**Report Version**: {report.report_version}",
@@ -45,66 +223,254 @@ def _format_markdown(report: Report) -> str:
     ]
 
     for key, value in report.input_stats.items():
-        lines.append(f"- **{key}**: {value}")
+        yield f"- **{key}**: {value}"
 
-    lines.extend(["", "## Metrics", ""])
+    yield from (["", "## Metrics", ""])
 
     # Action distribution
     if "action_distribution" in report.metrics:
-        lines.append("### Action Distribution")
-        lines.append("")
+        yield "### Action Distribution"
+        yield ""
         for action, count in report.metrics["action_distribution"].items():
-            lines.append(f"- {action}: {count}")
-        lines.append("")
+            yield f"- {action}: {count}"
+        yield ""
 
     # Guard trigger rate
     if "guard_trigger_rates" in report.metrics:
-        lines.append("### Guard Trigger Rates")
-        lines.append("")
+        yield "### Guard Trigger Rates"
+        yield ""
         for code, rate in report.metrics["guard_trigger_rates"].items():
-            lines.append(f"- {code}: {rate:.3f}")
-        lines.append("")
+            yield f"- {code}: {rate:.3f}"
+        yield ""
 
     # Safety invariant
     if "safety_invariant_pass_rate" in report.metrics:
         pass_rate = report.metrics["safety_invariant_pass_rate"]
-        lines.append(f"### Safety Invariant Pass Rate: {pass_rate:.3f}")
-        lines.append("")
+        yield f"### Safety Invariant Pass Rate: {pass_rate:.3f}"
+        yield ""
 
     # Latency
     if "latency_percentiles" in report.metrics:
         lat = report.metrics["latency_percentiles"]
-        lines.append("### Latency Percentiles")
-        lines.append(f"- p50: {lat.get('p50', 0):.1f}ms")
-        lines.append(f"- p95: {lat.get('p95', 0):.1f}ms")
-        lines.append(f"- p99: {lat.get('p99', 0):.1f}ms")
-        lines.append("")
+        yield "### Latency Percentiles"
+        for key, value in lat.items():
+            yield f"- {key}: {value:.1f}ms"
+        estimator = report.metrics.get("latency_estimator")
+        if estimator:
+            yield (
+                f"- backend: {estimator['backend']} "
+                f"(relative error <= {estimator['relative_accuracy']:g})"
+            )
+        yield ""
+
+    # Plugin metrics (registry.py)
+    for name, value in report.metrics.items():
+        if name in RESERVED_NAMES:
+            continue
+        if isinstance(value, dict):
+            yield f"### {name}"
+            yield ""
+            for key, item in value.items():
+                yield f"- {key}: {_format_value(item)}"
+        else:
+            yield f"### {name}: {_format_value(value)}"
+        yield ""
 
     # Contract Matrix Check
     if report.contract_matrix_check:
         check = report.contract_matrix_check
         ok = check.get("compatible", False)
         status = "✅ PASS" if ok else "❌ FAIL"
-        lines.append("## Contract Matrix Check")
-        lines.append("")
-        lines.append(f"**Status**: {status}")
-        lines.append(f"**Schema Version**: {check.get('schema_version', 'unknown')}")
-        lines.append(
+        yield "## Contract Matrix Check"
+        yield ""
+        yield f"**Status**: {status}"
+        yield f"**Schema Version**: {check.get('schema_version', 'unknown')}"
+        yield (
             f"**Expected Range**: {check.get('expected_major', 0)}.{check.get('min_minor', 2)}.{check.get('max_minor', 2)}"
         )
-        lines.append("")
-        lines.append(
+        yield ""
+        yield (
             "> See `ECOSYSTEM_CONTRACT_MATRIX.md` in decision-schema repo for version compatibility details."
         )
-        lines.append("")
+        yield ""
 
     # Invariants
     if report.invariant_results:
-        lines.append("## Invariant Results")
-        lines.append("")
+        yield "## Invariant Results"
+        yield ""
         for name, passed in report.invariant_results.items():
             status = "✅ PASS" if passed else "❌ FAIL"
-            lines.append(f"- {name}: {status}")
-        lines.append("")
+            yield f"- {name}: {status}"
+        yield ""
+
+    # Violations (optional, --audit)
+    if report.violations:
+        yield "## Invariant Violations"
+        yield ""
+        yield f"**Packets audited**: {report.violations['packets']}"
+        yield ""
+        yield "| Invariant | Violations | First (step) | Last (step) | Runs |"
+        yield "|-----------|-----------:|-------------:|------------:|-----:|"
+        for name, entry in report.violations["invariants"].items():
+            if not entry["count"]:
+                yield f"| {name} | 0 | - | - | 0 |"
+                continue
+            runs = f"{len(entry['runs'])}{'+' if entry['truncated'] else ''}"
+            yield (
+                f"| {name} | {entry['count']} | {entry['first']} ({entry['first_step']}) | "
+                f"{entry['last']} ({entry['last_step']}) | {runs} |"
+            )
+        yield ""
+
+    # Calibration
+    if report.calibration_summary and report.calibration_summary.get("samples"):
+        cal = report.calibration_summary
+        yield "## Calibration"
+        yield ""
+        yield f"- **outcome**: {cal['outcome']}"
+        yield f"- **samples**: {cal['samples']} ({cal['skipped']} skipped)"
+        yield f"- **ECE**: {cal['ece']:.4f}"
+        yield f"- **MCE**: {cal['mce']:.4f}"
+        yield f"- **Brier score**: {cal['brier_score']:.4f}"
+        yield ""
+        yield "| Bin | Count | Mean confidence | Accuracy |"
+        yield "|-----|------:|----------------:|---------:|"
+        for entry in cal["reliability"]:
+            if not entry["count"]:
+                continue
+            yield (
+                f"| [{entry['lower']:.2f}, {entry['upper']:.2f}) | {entry['count']} | "
+                f"{entry['mean_confidence']:.3f} | {entry['accuracy']:.3f} |"
+            )
+        yield ""
+        fitted = cal.get("calibrators")
+        if fitted:
+            yield "### Fitted Calibrators"
+            yield ""
+            if fitted.get("trace_digest"):
+                yield f"**Trace**: `{fitted['trace_digest']}`"
+                yield ""
+            yield "| Method | Brier score |"
+            yield "|--------|------------:|"
+            for method, fit in fitted["fits"].items():
+                brier = fit["brier_score"]
+                yield f"| {method} | {f'{brier:.4f}' if brier is not None else '-'} |"
+            yield ""
+
+    # Windows (optional, --window)
+    if report.windows:
+        windows = report.windows
+        percentile_keys = list(windows["latency_percentiles"])
+        yield "## Windows"
+        yield ""
+        yield (
+            f"**Key**: {windows['key']}, **size**: {windows['size']:g}, "
+            f"**step**: {windows['step']:g} ({len(windows['start'])} windows, "
+            f"{windows['unkeyed']} packets without key)"
+        )
+        yield ""
+        yield (
+            "| Start | Packets | Safety pass rate | "
+            + " | ".join(f"{key} (ms)" for key in percentile_keys)
+            + " |"
+        )
+        yield "|------:|--------:|-----------------:|" + "-----:|" * len(percentile_keys)
+        shown = min(len(windows["start"]), MAX_WINDOW_ROWS)
+        for i in range(shown):
+            latencies = " | ".join(
+                f"{windows['latency_percentiles'][key][i]:.1f}" for key in percentile_keys
+            )
+            yield (
+                f"| {windows['start'][i]:g} | {windows['total_steps'][i]} | "
+                f"{windows['safety_invariant_pass_rate'][i]:.3f} | {latencies} |"
+            )
+        if shown < len(windows["start"]):
+            yield ""
+            yield f"_{len(windows['start']) - shown} more windows in report.json_"
+        yield ""
+
+    # Groups (optional, --group-by)
+    if report.groups:
+        groups = report.groups
+        yield "## Groups"
+        yield ""
+        yield (
+            f"**By**: {groups['by']} ({groups['count']} groups, "
+            f"{groups['ungrouped']} packets without key)"
+        )
+        failures = {name: n for name, n in groups["invariant_failures"].items() if n}
+        if failures:
+            yield (
+                "**Failing groups**: " + ", ".join(f"{name}: {n}" for name, n in failures.items())
+            )
+        yield ""
+        yield "| Group | Packets | Safety pass rate | Failed invariants |"
+        yield "|-------|--------:|-----------------:|-------------------|"
+        for i, (key, group) in enumerate(groups["groups"].items()):
+            if i == MAX_GROUP_ROWS:
+                yield ""
+                yield f"_{groups['count'] - i} more groups in report.json_"
+                break
+            failed = [name for name, passed in group["invariant_results"].items() if not passed]
+            yield (
+                f"| {key} | {group['total_packets']} | "
+                f"{group['metrics']['safety_invariant_pass_rate']:.3f} | "
+                f"{', '.join(failed) or '-'} |"
+            )
+        yield ""
+
+    # Drift (optional, drift command)
+    if report.drift:
+        drift = report.drift
+        verdict = ", ".join(drift["drifted"]) or "none"
+        yield "## Drift"
+        yield ""
+        yield f"**Baseline**: {drift['baseline']} ({drift['packets']['baseline']} packets)"
+        yield f"**Candidate**: {drift['candidate']} ({drift['packets']['candidate']} packets)"
+        yield f"**Drifted** (alpha {drift['alpha']:g}): {verdict}"
+        yield ""
+        yield "| Section | Test | Statistic | p-value | PSI |"
+        yield "|---------|------|----------:|--------:|----:|"
+        for name in ("action_distribution", "confidence"):
+            section = drift[name]
+            test = section["chi_square"]
+            yield (
+                f"| {name} | chi-square ({test['dof']} dof) | {test['statistic']:.3f} | "
+                f"{test['p_value']:.4f} | {section['psi']:.4f} |"
+            )
+        ks = drift["latency"]["ks"]
+        yield f"| latency | KS | {ks['statistic']:.4f} | {ks['p_value']:.4f} | - |"
+        yield ""
+        codes = drift["guard_trigger_rates"]["codes"]
+        if codes:
+            yield "| Guard code | Baseline | Candidate | Delta | p-value |"
+            yield "|------------|---------:|----------:|------:|--------:|"
+            for code, entry in codes.items():
+                yield (
+                    f"| {code} | {entry['baseline']:.3f} | {entry['candidate']:.3f} | "
+                    f"{entry['delta']:+.3f} | {entry['p_value']:.4f} |"
+                )
+            yield ""
+
+    # Performance (optional, --profile)
+    if report.perf:
+        yield "## Performance"
+        yield ""
+        yield "| Stage | Wall (s) | CPU (s) | Packets/s | Peak traced (MB) |"
+        yield "|-------|---------:|--------:|----------:|-----------------:|"
+        for name, stage in report.perf.get("stages", {}).items():
+            rate = stage.get("packets_per_s")
+            peak = stage.get("peak_traced_mb")
+            yield (
+                f"| {name} | {stage['wall_s']:.3f} | {stage['cpu_s']:.3f} | "
+                f"{f'{rate:,.0f}' if rate is not None else '-'} | "
+                f"{f'{peak:.1f}' if peak is not None else '-'} |"
+            )
+        yield ""
+
 
-    return "\n".join(lines)
+def _format_value(value: object) -> str:
+    """Markdown text of a plugin metric value."""
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
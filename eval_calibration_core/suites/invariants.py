@@ -3,83 +3,357 @@
 # SPDX-License-Identifier: MIT
 """Invariant checks."""
 
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
 from decision_schema.packet_v2 import PacketV2
 from decision_schema.types import Action
 
+from eval_calibration_core.io.columns import PacketColumns
+from eval_calibration_core.metrics import vectorized
+from eval_calibration_core.suites.violations import (
+    DEFAULT_MAX_RUNS,
+    INVARIANT_MODES,
+    InvariantViolation,
+    ViolationRuns,
+)
+
+INVARIANT_NAMES = ("contract_closure", "confidence_clamp", "fail_closed", "packet_version")
+
+# Action enum values, built once at import (contract_closure membership test)
+ACTION_VALUES = frozenset(a.value for a in Action)
 
-def check_invariants(packets: list[PacketV2]) -> dict[str, bool]:
+
+def check_invariants(packets: Iterable[PacketV2]) -> dict[str, bool]:
     """
-    Check mathematical invariants on packets.
+    Check mathematical invariants on packets in a single pass.
 
     Returns:
         Dict mapping invariant name -> pass (True) or fail (False)
     """
-    results = {
-        "contract_closure": _check_contract_closure(packets),
-        "confidence_clamp": _check_confidence_clamp(packets),
-        "fail_closed": _check_fail_closed(packets),
-        "packet_version": _check_packet_version(packets),
+    accumulator = InvariantAccumulator()
+    for packet in packets:
+        accumulator.update(packet)
+    return accumulator.finalize()
+
+
+def check_invariants_columns(columns: PacketColumns) -> dict[str, bool]:
+    """
+    Check mathematical invariants on a columnar packet store with vectorized kernels.
+
+    Returns:
+        Dict mapping invariant name -> pass (True) or fail (False), identical to
+        check_invariants over the same packets
+    """
+    valid_final = {
+        code for code, a in enumerate(columns.final_actions.values) if a in ACTION_VALUES
+    }
+    valid_mdm = {code for code, a in enumerate(columns.mdm_actions.values) if a in ACTION_VALUES}
+    return {
+        "contract_closure": vectorized.all_in(columns.mdm_action, valid_mdm)
+        and vectorized.all_in(columns.final_action, valid_final),
+        "confidence_clamp": vectorized.all_within_unit_interval(columns.confidence),
+        "fail_closed": not vectorized.any_fail_open(
+            columns.allowed,
+            columns.has_flags,
+            columns.mismatch_present,
+            columns.fail_closed_marker,
+        ),
+        "packet_version": vectorized.count_nonzero(columns.schema_version_ok) == len(columns),
     }
-    return results
 
 
-def _check_contract_closure(packets: list[PacketV2]) -> bool:
+class InvariantAccumulator:
+    """
+    Accumulate all invariant results in one pass over PacketV2 packets.
+
+    In the default "summary" mode each invariant short-circuits independently:
+    once it has failed, it is no longer evaluated for later packets (same
+    semantics as checking each invariant over the whole list and stopping at
+    its first failure). Two modes localize violations by packet offset:
+    "fail_fast" raises InvariantViolation at the first violating packet, and
+    "audit" checks every packet against every invariant and records the
+    violating offsets as ViolationRuns (see violation_summary()). Plugin
+    checks (see registry.py) are evaluated after the built-in invariants with
+    the same semantics.
+    """
+
+    def __init__(
+        self,
+        defer_errors: bool = False,
+        mode: str = "summary",
+        max_runs: int = DEFAULT_MAX_RUNS,
+        checks: Mapping[str, Callable[[Any], bool]] | None = None,
+    ) -> None:
+        """
+        Initialize with all invariants passing.
+
+        Args:
+            defer_errors: If True, an exception raised while checking an invariant
+                is stored instead of raised, and re-raised by finalize(). Used by
+                shard workers so that merge() can drop errors a serial run would
+                never have reached (the invariant already failed in an earlier shard).
+                In "fail_fast" mode the first violation is deferred the same way.
+            mode: "summary", "fail_fast" or "audit"
+            max_runs: Violation runs stored per invariant in "audit" mode
+            checks: Plugin invariant name -> per-packet check (Registry.invariant_checks())
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        if mode not in INVARIANT_MODES:
+            raise ValueError(
+                f"Unknown invariant mode: {mode!r} (expected one of {INVARIANT_MODES})"
+            )
+        self.checks = dict(checks or {})
+        self.names = INVARIANT_NAMES + tuple(self.checks)
+        self.results: dict[str, bool] = {name: True for name in self.names}
+        self.errors: dict[str, Exception] = {}
+        self.defer_errors = defer_errors
+        self.mode = mode
+        self.packets = 0  # packets seen, counted outside "summary" mode
+        self.violation: InvariantViolation | None = None
+        self.violations = {name: ViolationRuns(max_runs) for name in self.names}
+
+    def update(self, packet: PacketV2) -> None:
+        """
+        Check one packet against every invariant that has not failed yet.
+
+        Args:
+            packet: PacketV2 packet
+        """
+        if self.mode != "summary":
+            self._update_localized(packet)
+            return
+        if self.defer_errors:
+            self._update_deferred(packet)
+            return
+        results = self.results
+        if results["contract_closure"] and not _check_contract_closure(packet, ACTION_VALUES):
+            results["contract_closure"] = False
+        if results["confidence_clamp"] and not _check_confidence_clamp(packet):
+            results["confidence_clamp"] = False
+        if results["fail_closed"] and not _check_fail_closed(packet):
+            results["fail_closed"] = False
+        if results["packet_version"] and not _check_packet_version(packet):
+            results["packet_version"] = False
+        for name, check in self.checks.items():
+            if results[name] and not check(packet):
+                results[name] = False
+
+    def _update_deferred(self, packet: PacketV2) -> None:
+        for name in self.names:
+            if not self.results[name] or name in self.errors:
+                continue
+            try:
+                passed = self._check(name, packet)
+            except Exception as e:  # noqa: BLE001 - re-raised by finalize()
+                self.errors[name] = e
+                continue
+            if not passed:
+                self.results[name] = False
+
+    def _update_localized(self, packet: PacketV2) -> None:
+        index = self.packets
+        self.packets += 1
+        if self.violation is not None:
+            return
+        for name in self.names:
+            if name in self.errors:
+                continue
+            try:
+                passed = self._check(name, packet)
+            except Exception as e:
+                if not self.defer_errors:
+                    raise
+                self.errors[name] = e
+                continue
+            if passed:
+                continue
+            self.results[name] = False
+            if self.mode == "audit":
+                self.violations[name].add(index, packet.step)
+                continue
+            violation = InvariantViolation(name, index, packet.step, packet.run_id)
+            if not self.defer_errors:
+                raise violation
+            self.violation = violation
+            return
+
+    def _check(self, name: str, packet: PacketV2) -> bool:
+        check = self.checks.get(name)
+        if check is not None:
+            return check(packet)
+        if name == "contract_closure":
+            return _check_contract_closure(packet, ACTION_VALUES)
+        if name == "confidence_clamp":
+            return _check_confidence_clamp(packet)
+        if name == "fail_closed":
+            return _check_fail_closed(packet)
+        return _check_packet_version(packet)
+
+    def merge(self, other: InvariantAccumulator) -> InvariantAccumulator:
+        """
+        Merge the accumulator of the following packets into this one.
+
+        An invariant passes only if it passes in both. An invariant that already
+        failed (or errored) here is not affected by other, which preserves the
+        per-invariant short-circuit of a serial run.
+
+        Args:
+            other: Accumulator over the packets that follow this one's
+
+        In "fail_fast" mode the earlier violation wins; in "audit" mode other's
+        violation offsets are shifted past this accumulator's packets.
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If the modes differ
+        """
+        if other.mode != self.mode:
+            raise ValueError(f"Cannot merge {other.mode!r} invariants into {self.mode!r}")
+        # Errors stay in packet order; a serial run raises at the first one. Nothing
+        # after a fail-fast violation is evaluated, and a summary invariant that
+        # already failed is no longer checked (audit keeps checking).
+        if self.violation is None:
+            for name, error in other.errors.items():
+                if name in self.errors or (self.mode == "summary" and not self.results[name]):
+                    continue
+                self.errors[name] = error
+        for name in self.names:
+            if self.mode == "audit" and name not in self.errors:
+                self.violations[name].merge(other.violations[name], self.packets)
+            if self.results[name] and name not in self.errors:
+                self.results[name] = other.results[name]
+        if self.violation is None and other.violation is not None:
+            self.violation = other.violation.shifted(self.packets)
+        self.packets += other.packets
+        return self
+
+    def to_state(self) -> dict[str, Any]:
+        """
+        JSON-serializable state, restorable with from_state().
+
+        Raises:
+            RuntimeError: If a deferred check error is pending (errors are not persisted)
+        """
+        if self.errors or self.violation is not None:
+            raise RuntimeError("Cannot persist invariant state with pending check errors")
+        state: dict[str, Any] = {"results": dict(self.results)}
+        if self.mode != "summary":
+            state["mode"] = self.mode
+            state["packets"] = self.packets
+            if self.mode == "audit":
+                state["violations"] = {
+                    name: runs.to_state() for name, runs in self.violations.items()
+                }
+        return state
+
+    @classmethod
+    def from_state(
+        cls,
+        state: dict[str, Any],
+        checks: Mapping[str, Callable[[Any], bool]] | None = None,
+    ) -> InvariantAccumulator:
+        """Restore an accumulator saved with to_state() (checks: as passed to __init__)."""
+        accumulator = cls(mode=state.get("mode", "summary"), checks=checks)
+        for name in accumulator.names:
+            accumulator.results[name] = bool(state["results"][name])
+        accumulator.packets = state.get("packets", 0)
+        if "violations" in state:
+            accumulator.violations = {
+                name: ViolationRuns.from_state(state["violations"][name])
+                for name in accumulator.names
+            }
+        return accumulator
+
+    def finalize(self) -> dict[str, bool]:
+        """
+        Produce the invariant results.
+
+        Returns:
+            Dict mapping invariant name -> pass (True) or fail (False)
+
+        Raises:
+            Exception: The first deferred check error in packet order, if any (see
+                defer_errors); errors recorded before a fail-fast violation precede it
+            InvariantViolation: The deferred first violation in "fail_fast" mode
+        """
+        if self.errors:
+            raise next(iter(self.errors.values()))
+        if self.violation is not None:
+            raise self.violation
+        return dict(self.results)
+
+    def violation_summary(self) -> dict[str, Any] | None:
+        """
+        Produce the violation audit (Report.violations).
+
+        Returns:
+            Dict with mode, packets and invariants (name -> ViolationRuns.finalize()),
+            or None outside "audit" mode
+        """
+        if self.mode != "audit":
+            return None
+        return {
+            "mode": self.mode,
+            "packets": self.packets,
+            "invariants": {name: runs.finalize() for name, runs in self.violations.items()},
+        }
+
+
+def _check_contract_closure(packet: PacketV2, valid_actions: frozenset[str]) -> bool:
     """Check: Proposal.action and FinalDecision.action must be in Action enum."""
-    valid_actions = {a.value for a in Action}
-    for packet in packets:
-        mdm_action = packet.mdm.get("action")
-        final_action = packet.final_action.get("action")
-        if mdm_action not in valid_actions or final_action not in valid_actions:
-            return False
-    return True
+    mdm_action = packet.mdm.get("action")
+    final_action = packet.final_action.get("action")
+    return mdm_action in valid_actions and final_action in valid_actions
 
 
-def _check_confidence_clamp(packets: list[PacketV2]) -> bool:
+def _check_confidence_clamp(packet: PacketV2) -> bool:
     """Check: Proposal.confidence must be within [0,1]."""
-    for packet in packets:
-        confidence = packet.mdm.get("confidence")
-        if confidence is not None:
-            if not 0.0 <= confidence <= 1.0:
-                return False
+    confidence = packet.mdm.get("confidence")
+    if confidence is not None:
+        if not 0.0 <= confidence <= 1.0:
+            return False
     return True
 
 
-def _check_fail_closed(packets: list[PacketV2]) -> bool:
+def _check_fail_closed(packet: PacketV2) -> bool:
     """
     Check fail-closed invariants:
     1. If mismatch contains deny flags => allowed must be False
     2. If allowed=False and mismatch is None => external must have fail_closed marker
     """
-    for packet in packets:
-        final_action = packet.final_action
-        mismatch = packet.mismatch
-        external = packet.external
+    final_action = packet.final_action
+    mismatch = packet.mismatch
+    external = packet.external
 
-        allowed = final_action.get("allowed", True)
-        has_deny_flags = mismatch is not None and mismatch.get("flags", [])
+    allowed = final_action.get("allowed", True)
+    has_deny_flags = mismatch is not None and mismatch.get("flags", [])
 
-        # Invariant 1: Fail-closed: if deny flags exist, action must not be allowed
-        if has_deny_flags and allowed:
-            return False
+    # Invariant 1: Fail-closed: if deny flags exist, action must not be allowed
+    if has_deny_flags and allowed:
+        return False
 
-        # Invariant 2 (F8): If allowed=False and mismatch is None, must have fail_closed marker
-        # This covers harness exception path (run_one_step catches exception)
-        if not allowed and mismatch is None:
-            # Check for any fail_closed marker (harness.fail_closed, ops.fail_closed, etc.)
-            if external is None:
-                return False  # Missing external dict entirely
-            has_fail_closed = any(
-                isinstance(key, str) and (key.endswith(".fail_closed") or key == "fail_closed")
-                for key in external.keys()
-            )
-            if not has_fail_closed:
-                return False
+    # Invariant 2 (F8): If allowed=False and mismatch is None, must have fail_closed marker
+    # This covers harness exception path (run_one_step catches exception)
+    if not allowed and mismatch is None:
+        # Check for any fail_closed marker (harness.fail_closed, ops.fail_closed, etc.)
+        if external is None:
+            return False  # Missing external dict entirely
+        has_fail_closed = any(
+            isinstance(key, str) and (key.endswith(".fail_closed") or key == "fail_closed")
+            for key in external.keys()
+        )
+        if not has_fail_closed:
+            return False
     return True
 
 
-def _check_packet_version(packets: list[PacketV2]) -> bool:
+def _check_packet_version(packet: PacketV2) -> bool:
     """Check: PacketV2 has schema_version present."""
-    for packet in packets:
-        if not packet.schema_version:
-            return False
-    return True
+    return bool(packet.schema_version)
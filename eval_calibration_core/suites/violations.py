@@ -0,0 +1,145 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Invariant violation localization: fail-fast error and run-length encoded audit."""
+
+from __future__ import annotations
+
+from typing import Any
+
+INVARIANT_MODES = ("summary", "fail_fast", "audit")
+
+# Runs of consecutive violating packets kept per invariant (counts stay exact beyond it)
+DEFAULT_MAX_RUNS = 1000
+
+
+class InvariantViolation(Exception):
+    """Raised in "fail_fast" mode at the first packet that violates an invariant."""
+
+    def __init__(self, invariant: str, index: int, step: Any = None, run_id: Any = None) -> None:
+        """
+        Initialize violation.
+
+        Args:
+            invariant: Violated invariant name
+            index: 0-based packet offset in the trace
+            step: The packet's step
+            run_id: The packet's run_id
+        """
+        super().__init__(invariant, index, step, run_id)
+        self.invariant = invariant
+        self.index = index
+        self.step = step
+        self.run_id = run_id
+
+    def __str__(self) -> str:
+        return (
+            f"Invariant {self.invariant} violated at packet {self.index} "
+            f"(run_id={self.run_id}, step={self.step})"
+        )
+
+    def shifted(self, offset: int) -> InvariantViolation:
+        """The same violation with its packet offset moved by offset (shard merge)."""
+        return InvariantViolation(self.invariant, self.index + offset, self.step, self.run_id)
+
+
+class ViolationRuns:
+    """
+    Packet offsets violating one invariant, as run-length encoded [start, length] pairs.
+
+    Offsets arrive in increasing order, so a violation either extends the last
+    run or opens a new one. At most max_runs runs are stored; past that the
+    offsets are dropped (`truncated`) while count, first and last stay exact,
+    which bounds the report size however many packets fail.
+    """
+
+    def __init__(self, max_runs: int = DEFAULT_MAX_RUNS) -> None:
+        """
+        Initialize with no violations.
+
+        Args:
+            max_runs: Runs to store before truncating
+        """
+        self.max_runs = max_runs
+        self.runs: list[list[int]] = []
+        self.count = 0
+        self.first: int | None = None
+        self.last: int | None = None
+        self.first_step: Any = None
+        self.last_step: Any = None
+        self.truncated = False
+
+    def add(self, index: int, step: Any = None) -> None:
+        """
+        Record a violating packet.
+
+        Args:
+            index: 0-based packet offset, greater than any offset added before
+            step: The packet's step
+        """
+        if self.first is None:
+            self.first, self.first_step = index, step
+        self.last, self.last_step = index, step
+        self.count += 1
+        self._append(index, 1)
+
+    def _append(self, start: int, length: int) -> None:
+        runs = self.runs
+        if runs and runs[-1][0] + runs[-1][1] == start:
+            runs[-1][1] += length
+        elif len(runs) < self.max_runs:
+            runs.append([start, length])
+        else:
+            self.truncated = True
+
+    def merge(self, other: ViolationRuns, offset: int) -> ViolationRuns:
+        """
+        Append the violations of the following packets; returns self.
+
+        Args:
+            other: Runs over the packets that follow this one's
+            offset: Packets covered by this one (added to other's offsets)
+        """
+        if other.first is None:
+            return self
+        if self.first is None:
+            self.first, self.first_step = other.first + offset, other.first_step
+        self.last, self.last_step = other.last + offset, other.last_step
+        self.count += other.count
+        for start, length in other.runs:
+            self._append(start + offset, length)
+        self.truncated = self.truncated or other.truncated
+        return self
+
+    def to_state(self) -> dict[str, Any]:
+        """JSON-serializable state, restorable with from_state()."""
+        return {**self.finalize(), "max_runs": self.max_runs}
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> ViolationRuns:
+        """Restore runs saved with to_state()."""
+        runs = cls(state["max_runs"])
+        runs.runs = [list(run) for run in state["runs"]]
+        runs.count = state["count"]
+        runs.first, runs.last = state["first"], state["last"]
+        runs.first_step, runs.last_step = state["first_step"], state["last_step"]
+        runs.truncated = state["truncated"]
+        return runs
+
+    def finalize(self) -> dict[str, Any]:
+        """
+        Produce the audit entry of one invariant.
+
+        Returns:
+            Dict with count, first, last (packet offsets, None without violations),
+            first_step, last_step, runs ([start, length] pairs) and truncated
+        """
+        return {
+            "count": self.count,
+            "first": self.first,
+            "last": self.last,
+            "first_step": self.first_step,
+            "last_step": self.last_step,
+            "runs": [list(run) for run in self.runs],
+            "truncated": self.truncated,
+        }
@@ -0,0 +1,89 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for single-pass metric and invariant accumulators."""
+
+import json
+
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.io.fixtures import load_fixture_suite
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
+from eval_calibration_core.metrics.compute import compute_metrics
+from eval_calibration_core.metrics.definitions import MetricDefinitions
+from eval_calibration_core.suites.invariants import InvariantAccumulator, check_invariants
+
+
+def _mixed_packets() -> list[PacketV2]:
+    packets = []
+    for step in range(37):
+        denied = step % 7 == 0
+        packets.append(
+            PacketV2(
+                run_id="mixed",
+                step=step,
+                input={"ts": step},
+                external={"harness.fail_closed": True} if step % 11 == 0 else {},
+                mdm={"action": "ACT", "confidence": 0.1 * (step % 12)},
+                final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+                latency_ms=(step * 7) % 13,
+                mismatch=(
+                    {"flags": ["limit"], "reason_codes": ["max_exposure_exceeded", "cooldown"]}
+                    if denied
+                    else None
+                ),
+            )
+        )
+    return packets
+
+
+def _reference_metrics(packets: list[PacketV2]) -> dict:
+    return {
+        "action_distribution": MetricDefinitions.action_distribution(packets),
+        "guard_trigger_rates": MetricDefinitions.guard_trigger_rate(packets),
+        "safety_invariant_pass_rate": MetricDefinitions.safety_invariant_pass_rate(packets),
+        "latency_percentiles": MetricDefinitions.latency_percentiles(packets),
+        "total_steps": len(packets),
+    }
+
+
+def test_compute_metrics_matches_definitions_byte_for_byte() -> None:
+    """Accumulator output serializes identically to the per-metric definitions."""
+    for packets in (
+        load_fixture_suite("smoke"),
+        load_fixture_suite("determinism"),
+        load_fixture_suite("guard_pressure"),
+        _mixed_packets(),
+    ):
+        assert json.dumps(compute_metrics(packets)) == json.dumps(_reference_metrics(packets))
+
+
+def test_metrics_accumulator_merge_equals_single_pass() -> None:
+    """Merging accumulators over consecutive chunks equals one pass over all packets."""
+    packets = _mixed_packets()
+    for split in (0, 1, 10, 36, 37):
+        left, right = MetricsAccumulator(), MetricsAccumulator()
+        for packet in packets[:split]:
+            left.update(packet)
+        for packet in packets[split:]:
+            right.update(packet)
+        merged = left.merge(right).finalize()
+        assert json.dumps(merged) == json.dumps(compute_metrics(packets))
+
+
+def test_invariant_accumulator_merge() -> None:
+    """An invariant fails after merge if it fails in any part."""
+    packets = _mixed_packets()
+    left, right = InvariantAccumulator(), InvariantAccumulator()
+    for packet in packets[:20]:
+        left.update(packet)
+    for packet in packets[20:]:
+        right.update(packet)
+    assert left.merge(right).finalize() == check_invariants(packets)
+    assert check_invariants(packets)["confidence_clamp"] is False
+    assert check_invariants([]) == {
+        "contract_closure": True,
+        "confidence_clamp": True,
+        "fail_closed": True,
+        "packet_version": True,
+    }
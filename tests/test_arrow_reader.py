@@ -0,0 +1,131 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for Arrow IPC / Parquet traces (converter, ArrowPacketReader)."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.io.arrow_reader import ArrowPacketReader, convert_trace
+from eval_calibration_core.metrics.compute import compute_metrics
+from eval_calibration_core.metrics.definitions import MetricDefinitions
+from eval_calibration_core.report.builder import build_report, build_report_columns
+from eval_calibration_core.suites.invariants import check_invariants
+
+# arrow_reader imports pyarrow lazily, so the skip can follow the imports
+pytest.importorskip("pyarrow")
+
+
+def _packets() -> list[PacketV2]:
+    packets = []
+    for step in range(40):
+        denied = step % 5 == 0
+        mismatch = None
+        if denied:
+            mismatch = {"flags": ["exposure_limit"], "reason_codes": ["max_exposure_exceeded"]}
+        elif step % 7 == 0:
+            mismatch = {"flags": [], "reason_codes": ["cooldown"]}
+        packets.append(
+            PacketV2(
+                run_id="arrow",
+                step=step,
+                input={"ts": step, "nested": {"values": [1, 2.5, None]}},
+                external={"mid": 0.5 + step},
+                mdm={"action": "ACT", **({"confidence": 0.02 * step} if step % 4 else {})},
+                final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+                latency_ms=(step * 13) % 29,
+                mismatch=mismatch,
+            )
+        )
+    return packets
+
+
+def _write_jsonl(path: Path, packets: list[PacketV2]) -> Path:
+    path.write_text("".join(json.dumps(p.to_dict()) + "\n" for p in packets), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+def test_round_trip_is_lossless(tmp_path: Path, suffix: str) -> None:
+    """Converted traces read back to identical PacketV2 packets."""
+    packets = _packets()
+    src = _write_jsonl(tmp_path / "trace.jsonl", packets)
+    dst = tmp_path / f"trace{suffix}"
+    assert convert_trace(src, dst, batch_size=16) == len(packets)
+    restored = ArrowPacketReader(dst).read_all()
+    assert [p.to_dict() for p in restored] == [p.to_dict() for p in packets]
+
+    projected = ArrowPacketReader(dst, fields=["step", "latency_ms", "mismatch"]).read_all()
+    assert [p.to_dict() for p in projected] == [
+        {"step": p.step, "latency_ms": p.latency_ms, "mismatch": p.mismatch} for p in packets
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+def test_columns_match_row_path(tmp_path: Path, suffix: str) -> None:
+    """Metrics and invariants over projected columns equal the per-packet results."""
+    packets = _packets()
+    dst = tmp_path / f"trace{suffix}"
+    convert_trace(_write_jsonl(tmp_path / "trace.jsonl", packets), dst, batch_size=16)
+    report = build_report_columns(ArrowPacketReader(dst).read_columns())
+    expected = build_report(packets)
+    assert json.dumps(report.metrics) == json.dumps(compute_metrics(packets))
+    assert report.invariant_results == check_invariants(packets)
+    assert report.input_stats == expected.input_stats
+
+
+def test_projection_loads_only_needed_columns(tmp_path: Path) -> None:
+    """read_columns(needs) fills only the columns the named metrics read."""
+    packets = _packets()
+    dst = tmp_path / "trace.arrow"
+    convert_trace(_write_jsonl(tmp_path / "trace.jsonl", packets), dst)
+    columns = ArrowPacketReader(dst).read_columns(["action_distribution"])
+    assert len(columns) == len(packets)
+    assert len(columns.latency_ms) == 0
+    assert MetricDefinitions.action_distribution_columns(
+        columns
+    ) == MetricDefinitions.action_distribution(packets)
+
+    with pytest.raises(ValueError, match="Unknown metric/invariant"):
+        ArrowPacketReader(dst).read_columns(["nope"])
+
+
+def test_empty_trace_and_errors(tmp_path: Path) -> None:
+    """Empty traces convert; unknown suffixes and missing files are rejected."""
+    src = tmp_path / "empty.jsonl"
+    src.write_text("", encoding="utf-8")
+    dst = tmp_path / "empty.arrow"
+    assert convert_trace(src, dst) == 0
+    assert ArrowPacketReader(dst).read_all() == []
+    assert build_report_columns(ArrowPacketReader(dst).read_columns()).metrics == (
+        compute_metrics([])
+    )
+
+    with pytest.raises(ValueError, match="Unknown columnar trace format"):
+        convert_trace(src, tmp_path / "out.csv")
+    with pytest.raises(FileNotFoundError):
+        ArrowPacketReader(tmp_path / "missing.arrow")
+
+
+def test_cli_convert_and_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """`convert --to parquet` then `run --in trace.parquet` gives the JSONL report."""
+    packets = _packets()
+    src = _write_jsonl(tmp_path / "trace.jsonl", packets)
+    monkeypatch.setattr(sys, "argv", ["eval-cal", "convert", "--in", str(src), "--to", "parquet"])
+    main()
+    assert "[OK] Converted 40 packets" in capsys.readouterr().out
+
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(tmp_path / "trace.parquet"), "--out", str(out)]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    assert written["metrics"] == json.loads(json.dumps(compute_metrics(packets)))
+    assert written["suite_name"] == "trace"
@@ -0,0 +1,100 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for multi-trace batch runs (glob / directory --in)."""
+
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.report import build_report, build_report_batch, expand_inputs
+from eval_calibration_core.report.batch import report_name
+
+
+def _write_trace(path: Path, n: int) -> list[PacketV2]:
+    packets = [
+        PacketV2(
+            run_id=path.name,
+            step=step,
+            input={},
+            external={},
+            mdm={"action": "ACT", "confidence": 0.5},
+            final_action={"action": "ACT", "allowed": True},
+            latency_ms=step % 5,
+        )
+        for step in range(n)
+    ]
+    data = "".join(json.dumps(p.to_dict()) + "\n" for p in packets).encode("utf-8")
+    path.write_bytes(gzip.compress(data) if path.suffix == ".gz" else data)
+    return packets
+
+
+def test_expand_inputs_and_names(tmp_path: Path) -> None:
+    """Directories list trace files, globs are expanded, names drop trace suffixes."""
+    for name in ("b.jsonl", "a.jsonl.gz", "notes.txt", "b.jsonl.idx", "b.jsonl.state.json"):
+        (tmp_path / name).write_text("", encoding="utf-8")
+    assert [p.name for p in expand_inputs(tmp_path)] == ["a.jsonl.gz", "b.jsonl"]
+    assert [p.name for p in expand_inputs(tmp_path / "*.jsonl")] == ["b.jsonl"]
+    assert [p.name for p in expand_inputs(tmp_path / "b.*")] == ["b.jsonl"]
+    assert report_name("traces/a.jsonl.gz") == "a"
+    assert report_name("x.parquet") == "x"
+    with pytest.raises(FileNotFoundError, match="No trace files"):
+        expand_inputs(tmp_path / "*.arrow")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_isolates_failures(tmp_path: Path, workers: int) -> None:
+    """Every trace gets its own report; a bad trace is indexed as failed, not fatal."""
+    good = _write_trace(tmp_path / "good.jsonl", 20)
+    _write_trace(tmp_path / "packed.jsonl.gz", 7)
+    (tmp_path / "bad.jsonl").write_text('{"run_id": "x"}\n', encoding="utf-8")
+    out = tmp_path / "reports"
+    index = build_report_batch(expand_inputs(tmp_path), out, workers=workers)
+
+    assert (index["inputs"], index["ok"], index["failed"]) == (3, 2, 1)
+    assert index["total_packets"] == 27
+    packed = json.loads((out / "packed" / "report.json").read_text(encoding="utf-8"))
+    assert packed["suite_name"] == "packed"  # same name as the report directory
+    bad, good_entry, packed = index["reports"]
+    assert bad["status"] == "failed" and "Invalid packet at line 1" in bad["error"]
+    assert good_entry["report"] == str(out / "good" / "report.json")
+    written = json.loads((out / "good" / "report.json").read_text(encoding="utf-8"))
+    assert written == json.loads(json.dumps(build_report(good, suite_name="good").to_dict()))
+    assert packed["total_packets"] == 7
+    assert json.loads((out / "index.json").read_text(encoding="utf-8")) == index
+    assert "❌ failed" in (out / "index.md").read_text(encoding="utf-8")
+
+
+def test_batch_records_unpicklable_jobs(tmp_path: Path) -> None:
+    """A job the pool cannot pickle (a local outcome) is indexed as failed."""
+    for name in ("a.jsonl", "b.jsonl"):
+        _write_trace(tmp_path / name, 5)
+
+    def local_outcome(packet):
+        return True
+
+    index = build_report_batch(
+        expand_inputs(tmp_path), tmp_path / "reports", workers=2, outcome=local_outcome
+    )
+    assert (index["ok"], index["failed"]) == (0, 2)
+    assert all("pickle" in entry["error"] for entry in index["reports"])
+
+
+def test_cli_glob_input(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """`run --in 'dir/*.jsonl'` writes one report per trace and the index."""
+    for name in ("one.jsonl", "two.jsonl"):
+        _write_trace(tmp_path / name, 5)
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(tmp_path / "*.jsonl"), "--out", str(out)]
+    monkeypatch.setattr(sys, "argv", [*argv, "--workers", "2", "--compact-json"])
+    main()
+    assert "[OK] 2/2 reports written" in capsys.readouterr().out
+    assert (out / "one" / "report.json").exists() and (out / "two" / "report.md").exists()
+    assert json.loads((out / "index.json").read_text(encoding="utf-8"))["ok"] == 2
@@ -0,0 +1,68 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the benchmark trace generator and regression gate (benchmarks/)."""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.report.builder import build_report
+
+# benchmarks/ is a script directory, not a package
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+compare = importlib.import_module("bench_pipeline").compare
+generator = importlib.import_module("generator")
+TraceSpec, generate_trace = generator.TraceSpec, generator.generate_trace
+
+
+def test_generator_is_seeded_and_valid(tmp_path: Path) -> None:
+    """Same spec and seed give identical bytes; packets are valid PacketV2."""
+    spec = TraceSpec(packets=2000, seed=3, mismatch_rate=0.2, deny_rate=0.5, runs=4)
+    a, b = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+    assert generate_trace(a, spec) == a.stat().st_size
+    generate_trace(b, spec)
+    assert a.read_bytes() == b.read_bytes()
+    generate_trace(b, TraceSpec(packets=2000, seed=4))
+    assert a.read_bytes() != b.read_bytes()
+
+    packets = PacketReader(a).read_all()
+    assert len(packets) == 2000
+    assert len({p.run_id for p in packets}) == 4
+    report = build_report(packets)
+    assert all(report.invariant_results.values())
+    denied = sum(1 for p in packets if not p.final_action["allowed"])
+    assert 100 < denied < 300  # ~ 2000 * 0.2 * 0.5
+
+    with pytest.raises(ValueError, match="Unknown latency distribution"):
+        generate_trace(a, TraceSpec(packets=1, latency="pareto"))
+
+
+def test_regression_gate() -> None:
+    """compare() flags throughput drops and RSS growth beyond tolerance only."""
+    baseline = {
+        "1000": {
+            "list": {
+                "stages": {"read": 1.0, "write_report": 0.001},
+                "throughput": {"read": 1000.0, "write_report": 1e6},
+                "peak_rss_mb": 100.0,
+            }
+        }
+    }
+    ok = {
+        "1000": {
+            "list": {
+                "stages": {"read": 1.2, "write_report": 0.01},
+                "throughput": {"read": 800.0, "write_report": 1e5},  # noisy stage ignored
+                "peak_rss_mb": 120.0,
+            }
+        }
+    }
+    assert compare(ok, baseline, tolerance=0.3) == []
+    slow = {"1000": {"list": {**ok["1000"]["list"], "throughput": {"read": 500.0}}}}
+    assert len(compare(slow, baseline, tolerance=0.3)) == 1
+    fat = {"1000": {"list": {**ok["1000"]["list"], "peak_rss_mb": 200.0}}}
+    assert "peak RSS" in compare(fat, baseline, tolerance=0.3)[0]
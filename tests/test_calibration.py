@@ -0,0 +1,157 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for reliability binning (ECE, MCE, Brier) and Report.calibration_summary."""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.calibration import (
+    CalibrationAccumulator,
+    ExactSum,
+    calibration_columns,
+    compute_calibration,
+)
+from eval_calibration_core.io.columns import PacketColumns
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.metrics import vectorized
+from eval_calibration_core.report import (
+    build_report,
+    build_report_columns,
+    build_report_incremental,
+    build_report_parallel,
+)
+
+
+def _packet(step: int, confidence, proposed: str | None, final: str) -> PacketV2:
+    return PacketV2(
+        run_id="cal-run",
+        step=step,
+        input={},
+        external={},
+        mdm={"action": proposed, "confidence": confidence},
+        final_action={"action": final, "allowed": final == "ACT"},
+        latency_ms=1,
+        mismatch=None if final == "ACT" else {"flags": ["f"], "reason_codes": ["r"]},
+    )
+
+
+def _random_packets(n: int, seed: int = 7) -> list[PacketV2]:
+    rng = random.Random(seed)
+    packets = []
+    for step in range(n):
+        confidence = rng.random()
+        final = "ACT" if rng.random() < confidence else "HOLD"
+        if step % 97 == 0:
+            confidence = None
+        elif step % 89 == 0:
+            confidence = 1.25
+        packets.append(_packet(step, confidence, None if step % 83 == 0 else "ACT", final))
+    return packets
+
+
+def test_summary_matches_hand_computation() -> None:
+    """Bins, ECE, MCE and Brier follow the documented formulas."""
+    packets = [
+        _packet(0, 0.05, "ACT", "HOLD"),
+        _packet(1, 0.15, "ACT", "ACT"),
+        _packet(2, 0.95, "ACT", "ACT"),
+        _packet(3, 0.95, "ACT", "HOLD"),
+        _packet(4, 1.0, "ACT", "ACT"),  # upper edge lands in the last bin
+        _packet(5, None, "ACT", "ACT"),  # skipped: no confidence
+        _packet(6, 0.5, None, "HOLD"),  # skipped: no proposal
+    ]
+    summary = compute_calibration(packets, bins=10)
+    assert summary["samples"] == 5 and summary["skipped"] == 2
+    bins = summary["reliability"]
+    assert [b["count"] for b in bins] == [1, 1, 0, 0, 0, 0, 0, 0, 0, 3]
+    assert bins[2]["mean_confidence"] is None and bins[2]["accuracy"] is None
+    assert bins[9]["accuracy"] == pytest.approx(2 / 3)
+    assert bins[9]["mean_confidence"] == pytest.approx((0.95 + 0.95 + 1.0) / 3)
+
+    gaps = [0.05, 0.85, abs(2 / 3 - 2.9 / 3)]
+    assert summary["ece"] == pytest.approx((gaps[0] + gaps[1] + 3 * gaps[2]) / 5)
+    assert summary["mce"] == pytest.approx(0.85)
+    brier = (0.05**2 + 0.85**2 + 0.05**2 + 0.95**2 + 0.0) / 5
+    assert summary["brier_score"] == pytest.approx(brier)
+
+
+def test_empty_summary_has_no_scores() -> None:
+    """Without samples the scores are None rather than a misleading 0."""
+    summary = compute_calibration([])
+    assert summary["ece"] is None and summary["mce"] is None and summary["brier_score"] is None
+    assert len(summary["reliability"]) == 10
+
+
+def test_custom_outcome_extractor() -> None:
+    """A configurable outcome replaces proposal/final agreement."""
+    packets = [_packet(0, 0.9, None, "ACT"), _packet(1, 0.9, None, "HOLD")]
+
+    def allowed(packet):
+        return packet.final_action.get("allowed", True)
+
+    summary = compute_calibration(packets, outcome=allowed)
+    assert summary["outcome"] == "allowed"
+    assert summary["samples"] == 2 and summary["reliability"][9]["accuracy"] == 0.5
+
+
+@pytest.mark.parametrize("kernels", ["numpy", "stdlib"])
+def test_merge_and_state_are_order_independent(kernels: str, monkeypatch) -> None:
+    """Sharded, restored and columnar summaries are bit-identical to a single pass."""
+    if kernels == "numpy" and not vectorized.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    if kernels == "stdlib":
+        monkeypatch.setattr(vectorized, "HAS_NUMPY", False)
+    packets = _random_packets(2000)
+    serial = compute_calibration(packets)
+
+    parts = [CalibrationAccumulator() for _ in range(3)]
+    for i, packet in enumerate(packets):
+        parts[i * 3 // len(packets)].update(packet)
+    merged = parts[2].merge(parts[0]).merge(parts[1])
+    restored = CalibrationAccumulator.from_state(json.loads(json.dumps(merged.to_state())))
+    assert restored.finalize() == serial
+    assert calibration_columns(PacketColumns.from_packets(packets)) == serial
+
+
+def test_exact_sum_is_correctly_rounded() -> None:
+    """ExactSum matches math.fsum whatever the order of additions."""
+    values = [1e16, 1.0, -1e16, 0.1, 0.2, 0.3] * 50
+    forward, backward = ExactSum(), ExactSum()
+    for v in values:
+        forward.add(v)
+    for v in reversed(values):
+        backward.add(v)
+    assert forward.value == backward.value == pytest.approx(30.0 + 50.0)
+
+
+def test_exact_sum_extend_matches_add() -> None:
+    """Adding a batch with extend() keeps the same exact sum as one add() per value."""
+    rng = random.Random(3)
+    values = [rng.choice([1e16, -1e16, 1e-17, 0.1]) * rng.random() for _ in range(5000)]
+    one_by_one, batched = ExactSum([0.3]), ExactSum([0.3])
+    for v in values:
+        one_by_one.add(v)
+    batched.extend(values[:1234])
+    batched.extend(values[1234:])
+    assert batched.value == one_by_one.value
+
+
+def test_reports_carry_identical_calibration(tmp_path: Path) -> None:
+    """Every builder fills calibration_summary with the same values."""
+    packets = _random_packets(600)
+    path = tmp_path / "trace.jsonl"
+    path.write_text("".join(json.dumps(p.to_dict()) + "\n" for p in packets), encoding="utf-8")
+
+    expected = build_report(PacketReader(path).read_all()).calibration_summary
+    assert expected == compute_calibration(packets) and expected["samples"] > 0
+    assert build_report_parallel(path, 3).calibration_summary == expected
+    columns = PacketReader(path).read_columns()
+    assert build_report_columns(columns).calibration_summary == expected
+    state = tmp_path / "report.state.json"
+    assert build_report_incremental(path, state).calibration_summary == expected
+    assert build_report_incremental(path, state).calibration_summary == expected
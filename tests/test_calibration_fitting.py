@@ -0,0 +1,178 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for calibrator fitting and the content-addressed fit cache."""
+
+import json
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cache import ContentCache, file_digest
+from eval_calibration_core.calibration import (
+    CALIBRATION_METHODS,
+    fit_calibrators,
+    fit_packets,
+    fit_trace,
+    fitting,
+    load_calibrator,
+    weighted_points,
+)
+from eval_calibration_core.cli import main
+
+
+def _sigmoid(z: float) -> float:
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+def _pairs(n: int, probability, seed: int = 3) -> list[tuple[float, bool]]:
+    """Confidences rounded to 3 decimals with outcomes drawn from probability(confidence)."""
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(n):
+        confidence = round(rng.uniform(0.01, 0.99), 3)
+        pairs.append((confidence, rng.random() < probability(confidence)))
+    return pairs
+
+
+def _write_trace(path: Path, n: int = 300) -> Path:
+    rng = random.Random(11)
+    with open(path, "w", encoding="utf-8") as f:
+        for step in range(n):
+            confidence = round(rng.random(), 2)
+            final = "ACT" if rng.random() < confidence**2 else "HOLD"
+            packet = PacketV2(
+                run_id="fit-run",
+                step=step,
+                input={},
+                external={},
+                mdm={"action": "ACT", "confidence": confidence},
+                final_action={"action": final, "allowed": final == "ACT"},
+                latency_ms=1,
+                mismatch=None if final == "ACT" else {"flags": ["f"], "reason_codes": ["r"]},
+            )
+            f.write(json.dumps(packet.to_dict()) + "\n")
+    return path
+
+
+def test_weighted_points_pool_duplicates() -> None:
+    """Pairs collapse into sorted (confidence, positives, samples) points."""
+    points = weighted_points([(0.5, True), (0.2, False), (0.5, False), (0.5, True)])
+    assert points == [(0.2, 0, 1), (0.5, 2, 3)]
+
+
+def test_isotonic_pools_adjacent_violators() -> None:
+    """PAV pools decreasing neighbours into their weighted mean."""
+    points = [(0.1, 1, 1), (0.2, 0, 1), (0.3, 1, 1), (0.4, 2, 4), (0.5, 1, 1)]
+    fit = fit_calibrators(points, ["isotonic"])["isotonic"]
+    assert fit["params"] == {"thresholds": [0.1, 0.3, 0.5], "values": [0.5, 0.6, 1.0]}
+    calibrator = load_calibrator(fit)
+    assert calibrator.predict(0.0) == 0.5
+    assert calibrator.predict(0.35) == 0.6
+    assert calibrator.predict(0.99) == 1.0
+
+
+def test_parametric_fits_recover_generating_model() -> None:
+    """Platt and temperature fits recover the parameters the outcomes were drawn with."""
+    platt_points = weighted_points(_pairs(20000, lambda c: _sigmoid(6.0 * c - 2.0)))
+    platt = fit_calibrators(platt_points, ["platt"])["platt"]["params"]
+    assert platt["a"] == pytest.approx(-6.0, abs=0.5)
+    assert platt["b"] == pytest.approx(2.0, abs=0.3)
+
+    def tempered(c: float) -> float:
+        return _sigmoid(math.log(c / (1.0 - c)) / 2.0)
+
+    temperature_points = weighted_points(_pairs(20000, tempered))
+    fit = fit_calibrators(temperature_points, ["temperature"])["temperature"]
+    assert fit["params"]["temperature"] == pytest.approx(2.0, rel=0.1)
+
+
+def test_fits_improve_brier_and_round_trip() -> None:
+    """Every calibrator beats the raw Brier score on miscalibrated data and reloads exactly."""
+    pairs = _pairs(5000, lambda c: c**3)
+    raw = sum((c - o) ** 2 for c, o in pairs) / len(pairs)
+    fits = fit_calibrators(weighted_points(pairs), CALIBRATION_METHODS, bins=10)
+    for method, fit in fits.items():
+        assert fit["brier_score"] < raw, method
+        restored = load_calibrator(json.loads(json.dumps(fit)))
+        assert restored.params() == fit["params"]
+    assert len(fits["histogram"]["params"]["values"]) == 10
+
+
+def test_fit_trace_reuses_cached_fit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second fit of the same trace content is served from the cache without reading it."""
+    trace = _write_trace(tmp_path / "trace.jsonl")
+    cache = ContentCache(tmp_path / "cache", "calibrators")
+    first = fit_trace(trace, ["isotonic", "platt"], cache=cache)
+    assert first["trace_digest"] == file_digest(trace)
+    assert first["samples"] == 300
+    assert list((tmp_path / "cache" / "calibrators").rglob("*.json"))
+
+    def no_read(path, decoder):
+        raise AssertionError("trace was re-read")
+
+    monkeypatch.setattr(fitting, "_read", no_read)
+    assert fit_trace(trace, ["isotonic", "platt"], cache=cache) == first
+    with pytest.raises(AssertionError, match="re-read"):
+        fit_trace(trace, ["histogram"], cache=cache)  # other methods: cache miss
+    monkeypatch.undo()
+
+    packets = [PacketV2.from_dict(json.loads(line)) for line in trace.read_text().splitlines()]
+    assert {k: v for k, v in first.items() if k != "trace_digest"} == fit_packets(
+        packets, ["isotonic", "platt"]
+    )
+
+
+def test_unknown_method_is_rejected() -> None:
+    """Unknown methods fail before any work is done."""
+    with pytest.raises(ValueError, match="Unknown calibration method"):
+        fit_calibrators([], ["beta"])
+
+
+def test_cli_fit_calibrators(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """`run --fit-calibrators` adds the fits to calibration_summary and report.md."""
+    trace = _write_trace(tmp_path / "trace.jsonl")
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(trace), "--out", str(out)]
+    argv += ["--fit-calibrators", "all", "--cache-dir", str(tmp_path / "cache")]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    calibrators = written["calibration_summary"]["calibrators"]
+    assert list(calibrators["fits"]) == list(CALIBRATION_METHODS)
+    assert "### Fitted Calibrators" in (out / "report.md").read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("mode", [[], ["--stream"]])
+def test_cli_fits_from_the_report_pass(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mode: list[str]
+) -> None:
+    """With --cache, fitting reuses the report pass's packets and trace hash."""
+    trace = _write_trace(tmp_path / "trace.jsonl")
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(trace), "--out", str(out), *mode, "--cache"]
+    argv += ["--fit-calibrators", "isotonic", "--cache-dir", str(tmp_path / "cache")]
+    hashed = []
+
+    def counting_digest(path, quick=False):
+        hashed.append(path)
+        return file_digest(path, quick)
+
+    def no_read(path, decoder):
+        raise AssertionError("trace was re-read")
+
+    monkeypatch.setattr(sys, "argv", argv)
+    monkeypatch.setattr("eval_calibration_core.cache.file_digest", counting_digest)
+    monkeypatch.setattr(fitting, "file_digest", counting_digest)
+    monkeypatch.setattr(fitting, "_read", no_read)
+    main()
+    assert len(hashed) == 1
+    calibrators = json.loads((out / "report.json").read_text(encoding="utf-8"))[
+        "calibration_summary"
+    ]["calibrators"]
+    packets = [PacketV2.from_dict(json.loads(line)) for line in trace.read_text().splitlines()]
+    assert calibrators == {"trace_digest": file_digest(trace), **fit_packets(packets, ["isotonic"])}
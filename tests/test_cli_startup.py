@@ -0,0 +1,56 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""CLI startup budget: `--help` must not load the evaluation stack (python -X importtime)."""
+
+import subprocess
+import sys
+
+# Cumulative import time of eval_calibration_core.cli, excluding interpreter startup
+IMPORT_BUDGET_US = 100_000
+
+HEAVY_MODULES = (
+    "decision_schema",
+    "numpy",
+    "pyarrow",
+    "orjson",
+    "eval_calibration_core.contracts",
+    "eval_calibration_core.io",
+    "eval_calibration_core.metrics",
+    "eval_calibration_core.report",
+    "eval_calibration_core.suites",
+)
+
+
+def _importtime(*args: str) -> dict[str, int]:
+    """Run python -X importtime with args; return module -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def test_help_skips_heavy_imports() -> None:
+    """`--help` (top level and subcommand) imports no schema, metrics, report or I/O modules."""
+    for args in (["--help"], ["run", "--help"], []):
+        modules = _importtime("-m", "eval_calibration_core.cli", *args)
+        loaded = [m for m in modules if m.startswith(HEAVY_MODULES)]
+        assert loaded == [], f"{args}: {loaded}"
+
+
+def test_help_import_budget() -> None:
+    """Importing the CLI stays within the startup budget (best of 3 to absorb CI noise)."""
+    best = min(
+        _importtime("-c", "import eval_calibration_core.cli")["eval_calibration_core.cli"]
+        for _ in range(3)
+    )
+    assert best < IMPORT_BUDGET_US, f"eval_calibration_core.cli import took {best} us"
@@ -0,0 +1,192 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the columnar packet store and vectorized metrics/invariants."""
+
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.io.columns import PacketColumns
+from eval_calibration_core.io.fixtures import load_fixture_suite
+from eval_calibration_core.io.indexed_reader import IndexedPacketReader
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.metrics import vectorized
+from eval_calibration_core.metrics.compute import compute_metrics, compute_metrics_columns
+from eval_calibration_core.suites.invariants import check_invariants, check_invariants_columns
+
+
+def _varied_packets() -> list[PacketV2]:
+    packets = []
+    for step in range(60):
+        denied = step % 5 == 0
+        mismatch = None
+        if denied and step % 10 == 0:
+            mismatch = {"flags": ["exposure_limit"], "reason_codes": ["max_exposure_exceeded"]}
+        elif step % 7 == 0:
+            mismatch = {"flags": [], "reason_codes": ["cooldown", "stale_quote"]}
+        packets.append(
+            PacketV2(
+                run_id="cols",
+                step=step,
+                input={"ts": step},
+                external={"harness.fail_closed": True} if step % 15 == 0 else {"mid": 0.5},
+                mdm={"action": "ACT", **({"confidence": 0.02 * step} if step % 4 else {})},
+                final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+                latency_ms=(step * 13) % 29,
+                mismatch=mismatch,
+            )
+        )
+    return packets
+
+
+@pytest.fixture(params=["numpy", "stdlib"])
+def kernels(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy" and not vectorized.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    if request.param == "stdlib":
+        monkeypatch.setattr(vectorized, "HAS_NUMPY", False)
+    return request.param
+
+
+@pytest.mark.parametrize("suite", ["smoke", "determinism", "guard_pressure", "varied", "empty"])
+def test_columnar_matches_row_path(suite: str, kernels: str) -> None:
+    """Vectorized metrics and invariants equal the per-packet implementation."""
+    if suite == "varied":
+        packets = _varied_packets()
+    elif suite == "empty":
+        packets = []
+    else:
+        packets = load_fixture_suite(suite)
+    columns = PacketColumns.from_packets(packets)
+    assert len(columns) == len(packets)
+    assert json.dumps(compute_metrics_columns(columns)) == json.dumps(compute_metrics(packets))
+    assert check_invariants_columns(columns) == check_invariants(packets)
+
+
+def test_columnar_mixed_latency_types(kernels: str) -> None:
+    """Mixed int/float latencies keep the type the per-packet path reports for each value."""
+    latencies = [3.0, 3, 5, 5.0, 7.5, 2, 9, 9.0, 4.25, 1]
+    packets = [
+        PacketV2(
+            run_id="mixed",
+            step=step,
+            input={},
+            external={},
+            mdm={"action": "ACT", "confidence": 0.5},
+            final_action={"action": "ACT", "allowed": True},
+            latency_ms=latency,
+        )
+        for step, latency in enumerate(latencies)
+    ]
+    percentiles = [10, 30, 50, 80, "max"]
+    expected = compute_metrics(packets, percentiles=percentiles)["latency_percentiles"]
+    columns = PacketColumns.from_packets(packets)
+    actual = compute_metrics_columns(columns, percentiles=percentiles)["latency_percentiles"]
+    assert json.dumps(actual) == json.dumps(expected)
+    assert [type(v) for v in actual.values()] == [int, float, int, int, int]
+
+
+def test_columnar_large_int_latencies_exact(kernels: str) -> None:
+    """Integer latencies stay int64 in the column, so values above 2**53 are not rounded."""
+    latencies = [2**53 + 1, 5, 2**60 + 3, 2**53 + 3, 7]
+    packets = [
+        PacketV2(
+            run_id="large",
+            step=step,
+            input={},
+            external={},
+            mdm={"action": "ACT", "confidence": 0.5},
+            final_action={"action": "ACT", "allowed": True},
+            latency_ms=latency,
+        )
+        for step, latency in enumerate(latencies)
+    ]
+    percentiles = [50, 70, "max"]
+    columns = PacketColumns.from_packets(packets)
+    assert columns.latency_ms.typecode == "q"
+    actual = compute_metrics_columns(columns, percentiles=percentiles)["latency_percentiles"]
+    assert actual == compute_metrics(packets, percentiles=percentiles)["latency_percentiles"]
+    assert list(actual.values()) == [2**53 + 1, 2**53 + 3, 2**60 + 3]
+
+
+def test_columnar_invariant_failures(kernels: str) -> None:
+    """Vectorized invariants detect the same failures as the per-packet checks."""
+    bad = PacketV2(
+        run_id="bad",
+        step=0,
+        input={},
+        external={},
+        mdm={"action": "NOPE", "confidence": 1.5},
+        final_action={"action": "ACT", "allowed": True},
+        latency_ms=1,
+        mismatch={"flags": ["exposure_limit"]},
+    )
+    packets = [*_varied_packets(), bad]
+    results = check_invariants_columns(PacketColumns.from_packets(packets))
+    assert results == check_invariants(packets)
+    assert results["contract_closure"] is False
+    assert results["confidence_clamp"] is False
+    assert results["fail_closed"] is False
+
+
+def test_read_columns_without_packets(tmp_path: Path) -> None:
+    """PacketReader.read_columns() builds the same columns from raw JSONL."""
+    packets = _varied_packets()
+    path = tmp_path / "trace.jsonl"
+    path.write_text("".join(json.dumps(p.to_dict()) + "\n" for p in packets), encoding="utf-8")
+    columns = PacketReader(path).read_columns()
+    assert json.dumps(compute_metrics_columns(columns)) == json.dumps(compute_metrics(packets))
+    assert list(columns.reason_codes.values) == ["max_exposure_exceeded", "cooldown", "stale_quote"]
+    assert list(columns.reason_offsets[:3]) == [0, 1, 1]
+
+    path.write_text('{"step": 0}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="Invalid packet at line 1"):
+        PacketReader(path).read_columns()
+
+
+def test_compressed_read_columns_and_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """gzip traces read into the same columns; `run --columnar` writes the default report."""
+    packets = _varied_packets()
+    text = "".join(json.dumps(p.to_dict()) + "\n" for p in packets)
+    path = tmp_path / "trace.jsonl"
+    path.write_text(text, encoding="utf-8")
+    packed = tmp_path / "packed.jsonl.gz"
+    packed.write_bytes(gzip.compress(text.encode("utf-8")))
+    columns = IndexedPacketReader(packed, cache_index=False).read_columns()
+    assert json.dumps(compute_metrics_columns(columns)) == json.dumps(compute_metrics(packets))
+    assert check_invariants_columns(columns) == check_invariants(packets)
+
+    outputs = {}
+    for mode in ([], ["--columnar"]):
+        out = tmp_path / f"out{len(mode)}"
+        argv = ["eval-cal", "run", "--in", str(path), "--out", str(out), *mode]
+        monkeypatch.setattr(sys, "argv", argv)
+        main()
+        outputs[len(mode)] = (out / "report.json").read_text(encoding="utf-8")
+    assert outputs[0] == outputs[1]
+
+
+def test_cli_columnar_notes_ignored_options(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """`run --columnar` with an option it does not implement says so on stderr."""
+    path = tmp_path / "trace.jsonl"
+    path.write_text(
+        "".join(json.dumps(p.to_dict()) + "\n" for p in _varied_packets()), encoding="utf-8"
+    )
+    argv = ["eval-cal", "run", "--in", str(path), "--out", str(tmp_path / "out"), "--columnar"]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+    assert "--columnar ignored" not in capsys.readouterr().err
+
+    monkeypatch.setattr(sys, "argv", [*argv, "--latency-backend", "ddsketch", "--workers", "2"])
+    main()
+    captured = capsys.readouterr()
+    assert "[NOTE] --columnar ignored with --latency-backend, --workers" in captured.err
+    assert "[OK] Report written" in captured.out
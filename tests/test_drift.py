@@ -0,0 +1,119 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for drift statistics and the baseline vs candidate drift report."""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.drift import build_drift_report, chi_square, ks_two_sample, psi
+from eval_calibration_core.drift.statistics import chi2_sf, kolmogorov_sf
+from eval_calibration_core.metrics.quantiles import DDSketch, ExactQuantiles
+
+
+def _write_trace(path: Path, n: int, seed: int, shifted: bool = False) -> Path:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for step in range(n):
+            denied = rng.random() < (0.3 if shifted else 0.1)
+            confidence = min(rng.betavariate(5, 2) if shifted else rng.random(), 1.0)
+            latency = rng.expovariate(1 / (25.0 if shifted else 10.0))
+            packet = PacketV2(
+                run_id="drift-run",
+                step=step,
+                input={"ts": step},
+                external={},
+                mdm={"action": "ACT", "confidence": confidence},
+                final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+                latency_ms=round(latency, 3),
+                mismatch={"flags": ["f"], "reason_codes": ["guard"]} if denied else None,
+            )
+            f.write(json.dumps(packet.to_dict()) + "\n")
+    return path
+
+
+def test_reference_distribution_tails() -> None:
+    """Chi-square and Kolmogorov survival functions match tabulated critical values."""
+    assert chi2_sf(3.841, 1) == pytest.approx(0.05, abs=1e-3)
+    assert chi2_sf(18.307, 10) == pytest.approx(0.05, abs=1e-3)
+    assert chi2_sf(0.0, 3) == 1.0
+    assert kolmogorov_sf(1.358) == pytest.approx(0.05, abs=1e-3)
+
+
+def test_categorical_tests() -> None:
+    """Identical distributions give PSI 0 and p-value 1; disjoint ones are flagged."""
+    same = chi_square({"a": 10, "b": 30}, {"a": 20, "b": 60})
+    assert same["statistic"] == pytest.approx(0.0) and same["p_value"] == pytest.approx(1.0)
+    assert psi({"a": 10, "b": 30}, {"a": 20, "b": 60}) == pytest.approx(0.0)
+    shifted = chi_square({"a": 100}, {"b": 100})
+    assert shifted["dof"] == 1 and shifted["p_value"] < 1e-10
+    assert psi({"a": 100}, {"b": 100}) > 0.25
+
+
+def test_ks_from_exact_points_matches_brute_force() -> None:
+    """KS over exact CDF points equals the max ECDF gap of the raw samples."""
+    rng = random.Random(5)
+    a = [rng.randint(0, 50) for _ in range(300)]
+    b = [rng.randint(5, 60) for _ in range(200)]
+    sketch_a, sketch_b = ExactQuantiles(), ExactQuantiles()
+    for v in a:
+        sketch_a.add(v)
+    for v in b:
+        sketch_b.add(v)
+    expected = max(
+        abs(sum(v <= x for v in a) / len(a) - sum(v <= x for v in b) / len(b)) for x in a + b
+    )
+    result = ks_two_sample(sketch_a.cdf_points(), sketch_b.cdf_points())
+    assert result["statistic"] == pytest.approx(expected)
+
+
+def test_ddsketch_cdf_points_cover_all_samples() -> None:
+    """Sketch CDF points are ascending and end at the sample count."""
+    sketch = DDSketch(0.01)
+    for v in (-3.0, -0.5, 0.0, 0.2, 7.0, 7.01, 1000.0):
+        sketch.add(v)
+    points = sketch.cdf_points()
+    assert [x for x, _ in points] == sorted(x for x, _ in points)
+    assert points[-1][1] == sketch.count
+
+
+def test_drift_report(tmp_path: Path) -> None:
+    """Same-distribution traces do not drift; a shifted candidate drifts in every section."""
+    baseline = _write_trace(tmp_path / "baseline.jsonl", 3000, seed=1)
+    same = _write_trace(tmp_path / "same.jsonl", 3000, seed=2)
+    shifted = _write_trace(tmp_path / "shifted.jsonl", 3000, seed=3, shifted=True)
+
+    stable = build_drift_report(baseline, same, parallel=False)
+    assert stable.drift["drifted"] == []
+    assert stable.suite_name == "same" and stable.input_stats["total_packets"] == 3000
+
+    report = build_drift_report(baseline, shifted)
+    assert set(report.drift["drifted"]) == {
+        "action_distribution",
+        "latency",
+        "guard_trigger_rates",
+        "confidence",
+    }
+    assert report.drift["guard_trigger_rates"]["codes"]["guard"]["delta"] > 0.1
+    serial = build_drift_report(baseline, shifted, parallel=False)
+    assert serial.to_dict() == report.to_dict()
+    assert report.calibration_summary["samples"] == 3000
+
+
+def test_cli_drift(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """`drift` writes report.json with a drift section and a Drift table in report.md."""
+    baseline = _write_trace(tmp_path / "a.jsonl", 500, seed=1)
+    candidate = _write_trace(tmp_path / "b.jsonl", 500, seed=3, shifted=True)
+    out = tmp_path / "out"
+    argv = ["eval-cal", "drift", "--baseline", str(baseline), "--candidate", str(candidate)]
+    monkeypatch.setattr(sys, "argv", argv + ["--out", str(out), "--serial"])
+    main()
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    assert "latency" in written["drift"]["drifted"]
+    assert "## Drift" in (out / "report.md").read_text(encoding="utf-8")
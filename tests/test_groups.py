@@ -0,0 +1,105 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for per-group (run_id) metrics and invariants with spill-to-disk."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.metrics import compute_metrics
+from eval_calibration_core.report import GroupedAccumulator, build_report
+from eval_calibration_core.suites.invariants import check_invariants
+
+
+def _packet(run: int, step: int) -> PacketV2:
+    denied = (run + step) % 5 == 0
+    return PacketV2(
+        run_id=f"run-{run}",
+        step=step,
+        input={"shard": run % 3},
+        external={},
+        mdm={"action": "ACT", "confidence": 1.5 if run == 4 and step == 3 else 0.5},
+        final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+        latency_ms=(run * 7 + step) % 17,
+        mismatch={"flags": ["f"], "reason_codes": ["guard"]} if denied else None,
+    )
+
+
+def _interleaved(runs: int, steps: int) -> list[PacketV2]:
+    return [_packet(run, step) for step in range(steps) for run in range(runs)]
+
+
+def test_groups_match_per_run_reports() -> None:
+    """Each group equals metrics and invariants over that run's packets; top level is the rollup."""
+    packets = _interleaved(6, 20)
+    report = build_report(packets, latency_backend="exact", group_by="run_id")
+    assert report.input_stats["total_packets"] == 120
+    groups = report.groups
+    assert groups["count"] == 6 and groups["ungrouped"] == 0 and groups["spilled"] == 0
+    assert list(groups["groups"]) == [f"run-{run}" for run in range(6)]
+    for run in range(6):
+        subset = [p for p in packets if p.run_id == f"run-{run}"]
+        group = groups["groups"][f"run-{run}"]
+        assert group["total_packets"] == 20
+        assert group["metrics"] == compute_metrics(subset, latency_backend="exact")
+        assert group["invariant_results"] == check_invariants(subset)
+    assert groups["invariant_failures"]["confidence_clamp"] == 1
+    assert "groups" not in build_report(packets).to_dict()
+
+
+def test_spilled_groups_equal_in_memory(tmp_path: Path) -> None:
+    """Capping groups spills to disk without changing results, and cleans up the spill files."""
+    packets = _interleaved(12, 15)
+    unbounded = build_report(packets, group_by="run_id")
+    capped = build_report(packets, group_by="run_id", max_groups=3, spill_dir=tmp_path)
+    assert capped.groups["spilled"] > 0
+    assert capped.groups["groups"] == unbounded.groups["groups"]
+    assert capped.metrics == unbounded.metrics
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_group_by_input_field_and_missing_key() -> None:
+    """Groups can be keyed by an input field; packets without it are counted as ungrouped."""
+    grouped = GroupedAccumulator("shard", latency_backend="exact")
+    for packet in _interleaved(4, 3):
+        grouped.update(packet)
+    grouped.update(
+        PacketV2(
+            run_id="x",
+            step=0,
+            input={},
+            external={},
+            mdm={"action": "ACT"},
+            final_action={"action": "ACT", "allowed": True},
+            latency_ms=1,
+        )
+    )
+    result = grouped.finalize()
+    assert result["ungrouped"] == 1
+    assert {key: g["total_packets"] for key, g in result["groups"].items()} == {
+        "0": 6,
+        "1": 3,
+        "2": 3,
+    }
+    with pytest.raises(ValueError):
+        GroupedAccumulator(max_groups=0)
+
+
+def test_cli_group_by(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """`run --group-by run_id --max-groups` writes report groups and a Groups table."""
+    trace = tmp_path / "trace.jsonl"
+    trace.write_text(
+        "".join(json.dumps(p.to_dict()) + "\n" for p in _interleaved(5, 4)), encoding="utf-8"
+    )
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(trace), "--out", str(out), "--stream"]
+    monkeypatch.setattr(sys, "argv", argv + ["--group-by", "run_id", "--max-groups", "2"])
+    main()
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    assert written["groups"]["count"] == 5
+    assert "## Groups" in (out / "report.md").read_text(encoding="utf-8")
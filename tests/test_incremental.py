@@ -0,0 +1,181 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for incremental report updates over append-only traces."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.metrics.accumulator import MetricsAccumulator
+from eval_calibration_core.report import incremental
+from eval_calibration_core.report.builder import build_report_streaming
+from eval_calibration_core.report.incremental import STATE_FILENAME, build_report_incremental
+
+
+def _line(step: int) -> str:
+    denied = step % 6 == 0
+    packet = PacketV2(
+        run_id="inc",
+        step=step,
+        input={"ts": step},
+        external={"harness.fail_closed": True} if denied else {},
+        mdm={"action": "ACT", "confidence": 0.9 if step != 25 else 1.5},
+        final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+        latency_ms=(step * 7) % 23 + (0.5 if step % 5 == 0 else 0),
+        mismatch={"flags": [], "reason_codes": [f"code_{step % 3}"]} if step % 4 == 0 else None,
+    )
+    return json.dumps(packet.to_dict()) + "\n"
+
+
+def _full(path: Path, **options) -> dict:
+    return build_report_streaming(PacketReader(path).read(), **options).to_dict()
+
+
+@pytest.mark.parametrize("backend", [None, "ddsketch"])
+def test_incremental_matches_full_recompute(tmp_path: Path, backend: str | None) -> None:
+    """Appending in batches and updating incrementally equals recomputing the whole file."""
+    path = tmp_path / "live.jsonl"
+    state = tmp_path / "out" / STATE_FILENAME
+    path.write_text("", encoding="utf-8")
+    options = {"latency_backend": backend, "percentiles": [50, 99, "max"]}
+    for start, stop in [(0, 10), (10, 11), (11, 11), (11, 40)]:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(_line(step) for step in range(start, stop)))
+        report = build_report_incremental(path, state, **options)
+        assert json.dumps(report.to_dict()) == json.dumps(_full(path, **options))
+    assert report.invariant_results["confidence_clamp"] is False
+    saved = json.loads(state.read_text(encoding="utf-8"))
+    assert (saved["offset"], saved["tail"]) == (path.stat().st_size, 0)
+
+
+def test_incremental_only_parses_new_bytes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Resumed runs parse only new bytes and hash the prefix once; partial lines are skipped."""
+    path = tmp_path / "live.jsonl"
+    state = tmp_path / STATE_FILENAME
+    path.write_text("".join(_line(step) for step in range(20)), encoding="utf-8")
+    build_report_incremental(path, state)
+    consumed = path.stat().st_size
+
+    partial = _line(20)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(_line(20) + partial[:15])
+    ranges = []
+    original = PacketReader.read_range
+
+    def spy(self, start, end):
+        ranges.append((start, end))
+        return original(self, start, end)
+
+    hashed = []
+    update_digest = incremental._update_digest
+
+    def digest_spy(digest, path, start, end):
+        hashed.append((start, end))
+        return update_digest(digest, path, start, end)
+
+    monkeypatch.setattr(PacketReader, "read_range", spy)
+    monkeypatch.setattr(incremental, "_update_digest", digest_spy)
+    report = build_report_incremental(path, state)
+    end = consumed + len(partial)
+    assert ranges == [(consumed, end), (end, end + 15)]
+    assert hashed == [(0, consumed), (consumed, end)]  # the old prefix is read once
+    assert report.metrics["total_steps"] == 21
+
+
+def test_unterminated_last_packet_is_counted_and_reread(tmp_path: Path) -> None:
+    """A final packet without a newline is reported but not saved, so it is re-read later."""
+    path = tmp_path / "live.jsonl"
+    state = tmp_path / STATE_FILENAME
+    text = "".join(_line(step) for step in range(12))
+    path.write_text(text.rstrip("\n"), encoding="utf-8")
+    report = build_report_incremental(path, state)
+    assert report.metrics["total_steps"] == 12
+    assert report.to_dict() == _full(path)
+    saved = json.loads(state.read_text(encoding="utf-8"))
+    assert saved["offset"] + saved["tail"] == path.stat().st_size
+    assert saved["offset"] == len(text) - len(_line(11))
+
+    # The tail is completed and more packets follow: nothing is counted twice
+    path.write_text(text + "".join(_line(step) for step in range(12, 20)), encoding="utf-8")
+    report = build_report_incremental(path, state)
+    assert report.metrics["total_steps"] == 20
+    assert report.to_dict() == _full(path)
+
+
+def test_same_size_rewrite_inside_prefix_restarts(tmp_path: Path) -> None:
+    """A rewrite in the middle of the consumed prefix, keeping its size, is detected."""
+    path = tmp_path / "live.jsonl"
+    state = tmp_path / STATE_FILENAME
+    lines = [_line(step) for step in range(3000)]
+    path.write_text("".join(lines), encoding="utf-8")
+    build_report_incremental(path, state)
+    assert path.stat().st_size > 1 << 17
+
+    lines[1500] = lines[1500].replace('"action": "ACT"', '"action": "BAD"', 1)
+    path.write_text("".join(lines), encoding="utf-8")
+    report = build_report_incremental(path, state)
+    assert report.invariant_results["contract_closure"] is False
+    assert report.to_dict() == _full(path)
+
+
+def test_incremental_restarts_when_trace_or_config_changes(tmp_path: Path) -> None:
+    """A rewritten trace, changed options or corrupt state trigger a full recompute."""
+    path = tmp_path / "live.jsonl"
+    state = tmp_path / STATE_FILENAME
+    path.write_text("".join(_line(step) for step in range(30)), encoding="utf-8")
+    build_report_incremental(path, state)
+
+    path.write_text("".join(_line(step) for step in range(100, 112)), encoding="utf-8")
+    assert build_report_incremental(path, state).to_dict() == _full(path)
+
+    report = build_report_incremental(path, state, percentiles=[90])
+    assert report.to_dict() == _full(path, percentiles=[90])
+
+    state.write_text("{not json", encoding="utf-8")
+    assert build_report_incremental(path, state).to_dict() == _full(path)
+
+
+def test_invalid_new_line_keeps_state(tmp_path: Path) -> None:
+    """An invalid appended packet raises with its file line and does not advance the state."""
+    path = tmp_path / "live.jsonl"
+    state = tmp_path / STATE_FILENAME
+    path.write_text("".join(_line(step) for step in range(5)), encoding="utf-8")
+    build_report_incremental(path, state)
+    saved = state.read_text(encoding="utf-8")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"step": 5}\n')
+    with pytest.raises(ValueError, match="Invalid packet at line 6"):
+        build_report_incremental(path, state)
+    assert state.read_text(encoding="utf-8") == saved
+
+
+def test_accumulator_state_round_trip() -> None:
+    """MetricsAccumulator.to_state() survives JSON and restores key types and order."""
+    accumulator = MetricsAccumulator("ddsketch", relative_accuracy=0.02)
+    for step in range(30):
+        accumulator.update(PacketV2.from_dict(json.loads(_line(step))))
+    restored = MetricsAccumulator.from_state(json.loads(json.dumps(accumulator.to_state())))
+    assert restored.finalize() == accumulator.finalize()
+    assert list(restored.trigger_counts) == list(accumulator.trigger_counts)
+
+
+def test_cli_incremental(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """`run --incremental` writes the state next to the report."""
+    path = tmp_path / "live.jsonl"
+    path.write_text("".join(_line(step) for step in range(8)), encoding="utf-8")
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(path), "--out", str(out), "--incremental"]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(_line(8))
+    main()
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    assert written["input_stats"] == {"total_packets": 9}
+    assert (out / STATE_FILENAME).exists()
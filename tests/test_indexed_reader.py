@@ -0,0 +1,171 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the mmap/line-index reader and seekable gzip/zstd traces."""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.io import indexed_reader
+from eval_calibration_core.io.indexed_reader import (
+    IndexedPacketReader,
+    LineIndex,
+    compress_trace,
+    detect_compression,
+)
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.report.builder import build_report, build_report_parallel
+
+
+def _write_trace(path: Path, count: int = 50, blank_every: int = 0) -> list[PacketV2]:
+    packets = []
+    lines = []
+    for step in range(count):
+        packet = PacketV2(
+            run_id="idx",
+            step=step,
+            input={"ts": step},
+            external={},
+            mdm={"action": "ACT", "confidence": 0.5},
+            final_action={"action": "ACT" if step % 3 else "HOLD", "allowed": True},
+            latency_ms=step % 17,
+            mismatch=None,
+        )
+        packets.append(packet)
+        lines.append(json.dumps(packet.to_dict()) + "\n")
+        if blank_every and step % blank_every == 0:
+            lines.append("\n")
+    path.write_text("".join(lines), encoding="utf-8")
+    return packets
+
+
+@pytest.fixture(params=[None, "gzip", "zstd"])
+def trace(request: pytest.FixtureRequest, tmp_path: Path) -> tuple[Path, list[PacketV2]]:
+    plain = tmp_path / "trace.jsonl"
+    packets = _write_trace(plain, blank_every=7)
+    if request.param is None:
+        return plain, packets
+    if request.param == "zstd":
+        pytest.importorskip("zstandard")
+    path = tmp_path / f"trace.jsonl.{'gz' if request.param == 'gzip' else 'zst'}"
+    # Small frames so packets are spread over (and straddle) many frames
+    assert compress_trace(plain, path, compression=request.param, frame_size=300) > 1
+    assert detect_compression(path) == request.param
+    return path, packets
+
+
+def test_random_access_matches_sequential(trace: tuple[Path, list[PacketV2]]) -> None:
+    """len(), indexing, slices and read() agree with the plain JSONL packets."""
+    path, packets = trace
+    reader = IndexedPacketReader(path)
+    assert len(reader) == len(packets)
+    assert reader[17].to_dict() == packets[17].to_dict()
+    assert reader[-1].to_dict() == packets[-1].to_dict()
+    assert [p.step for p in reader.read_slice(10, 13)] == [10, 11, 12]
+    assert [p.to_dict() for p in reader.read()] == [p.to_dict() for p in packets]
+    with pytest.raises(IndexError):
+        reader[len(packets)]
+
+
+def test_index_sidecar_cached_and_invalidated(tmp_path: Path) -> None:
+    """The .idx sidecar is reused while the trace is unchanged and rebuilt when it changes."""
+    path = tmp_path / "trace.jsonl"
+    _write_trace(path, count=10)
+    reader = IndexedPacketReader(path)
+    assert reader.index_path.exists()
+    assert len(reader.index.line_numbers) == 0  # no blank lines: line = index + 1
+
+    key = json.loads(reader.index_path.read_bytes().split(b"\n", 1)[0])["key"]
+    assert LineIndex.load(reader.index_path, key) is not None
+
+    _write_trace(path, count=12)
+    os.utime(path, ns=(0, 0))
+    assert len(IndexedPacketReader(path)) == 12
+
+    reader.index_path.write_bytes(b"garbage")
+    assert len(IndexedPacketReader(path)) == 12
+
+
+def test_errors_report_file_line(tmp_path: Path) -> None:
+    """Decode errors name the line in the file, counting blank lines."""
+    path = tmp_path / "trace.jsonl"
+    _write_trace(path, count=5, blank_every=2)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"step": 1}\n')
+    reader = IndexedPacketReader(path, cache_index=False)
+    assert not reader.index_path.exists()
+    with pytest.raises(ValueError, match="Invalid packet at line 9"):
+        reader[-1]
+    with pytest.raises(ValueError, match="Invalid packet at line 9"):
+        list(PacketReader(path).read())
+
+
+def test_parallel_over_compressed_trace(tmp_path: Path) -> None:
+    """Sharded evaluation of a gzip trace splits by packet index and matches build_report."""
+    plain = tmp_path / "trace.jsonl"
+    packets = _write_trace(plain, count=200)
+    path = tmp_path / "trace.jsonl.gz"
+    compress_trace(plain, path, frame_size=2048)
+    assert gzip.decompress(path.read_bytes()) == plain.read_bytes()
+    assert IndexedPacketReader(path).shards(3) == [(0, 66), (66, 133), (133, 200)]
+
+    expected = build_report(packets)
+    for workers in (1, 3):
+        report = build_report_parallel(path, workers)
+        assert json.dumps(report.metrics) == json.dumps(expected.metrics)
+        assert report.invariant_results == expected.invariant_results
+
+
+def test_single_member_gzip(tmp_path: Path) -> None:
+    """A regular (single-member) .gz file is read as one frame."""
+    plain = tmp_path / "trace.jsonl"
+    packets = _write_trace(plain, count=20)
+    path = tmp_path / "plain.jsonl.gz"
+    path.write_bytes(gzip.compress(plain.read_bytes()))
+    reader = IndexedPacketReader(path)
+    assert len(reader.index.frame_offsets) == 1
+    assert reader[5].to_dict() == packets[5].to_dict()
+
+
+def test_sequential_read_streams_compressed_trace(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """read() streams a single-member .gz instead of loading the whole frame."""
+    plain = tmp_path / "trace.jsonl"
+    packets = _write_trace(plain, count=3000, blank_every=11)
+    with open(plain, "ab") as f:
+        f.write(json.dumps(packets[0].to_dict()).encode("utf-8"))  # no final newline
+    packets.append(packets[0])
+    path = tmp_path / "plain.jsonl.gz"
+    path.write_bytes(gzip.compress(plain.read_bytes()))
+    reader = IndexedPacketReader(path)
+    assert len(reader.index.frame_offsets) == 1
+
+    def whole_frame(frame):
+        raise AssertionError("sequential reads must not load a whole frame")
+
+    monkeypatch.setattr(reader, "_frame_data", whole_frame)
+    monkeypatch.setattr(indexed_reader, "_COMPRESSED_CHUNK", 97)  # lines straddle chunks
+    assert [p.to_dict() for p in reader.read()] == [p.to_dict() for p in packets]
+    assert [p.step for p in reader.read_slice(1500, 1503)] == [1500, 1501, 1502]
+    assert len(reader.read_columns()) == len(packets)
+
+
+def test_failed_index_save_removes_temp_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed sidecar write leaves no temporary file; the reader keeps its index."""
+    path = tmp_path / "trace.jsonl"
+    _write_trace(path, count=5)
+
+    def broken(*args):
+        raise OSError("read-only")
+
+    monkeypatch.setattr(os, "replace", broken)
+    assert len(IndexedPacketReader(path)) == 5
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["trace.jsonl"]
@@ -10,6 +10,7 @@ from pathlib import Path
 import pytest
 
 from decision_schema.packet_v2 import PacketV2
+from eval_calibration_core.io.decoders import available_decoders
 from eval_calibration_core.io.packet_reader import PacketReader
 
 
@@ -57,3 +58,41 @@ def test_packet_reader_handles_missing_file() -> None:
     """Verify PacketReader handles missing file."""
     with pytest.raises(FileNotFoundError):
         PacketReader(Path("nonexistent.jsonl"))
+
+
+@pytest.mark.parametrize("backend", available_decoders())
+def test_packet_reader_decoder_backends_agree(backend: str, tmp_path: Path) -> None:
+    """Every installed decoder yields the same packets and the same error line numbers."""
+    path = tmp_path / "trace.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for step in range(3):
+            packet = PacketV2(
+                run_id="test-run",
+                step=step,
+                input={"big": 2**70, "nan": float("nan")},
+                external={"mid": 0.5},
+                mdm={"action": "HOLD", "confidence": 0.25},
+                final_action={"action": "HOLD"},
+                latency_ms=2,
+            )
+            f.write(json.dumps(packet.to_dict()) + "\n\n")
+        f.write("{broken\n")
+
+    reader = PacketReader(path, decoder=backend)
+    assert reader.decoder.name == backend
+    reference = PacketReader(path, decoder="json")
+    fast = reader.read()
+    for expected in list(reference.read_range(0, path.stat().st_size - len("{broken\n"))):
+        packet = next(fast)
+        assert packet.input["big"] == expected.input["big"] == 2**70
+        assert packet.mdm == expected.mdm
+    with pytest.raises(ValueError, match="Invalid packet at line 7"):
+        next(fast)
+
+
+def test_packet_reader_unknown_decoder(tmp_path: Path) -> None:
+    """Unknown decoder names are rejected at construction."""
+    path = tmp_path / "trace.jsonl"
+    path.write_text("", encoding="utf-8")
+    with pytest.raises(ValueError, match="Unknown decoder backend"):
+        PacketReader(path, decoder="yaml")
@@ -0,0 +1,95 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for byte-range sharding and parallel evaluation."""
+
+import json
+from itertools import pairwise
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.report import build_report_parallel, build_report_streaming
+from eval_calibration_core.suites.invariants import InvariantAccumulator
+
+
+def _write_trace(path: Path, n: int) -> Path:
+    with open(path, "w", encoding="utf-8") as f:
+        for step in range(n):
+            denied = step % 6 == 0
+            packet = PacketV2(
+                run_id="shard-run",
+                step=step,
+                input={"ts": step},
+                external={"mid": 0.5},
+                mdm={"action": "ACT", "confidence": 0.5 if step != 130 else 1.5},
+                final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+                latency_ms=step % 17,
+                mismatch={"flags": ["f"], "reason_codes": [f"code{step % 4}"]} if denied else None,
+            )
+            f.write(json.dumps(packet.to_dict()) + "\n")
+            if step % 50 == 0:
+                f.write("\n")
+    return path
+
+
+def test_shards_cover_file_at_line_boundaries(tmp_path: Path) -> None:
+    """Shards are contiguous, cover the file, and start at line starts."""
+    path = _write_trace(tmp_path / "trace.jsonl", 200)
+    reader = PacketReader(path)
+    data = path.read_bytes()
+    for count in (1, 2, 3, 7, 64):
+        shards = reader.shards(count)
+        assert shards[0][0] == 0 and shards[-1][1] == len(data)
+        for (_, end), (start, _) in pairwise(shards):
+            assert end == start and data[start - 1 : start] == b"\n"
+        packets = [p for start, end in shards for p in reader.read_range(start, end)]
+        assert [p.step for p in packets] == list(range(200))
+
+
+def test_parallel_report_matches_serial(tmp_path: Path) -> None:
+    """Sharded multi-process report equals the serial streaming report."""
+    path = _write_trace(tmp_path / "trace.jsonl", 400)
+    serial = build_report_streaming(PacketReader(path).read(), suite_name="trace")
+    for workers in (1, 3):
+        parallel = build_report_parallel(path, workers, suite_name="trace")
+        assert json.dumps(parallel.to_dict()) == json.dumps(serial.to_dict())
+    assert serial.invariant_results["confidence_clamp"] is False
+
+
+def test_parallel_reports_global_line_number(tmp_path: Path) -> None:
+    """Parse errors in a later shard report the line number within the whole file."""
+    path = tmp_path / "trace.jsonl"
+    _write_trace(path, 100)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+    total_lines = path.read_bytes().count(b"\n")
+    with pytest.raises(ValueError, match=f"Invalid packet at line {total_lines}"):
+        build_report_parallel(path, 4)
+
+
+def test_invariant_merge_drops_errors_after_failure() -> None:
+    """A check error in a later shard is ignored if the invariant already failed earlier."""
+
+    def packet(confidence: object) -> SimpleNamespace:
+        return SimpleNamespace(
+            mdm={"action": "HOLD", "confidence": confidence},
+            final_action={"action": "HOLD"},
+            mismatch=None,
+            external={},
+            schema_version="0.2.0",
+        )
+
+    first, second = InvariantAccumulator(defer_errors=True), InvariantAccumulator(defer_errors=True)
+    first.update(packet(2.0))
+    second.update(packet("not-a-number"))
+    assert first.merge(second).finalize()["confidence_clamp"] is False
+
+    first, second = InvariantAccumulator(defer_errors=True), InvariantAccumulator(defer_errors=True)
+    first.update(packet(0.5))
+    second.update(packet("not-a-number"))
+    with pytest.raises(TypeError):
+        first.merge(second).finalize()
@@ -0,0 +1,100 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for per-stage profiling (Profiler, Report.perf, --profile)."""
+
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.io.fixtures import load_fixture_suite
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.profiling import NULL_PROFILER, Profiler
+from eval_calibration_core.report.builder import build_report, build_report_streaming
+from eval_calibration_core.report.writer import write_report
+
+
+def _write_trace(path: Path) -> list:
+    packets = load_fixture_suite("guard_pressure") * 5
+    path.write_text("".join(json.dumps(p.to_dict()) + "\n" for p in packets), encoding="utf-8")
+    return packets
+
+
+def test_stage_records_time_and_nested_peak() -> None:
+    """stage() measures wall/CPU time; an inner peak also counts for the outer stage."""
+    profiler = Profiler()
+    with profiler.stage("outer") as outer:
+        with profiler.stage("inner") as inner:
+            blob = bytearray(4 << 20)
+            inner.packets = 10
+        del blob
+    perf = profiler.to_dict()
+    assert not tracemalloc.is_tracing()
+    assert list(perf["stages"]) == ["outer", "inner"]
+    assert perf["stages"]["inner"]["peak_traced_mb"] >= 4.0
+    assert outer.peak_traced_bytes >= inner.peak_traced_bytes
+    assert perf["stages"]["inner"]["packets"] == 10
+    assert perf["stages"]["outer"]["packets_per_s"] is None
+
+    with NULL_PROFILER.stage("ignored") as stats:
+        stats.packets = 1
+    NULL_PROFILER.add("ignored", 1.0, 1.0)
+
+
+def test_profiled_build_matches_plain(tmp_path: Path) -> None:
+    """Profiling records sub-stages without changing the report."""
+    packets = _write_trace(tmp_path / "trace.jsonl")
+    profiler = Profiler(trace_memory=False)
+    reader = PacketReader(tmp_path / "trace.jsonl", profiler=profiler)
+    report = build_report_streaming(reader.read(), profiler=profiler)
+    assert report.to_dict() == build_report(packets).to_dict()
+    assert report.perf is None
+
+    stages = profiler.to_dict()["stages"]
+    for name in ("read.parse_json", "read.from_dict", "evaluate.read", "evaluate.metrics"):
+        assert stages[name]["packets"] == len(packets)
+    assert stages["evaluate"]["packets"] == len(packets)
+    assert "peak_traced_mb" not in stages["evaluate"]
+    assert "finalize" in stages
+
+
+def test_profiled_reader_reports_invalid_line(tmp_path: Path) -> None:
+    """The instrumented read loop keeps PacketReader's error messages."""
+    path = tmp_path / "trace.jsonl"
+    path.write_text('{"step": 0}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="Invalid packet at line 1"):
+        list(PacketReader(path, profiler=Profiler(trace_memory=False)).read())
+
+
+def test_cli_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """`run --profile` writes report.json once with a perf block, then the full perf.json."""
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace)
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(trace), "--out", str(out), "--profile"]
+    monkeypatch.setattr(sys, "argv", argv)
+    calls = []
+
+    def spy(report, *args, **kwargs):
+        calls.append(report.perf)
+        return write_report(report, *args, **kwargs)
+
+    monkeypatch.setattr("eval_calibration_core.report.writer.write_report", spy)
+    main()
+    assert len(calls) == 1 and calls[0] is not None
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    stages = written["perf"]["stages"]
+    assert {"read", "read.parse_json", "evaluate", "finalize"} <= set(stages)
+    assert "## Performance" in (out / "report.md").read_text(encoding="utf-8")
+    perf = json.loads((out / "perf.json").read_text(encoding="utf-8"))
+    assert set(perf["stages"]) == set(stages) | {"write_report"}
+    assert perf["stages"]["write_report"]["wall_s"] > 0
+    assert not tracemalloc.is_tracing()
+
+    monkeypatch.setattr(sys, "argv", argv[:-1])
+    main()
+    assert "perf" not in json.loads((out / "report.json").read_text(encoding="utf-8"))
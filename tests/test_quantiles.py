@@ -0,0 +1,90 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for latency quantile backends."""
+
+import random
+
+import pytest
+
+from eval_calibration_core.io.fixtures import load_fixture_suite
+from eval_calibration_core.metrics.compute import compute_metrics
+from eval_calibration_core.metrics.quantiles import (
+    DDSketch,
+    ExactQuantiles,
+    parse_percentiles,
+    percentile_key,
+)
+
+PERCENTILES = [50, 90, 95, 99, 99.9, "max"]
+
+
+def _exact(values: list[float], p: float | str) -> float:
+    ordered = sorted(values)
+    if p == "max":
+        return ordered[-1]
+    return ordered[min(int((p / 100.0) * len(ordered)), len(ordered) - 1)]
+
+
+def test_percentile_keys_and_parsing() -> None:
+    """Percentile keys are stable and the CLI spec parses to numbers and 'max'."""
+    assert [percentile_key(p) for p in PERCENTILES] == ["p50", "p90", "p95", "p99", "p99.9", "max"]
+    assert parse_percentiles("50, p99.9,max") == [50.0, 99.9, "max"]
+    with pytest.raises(ValueError):
+        parse_percentiles("101")
+    for spec in ("100,max", "50,p50.0"):
+        with pytest.raises(ValueError, match="Duplicate percentile"):
+            parse_percentiles(spec)
+
+
+def test_exact_backend_is_nearest_rank() -> None:
+    """Exact backend returns the nearest-rank sample for arbitrary percentiles."""
+    rng = random.Random(7)
+    values = [rng.randint(0, 500) for _ in range(1000)]
+    estimator = ExactQuantiles()
+    for v in values:
+        estimator.add(v)
+    result = estimator.quantiles(PERCENTILES)
+    for p in PERCENTILES:
+        assert result[percentile_key(p)] == _exact(values, p)
+
+
+def test_ddsketch_relative_error_and_merge() -> None:
+    """DDSketch stays within its relative error bound, including after merging shards."""
+    rng = random.Random(11)
+    values = [rng.lognormvariate(2.0, 1.0) for _ in range(5000)]
+    shards = [DDSketch(0.02) for _ in range(4)]
+    for i, v in enumerate(values):
+        shards[i % 4].add(v)
+    sketch = shards[0]
+    for shard in shards[1:]:
+        sketch.merge(shard)
+    assert sketch.count == len(values)
+    result = sketch.quantiles(PERCENTILES)
+    for p in PERCENTILES:
+        expected = _exact(values, p)
+        assert abs(result[percentile_key(p)] - expected) <= 0.02 * expected + 1e-12
+    assert result["max"] == max(values)
+
+    with pytest.raises(ValueError):
+        sketch.merge(DDSketch(0.05))
+
+
+def test_compute_metrics_records_backend() -> None:
+    """Explicit backend adds latency_estimator; default output keeps canonical keys."""
+    packets = load_fixture_suite("determinism")
+    default = compute_metrics(packets)
+    assert "latency_estimator" not in default
+
+    sketched = compute_metrics(
+        packets, latency_backend="ddsketch", relative_accuracy=0.01, percentiles=PERCENTILES
+    )
+    assert sketched["latency_estimator"] == {
+        "backend": "ddsketch",
+        "relative_accuracy": 0.01,
+        "samples": 20,
+    }
+    assert list(sketched["latency_percentiles"]) == ["p50", "p90", "p95", "p99", "p99.9", "max"]
+    for key in ("p50", "p95", "p99"):
+        exact = default["latency_percentiles"][key]
+        assert abs(sketched["latency_percentiles"][key] - exact) <= 0.01 * exact
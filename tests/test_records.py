@@ -0,0 +1,137 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for projected packet records (reader fields=)."""
+
+import gzip
+import json
+import math
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.io.indexed_reader import IndexedPacketReader
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.io.records import Interner, PacketRecord, record_builder
+from eval_calibration_core.metrics.windows import WindowSpec
+from eval_calibration_core.registry import CORE_FIELDS
+from eval_calibration_core.report import (
+    build_report,
+    build_report_incremental,
+    build_report_parallel,
+    build_report_streaming,
+    report_fields,
+)
+
+
+def _packet(step: int) -> PacketV2:
+    denied = step % 6 == 0
+    return PacketV2(
+        run_id=f"run-{step % 3}",
+        step=step,
+        input={"ts": step * 10},
+        external={},
+        mdm={"action": "ACT", "confidence": (step % 10) / 10},
+        final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+        latency_ms=step % 17,
+        mismatch={"flags": ["limit"], "reason_codes": ["limit"]} if denied else None,
+    )
+
+
+def _write_trace(path: Path, n: int = 120) -> list[PacketV2]:
+    packets = [_packet(step) for step in range(n)]
+    path.write_text("".join(json.dumps(p.to_dict()) + "\n" for p in packets), encoding="utf-8")
+    return packets
+
+
+def test_projected_reports_match(tmp_path: Path) -> None:
+    """Reports over projected records equal reports over PacketV2, for every reader."""
+    trace = tmp_path / "trace.jsonl"
+    packets = _write_trace(trace)
+    expected = build_report(packets).to_dict()
+    fields = report_fields()
+    assert fields == CORE_FIELDS
+
+    records = PacketReader(trace, fields=fields).read_all()
+    assert all(isinstance(r, PacketRecord) for r in records)
+    assert build_report_streaming(iter(records)).to_dict() == expected
+
+    packed = tmp_path / "trace.jsonl.gz"
+    packed.write_bytes(gzip.compress(trace.read_bytes()))
+    reader = IndexedPacketReader(packed, cache_index=False, fields=fields)
+    assert build_report_streaming(reader.read()).to_dict() == expected
+
+    assert build_report_parallel(trace, 3, project_fields=True).to_dict() == expected
+    state = tmp_path / "report.state.json"
+    assert build_report_incremental(trace, state, project_fields=True).to_dict() == expected
+
+    window = WindowSpec(200)
+    assert "input" in report_fields(window=window)
+    assert "input" in report_fields(group_by="tenant")
+    assert "input" not in report_fields(group_by="run_id")
+    assert report_fields(outcome=lambda packet: 1.0) is None
+
+
+def test_records_hold_only_projected_fields() -> None:
+    """Unset fields raise AttributeError; unknown fields are rejected up front."""
+    record = record_builder(["step", "mismatch"])({"step": 3, "latency_ms": 5})
+    assert record.step == 3
+    assert record.mismatch is None
+    assert not hasattr(record, "latency_ms")  # getattr raises AttributeError
+    assert record.to_dict() == {"step": 3, "mismatch": None}
+    with pytest.raises(ValueError, match="Unknown packet fields"):
+        record_builder(["step", "payload"])
+
+
+def test_missing_required_field_reports_line(tmp_path: Path) -> None:
+    """Projection skips validation but a missing required field still fails by line."""
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace, n=3)
+    with open(trace, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"run_id": "x", "step": 4}) + "\n")
+    with pytest.raises(ValueError, match="Invalid packet at line 4"):
+        PacketReader(trace, fields=CORE_FIELDS).read_all()
+
+
+def test_compact_records_share_values(tmp_path: Path) -> None:
+    """Compact records give the same report, share equal values and convert back."""
+    trace = tmp_path / "trace.jsonl"
+    packets = _write_trace(trace)
+    records = PacketReader(trace, compact=True).read_all()
+    assert build_report(records).to_dict() == build_report(packets).to_dict()
+    assert [r.to_packet() for r in records] == packets
+
+    a, b = records[1], records[2]  # both allowed ACT packets
+    assert a.final_action is b.final_action
+    assert records[0].mismatch["flags"] == ("limit",)
+    assert records[0].mismatch is records[6].mismatch
+    with pytest.raises(TypeError, match="read-only"):
+        a.final_action["allowed"] = False
+    assert isinstance(a.final_action, dict) and a.input is not b.input
+
+    projected = PacketReader(trace, fields=CORE_FIELDS, compact=True).read_all()
+    assert build_report(projected).to_dict() == build_report(packets).to_dict()
+
+
+def test_interner_keeps_types_and_bound() -> None:
+    """Equal values of different types stay distinct; the table stops growing at max_size."""
+    interner = Interner(max_size=3)
+    assert interner.freeze({"allowed": True})["allowed"] is True
+    assert interner.freeze({"allowed": 1})["allowed"] == 1
+    assert interner.freeze({"allowed": 1})["allowed"] is not True
+    interner.freeze([1.5])
+    interner.freeze([2.5])
+    assert len(interner) == 3
+
+
+def test_interner_nan_and_signed_zero() -> None:
+    """NaN values share one table entry; -0.0 is not replaced by 0.0."""
+    interner = Interner()
+    for _ in range(100):
+        interner.freeze(float("nan"))
+        interner.freeze({"confidence": float("nan")})
+    assert len(interner) == 2
+    assert math.copysign(1.0, interner.freeze(0.0)) == 1.0
+    assert math.copysign(1.0, interner.freeze(-0.0)) == -1.0
+    assert math.copysign(1.0, interner.freeze([-0.0])[0]) == -1.0
@@ -0,0 +1,138 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the plugin metric and invariant registry."""
+
+import importlib.metadata
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.registry import Registry, load_entry_points
+from eval_calibration_core.report import (
+    build_report,
+    build_report_incremental,
+    build_report_parallel,
+    build_report_streaming,
+)
+from eval_calibration_core.report.writer import _format_markdown
+
+REGISTRY = Registry()
+
+
+@REGISTRY.metric("slow_steps", fields=["latency_ms"])
+class SlowSteps:
+    """Packets slower than 8 ms."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def update(self, packet: Any) -> None:
+        self.count += packet.latency_ms > 8
+
+    def merge(self, other: "SlowSteps") -> "SlowSteps":
+        self.count += other.count
+        return self
+
+    def to_state(self) -> dict[str, Any]:
+        return {"count": self.count}
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "SlowSteps":
+        metric = cls()
+        metric.count = state["count"]
+        return metric
+
+    def finalize(self) -> int:
+        return self.count
+
+
+@REGISTRY.invariant("seeded_input", fields=["input"])
+def seeded_input(packet: Any) -> bool:
+    """Every packet carries an input seed."""
+    return "seed" in packet.input
+
+
+def _packet(step: int) -> PacketV2:
+    return PacketV2(
+        run_id="plugin-run",
+        step=step,
+        input={} if step == 37 else {"seed": step},
+        external={},
+        mdm={"action": "ACT", "confidence": 0.5},
+        final_action={"action": "ACT", "allowed": True},
+        latency_ms=step % 10,
+    )
+
+
+def _write_trace(path: Path, n: int = 100) -> Path:
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(_packet(step).to_dict()) + "\n" for step in range(n))
+    return path
+
+
+def test_plugins_run_in_the_report_pass() -> None:
+    """Plugins report next to the built-ins from the one pass over a lazy iterable."""
+    report = build_report_streaming((_packet(i) for i in range(100)), registry=REGISTRY)
+    assert report.metrics["slow_steps"] == 10
+    assert report.invariant_results["seeded_input"] is False
+    assert report.invariant_results["fail_closed"] is True
+    assert "slow_steps" not in build_report([_packet(0)]).metrics  # default registry is empty
+    assert "### slow_steps: 10" in _format_markdown(report)
+
+    audit = build_report(
+        [_packet(i) for i in range(100)], invariant_mode="audit", registry=REGISTRY
+    )
+    assert audit.violations["invariants"]["seeded_input"]["runs"] == [[37, 1]]
+
+
+def test_plugins_shard_and_persist(tmp_path: Path) -> None:
+    """Sharded and incremental runs merge and persist plugin state like the built-ins."""
+    trace = _write_trace(tmp_path / "trace.jsonl")
+    serial = build_report([_packet(i) for i in range(100)], registry=REGISTRY)
+    assert build_report_parallel(trace, 3, registry=REGISTRY).to_dict() == serial.to_dict()
+
+    lines = trace.read_text(encoding="utf-8").splitlines(keepends=True)
+    live = tmp_path / "live.jsonl"
+    state = tmp_path / "report.state.json"
+    live.write_text("".join(lines[:30]), encoding="utf-8")
+    build_report_incremental(live, state, registry=REGISTRY)
+    live.write_text("".join(lines), encoding="utf-8")
+    report = build_report_incremental(live, state, registry=REGISTRY)
+    assert report.metrics["slow_steps"] == 10
+    assert report.invariant_results == serial.invariant_results
+
+
+def test_registration_validation_and_fields() -> None:
+    """Names must be unique and fields real; fields() is the union the pass reads."""
+    registry = Registry()
+    with pytest.raises(ValueError):
+        registry.metric("total_steps", fields=[])
+    with pytest.raises(ValueError):
+        registry.invariant("x", fields=["payload"])
+    assert "input" not in registry.fields()
+    registry.invariant("x", fields=["input"])(seeded_input)
+    assert "input" in registry.fields()
+    with pytest.raises(ValueError):
+        registry.metric("x", fields=[])
+    registry.unregister("x")
+    assert registry.names() == []
+
+
+def test_load_entry_points(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Installed entry points are called with the registry."""
+
+    class EntryPoint:
+        name = "demo"
+
+        @staticmethod
+        def load():
+            return lambda registry: registry.invariant("demo", fields=["mdm"])(seeded_input)
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [EntryPoint()])
+    registry = Registry()
+    assert load_entry_points(registry) == ["demo"]
+    assert registry.names() == ["demo"]
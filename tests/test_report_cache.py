@@ -0,0 +1,125 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the content-addressed report cache."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cache import ContentCache, file_digest
+from eval_calibration_core.cli import main
+from eval_calibration_core.io import readers
+from eval_calibration_core.report import build_report, build_report_cached
+
+
+def _write_trace(path: Path, n: int = 50) -> list[PacketV2]:
+    packets = [
+        PacketV2(
+            run_id="cache-run",
+            step=step,
+            input={"ts": step},
+            external={},
+            mdm={"action": "ACT", "confidence": (step % 10) / 10},
+            final_action={"action": "ACT", "allowed": True},
+            latency_ms=step % 7,
+        )
+        for step in range(n)
+    ]
+    path.write_text("".join(json.dumps(p.to_dict()) + "\n" for p in packets), encoding="utf-8")
+    return packets
+
+
+def test_cache_hit_skips_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second build of an unchanged trace is served from the cache; options are keyed."""
+    trace = tmp_path / "trace.jsonl"
+    packets = _write_trace(trace)
+    cache = ContentCache(tmp_path / "cache", "reports")
+    first = build_report_cached(trace, cache, percentiles=[50, 99])
+    assert (
+        first.to_dict() == build_report(packets, suite_name="trace", percentiles=[50, 99]).to_dict()
+    )
+
+    def no_read(*args, **kwargs):
+        raise AssertionError("trace was re-read")
+
+    monkeypatch.setattr(readers, "open_packet_reader", no_read)
+    assert build_report_cached(trace, cache, percentiles=[50, 99]).to_dict() == first.to_dict()
+    with pytest.raises(AssertionError, match="re-read"):
+        build_report_cached(trace, cache, percentiles=[50])  # other configuration: miss
+    monkeypatch.undo()
+
+    _write_trace(trace, n=60)  # new content: miss
+    assert build_report_cached(trace, cache).input_stats["total_packets"] == 60
+
+
+def test_quick_digest_and_eviction(tmp_path: Path) -> None:
+    """Quick digests follow size and mtime; eviction drops least recently used entries."""
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace)
+    quick = file_digest(trace, quick=True)
+    assert quick != file_digest(trace)
+    os.utime(trace, ns=(1, 1))
+    assert file_digest(trace, quick=True) != quick
+
+    cache = ContentCache(tmp_path / "cache", "reports", max_bytes=300)  # room for three entries
+    for i, key in enumerate(["aa01", "bb02", "cc03"]):
+        path = cache.put(key, {"payload": "x" * 80})
+        os.utime(path, ns=(i, i))
+    cache.get("aa01")  # refreshed: now the most recently used
+    cache.put("dd04", {"payload": "x" * 80})
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") is not None and cache.get("dd04") is not None
+
+
+def test_cli_run_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """`run --cache` writes the same report on a hit without reading the trace."""
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace)
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(trace), "--out", str(out), "--cache"]
+    argv += ["--cache-dir", str(tmp_path / "cache"), "--quick-hash"]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+    written = (out / "report.json").read_text(encoding="utf-8")
+    assert list((tmp_path / "cache" / "reports").rglob("*.json"))
+
+    (out / "report.json").unlink()
+    monkeypatch.setattr("eval_calibration_core.cli._packet_reader", lambda *a: 1 / 0)
+    main()
+    assert (out / "report.json").read_text(encoding="utf-8") == written
+    assert "[OK]" in capsys.readouterr().out
+
+
+def test_cli_cache_stores_fitted_calibrators(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cached reports include --fit-calibrators output, keyed by the fitted methods."""
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace)
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(trace), "--out", str(out), "--cache"]
+    argv += ["--cache-dir", str(tmp_path / "cache"), "--fit-calibrators"]
+    monkeypatch.setattr(sys, "argv", [*argv, "isotonic"])
+    main()
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    assert list(written["calibration_summary"]["calibrators"]["fits"]) == ["isotonic"]
+
+    fitted = []
+    monkeypatch.setattr(
+        "eval_calibration_core.cli._fit_calibrators",
+        lambda args, path, methods, *rest: fitted.append(methods) or {},
+    )
+    main()
+    assert json.loads((out / "report.json").read_text(encoding="utf-8")) == written
+    assert fitted == []
+
+    monkeypatch.setattr(sys, "argv", [*argv, "platt"])
+    main()
+    assert fitted == [["platt"]]
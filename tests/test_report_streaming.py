@@ -0,0 +1,91 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the constant-memory streaming report path."""
+
+import json
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.report import build_report, build_report_streaming
+
+
+def _packet(step: int, float_latency: bool = False) -> PacketV2:
+    has_mismatch = step % 4 == 0
+    return PacketV2(
+        run_id="stream-run",
+        step=step,
+        input={"ts": 1000 + step},
+        external={"mid": 0.5},
+        mdm={"action": "ACT", "confidence": 0.7},
+        final_action={"action": "HOLD" if has_mismatch else "ACT", "allowed": not has_mismatch},
+        latency_ms=step * 0.001 if float_latency else 1 + step % 9,
+        mismatch={"flags": ["limit"], "reason_codes": ["cooldown"]} if has_mismatch else None,
+    )
+
+
+def _generate(n: int, float_latencies: bool = False) -> Iterator[PacketV2]:
+    for step in range(n):
+        yield _packet(step, float_latencies)
+
+
+def _write_trace(path: Path, n: int) -> Path:
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(packet.to_dict()) + "\n" for packet in _generate(n))
+    return path
+
+
+def test_build_report_streaming_matches_list_path(tmp_path: Path) -> None:
+    """Streaming report from PacketReader.read() equals list-based report."""
+    reader = PacketReader(_write_trace(tmp_path / "trace.jsonl", 250))
+    streamed = build_report_streaming(reader.read(), suite_name="trace")
+    listed = build_report(reader.read_all(), suite_name="trace")
+    assert streamed.to_dict() == listed.to_dict()
+    assert streamed.input_stats == {"total_packets": 250}
+
+
+def _peak_bytes(n: int, float_latencies: bool = False, **options) -> int:
+    packets = _generate(n, float_latencies)
+    tracemalloc.start()
+    try:
+        build_report_streaming(packets, **options)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_build_report_streaming_memory_independent_of_length() -> None:
+    """Peak traced memory does not scale with the number of packets."""
+    small = _peak_bytes(1_000)
+    large = _peak_bytes(20_000)
+    assert large < small * 2
+
+
+def test_streaming_float_latencies_need_ddsketch_for_constant_memory() -> None:
+    """The exact backend keeps every distinct float latency; ddsketch stays bounded."""
+    exact = [_peak_bytes(n, float_latencies=True) for n in (1_000, 10_000)]
+    sketch = [
+        _peak_bytes(n, float_latencies=True, latency_backend="ddsketch") for n in (1_000, 10_000)
+    ]
+    assert exact[1] > exact[0] * 4
+    assert sketch[1] < sketch[0] * 2
+
+
+def test_cli_run_stream(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """`run --stream --in` writes the same report.json as the default mode."""
+    trace = _write_trace(tmp_path / "trace.jsonl", 50)
+    outputs = {}
+    for mode, extra in (("default", []), ("stream", ["--stream"])):
+        out = tmp_path / mode
+        argv = ["eval-cal", "run", "--in", str(trace), "--out", str(out), *extra]
+        monkeypatch.setattr(sys, "argv", argv)
+        main()
+        outputs[mode] = (out / "report.json").read_text(encoding="utf-8")
+    assert outputs["stream"] == outputs["default"]
@@ -0,0 +1,177 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for fail-fast and audit invariant modes (violation localization)."""
+
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.report import (
+    build_report,
+    build_report_incremental,
+    build_report_parallel,
+    build_report_streaming,
+)
+from eval_calibration_core.suites.invariants import InvariantAccumulator
+from eval_calibration_core.suites.violations import InvariantViolation, ViolationRuns
+
+# Packet offsets with an out-of-range confidence / a fail-open decision
+CLAMP_BAD = {10, 11, 12, 40, 199}
+FAIL_OPEN = {70}
+
+
+def _packet(step: int) -> PacketV2:
+    fail_open = step in FAIL_OPEN
+    return PacketV2(
+        run_id="audit-run",
+        step=step,
+        input={},
+        external={},
+        mdm={"action": "ACT", "confidence": 1.5 if step in CLAMP_BAD else 0.5},
+        final_action={"action": "ACT", "allowed": True},
+        latency_ms=step % 9,
+        mismatch={"flags": ["f"], "reason_codes": ["guard"]} if fail_open else None,
+    )
+
+
+def _write_trace(path: Path, n: int = 200) -> Path:
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(_packet(step).to_dict()) + "\n" for step in range(n))
+    return path
+
+
+def test_violation_runs_encoding_and_truncation() -> None:
+    """Consecutive offsets collapse into runs; past max_runs only the counts stay exact."""
+    runs = ViolationRuns(max_runs=2)
+    for index in (3, 4, 5, 9, 20, 21):
+        runs.add(index, step=index)
+    entry = runs.finalize()
+    assert entry["runs"] == [[3, 3], [9, 1]] and entry["truncated"] is True
+    assert (entry["count"], entry["first"], entry["last"]) == (6, 3, 21)
+
+    head, tail = ViolationRuns(), ViolationRuns()
+    head.add(8)
+    tail.add(0)
+    tail.add(5)
+    head.merge(tail, offset=9)
+    assert head.finalize()["runs"] == [[8, 2], [14, 1]]
+    assert ViolationRuns.from_state(head.to_state()).finalize() == head.finalize()
+
+
+def test_audit_records_every_violation() -> None:
+    """Audit mode checks every packet: all violating offsets, counts and first/last."""
+    report = build_report([_packet(i) for i in range(200)], invariant_mode="audit")
+    assert report.invariant_results["confidence_clamp"] is False
+    clamp = report.violations["invariants"]["confidence_clamp"]
+    assert clamp["runs"] == [[10, 3], [40, 1], [199, 1]]
+    assert (clamp["count"], clamp["first"], clamp["last"], clamp["last_step"]) == (5, 10, 199, 199)
+    assert report.violations["invariants"]["fail_closed"]["runs"] == [[70, 1]]
+    assert report.violations["invariants"]["packet_version"]["count"] == 0
+    assert "violations" not in build_report([_packet(0)]).to_dict()
+
+
+def test_fail_fast_stops_at_first_violation() -> None:
+    """Fail-fast raises at the first violating packet and stops consuming the stream."""
+    consumed = []
+
+    def packets():
+        for i in range(200):
+            consumed.append(i)
+            yield _packet(i)
+
+    with pytest.raises(InvariantViolation) as excinfo:
+        build_report_streaming(packets(), invariant_mode="fail_fast")
+    assert (excinfo.value.invariant, excinfo.value.index, excinfo.value.step) == (
+        "confidence_clamp",
+        10,
+        10,
+    )
+    assert consumed[-1] == 10
+    with pytest.raises(ValueError):
+        InvariantAccumulator(mode="strict")
+
+
+def test_sharded_and_incremental_localization(tmp_path: Path) -> None:
+    """Sharded and incremental runs report the same offsets as a serial run."""
+    trace = _write_trace(tmp_path / "trace.jsonl")
+    serial = build_report([_packet(i) for i in range(200)], invariant_mode="audit")
+    sharded = build_report_parallel(trace, 4, invariant_mode="audit")
+    assert sharded.violations == serial.violations
+
+    state = tmp_path / "report.state.json"
+    head = trace.read_text(encoding="utf-8").splitlines(keepends=True)
+    live = tmp_path / "live.jsonl"
+    live.write_text("".join(head[:50]), encoding="utf-8")
+    build_report_incremental(live, state, invariant_mode="audit")
+    live.write_text("".join(head), encoding="utf-8")
+    assert build_report_incremental(live, state, invariant_mode="audit").violations == (
+        serial.violations
+    )
+
+    with pytest.raises(InvariantViolation) as excinfo:
+        build_report_parallel(trace, 4, invariant_mode="fail_fast")
+    assert excinfo.value.index == 10
+
+
+def test_cli_fail_fast_and_audit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """`run --fail-fast` reports the violating packet; `run --audit` writes violations."""
+    trace = _write_trace(tmp_path / "trace.jsonl")
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(trace), "--out", str(out)]
+    monkeypatch.setattr(sys, "argv", argv + ["--fail-fast"])
+    main()
+    assert "[FAIL] Invariant confidence_clamp violated at packet 10" in capsys.readouterr().out
+    assert not (out / "report.json").exists()
+
+    monkeypatch.setattr(sys, "argv", argv + ["--audit"])
+    main()
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    assert written["violations"]["invariants"]["fail_closed"]["first"] == 70
+    assert "## Invariant Violations" in (out / "report.md").read_text(encoding="utf-8")
+
+
+def _erroring_trace(path: Path, bad: dict[int, dict]) -> list[PacketV2]:
+    """200 clean packets with overrides (e.g. a violation, then a check error) by offset."""
+    packets = []
+    for step in range(200):
+        data = {**_packet(step).to_dict(), "mdm": {"action": "ACT", "confidence": 0.5}}
+        data["mismatch"] = None
+        data.update(bad.get(step, {}))
+        packets.append(PacketV2.from_dict(data))
+    path.write_text("".join(json.dumps(p.to_dict()) + "\n" for p in packets), encoding="utf-8")
+    return packets
+
+
+def _outcome(build: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[type, str]:
+    try:
+        build(*args, **kwargs)
+    except (InvariantViolation, AttributeError, TypeError) as e:
+        return type(e), str(e)
+    raise AssertionError("expected an error")
+
+
+@pytest.mark.parametrize("mode", ["fail_fast", "audit"])
+def test_sharded_check_errors_match_serial(tmp_path: Path, mode: str) -> None:
+    """A violation followed by a check error in a later shard raises what a serial run raises."""
+    clamp = {"mdm": {"action": "ACT", "confidence": 1.5}}
+    bad_external = {"external": [], "final_action": {"action": "HOLD", "allowed": False}}
+    bad_confidence = {"mdm": {"action": "ACT", "confidence": "bad"}}
+    for later in (bad_external, bad_confidence):
+        trace = tmp_path / "trace.jsonl"
+        packets = _erroring_trace(trace, {3: clamp, 150: later})
+        serial = _outcome(build_report, packets, invariant_mode=mode)
+        sharded = _outcome(build_report_parallel, trace, 4, invariant_mode=mode)
+        assert sharded == serial
+        if mode == "fail_fast":
+            assert serial[0] is InvariantViolation and "packet 3" in serial[1]
+        else:
+            assert serial[0] is not InvariantViolation
@@ -0,0 +1,126 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for tumbling and sliding window metrics."""
+
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+
+from eval_calibration_core.cli import main
+from eval_calibration_core.io.packet_reader import PacketReader
+from eval_calibration_core.metrics import compute_metrics
+from eval_calibration_core.metrics.windows import WindowedMetrics, WindowSpec
+from eval_calibration_core.report import (
+    build_report_incremental,
+    build_report_parallel,
+    build_report_streaming,
+)
+
+
+def _packet(step: int, ts, denied: bool = False, latency: int = 5) -> PacketV2:
+    return PacketV2(
+        run_id="window-run",
+        step=step,
+        input={} if ts is None else {"ts": ts},
+        external={},
+        mdm={"action": "ACT", "confidence": 0.5},
+        final_action={"action": "HOLD" if denied else "ACT", "allowed": not denied},
+        latency_ms=latency,
+        mismatch={"flags": ["f"], "reason_codes": ["guard"]} if denied else None,
+    )
+
+
+def _write_trace(path: Path, n: int) -> Path:
+    with open(path, "w", encoding="utf-8") as f:
+        for step in range(n):
+            denied = 120 <= step < 160  # a regression in one part of the run
+            packet = _packet(step, step * 0.5, denied, latency=step % 13)
+            f.write(json.dumps(packet.to_dict()) + "\n")
+    return path
+
+
+def test_tumbling_windows_match_sliced_metrics() -> None:
+    """Each tumbling window equals compute_metrics over its slice (exact backend)."""
+    packets = [_packet(i, i * 0.25, denied=i % 7 == 0, latency=i % 11) for i in range(100)]
+    windows = WindowedMetrics(WindowSpec(5.0), latency_backend="exact")
+    for packet in packets:
+        windows.update(packet)
+    series = windows.finalize()
+    assert series["start"] == [0.0, 5.0, 10.0, 15.0, 20.0]
+    for i, start in enumerate(series["start"]):
+        expected = compute_metrics([p for p in packets if start <= p.input["ts"] < start + 5])
+        assert series["total_steps"][i] == expected["total_steps"]
+        assert series["action_distribution"]["HOLD"][i] == expected["action_distribution"].get(
+            "HOLD", 0
+        )
+        assert series["guard_trigger_rates"]["guard"][i] == pytest.approx(
+            expected["guard_trigger_rates"].get("guard", 0.0)
+        )
+        assert {k: v[i] for k, v in series["latency_percentiles"].items()} == expected[
+            "latency_percentiles"
+        ]
+
+
+def test_sliding_windows_cover_overlapping_panes() -> None:
+    """Sliding windows (size 4, step 2) count every packet in size / step windows."""
+    windows = WindowedMetrics(WindowSpec(4, 2, key="step"))
+    for step in range(10):
+        windows.update(_packet(step, None))
+    series = windows.finalize()
+    assert series["start"] == [-2, 0, 2, 4, 6, 8]
+    assert series["total_steps"] == [2, 4, 4, 4, 4, 2]
+    assert len(windows.pane_metrics) == 5  # state per pane, not per packet
+
+
+def test_unkeyed_packets_and_spec_validation(tmp_path: Path) -> None:
+    """Packets without a finite numeric key are counted; size must be a multiple of step."""
+    windows = WindowedMetrics(WindowSpec(10))
+    for packet in (_packet(0, None), _packet(1, "noon"), _packet(2, 3.0)):
+        windows.update(packet)
+    assert windows.unkeyed == 2 and windows.finalize()["total_steps"] == [1]
+    for key in (math.nan, math.inf, -math.inf, 10**400):
+        windows.update(_packet(3, key))
+    assert windows.unkeyed == 6 and windows.finalize()["total_steps"] == [1]
+    trace = tmp_path / "trace.jsonl"
+    # json.dumps writes Infinity, which the decoders accept
+    trace.write_text(
+        "".join(
+            json.dumps(_packet(i, ts).to_dict()) + "\n"
+            for i, ts in enumerate([1.0, math.inf, -math.inf])
+        ),
+        encoding="utf-8",
+    )
+    report = build_report_streaming(PacketReader(trace).read(), window=WindowSpec(10))
+    assert report.windows["unkeyed"] == 2 and report.windows["total_steps"] == [1]
+    with pytest.raises(ValueError, match="multiple"):
+        WindowSpec(10, 3)
+
+
+def test_windows_identical_across_builders(tmp_path: Path) -> None:
+    """Streaming, sharded and incremental reports carry the same windows."""
+    path = _write_trace(tmp_path / "trace.jsonl", 300)
+    spec = WindowSpec(20, 10)
+    expected = build_report_streaming(PacketReader(path).read(), window=spec).windows
+    assert max(expected["guard_trigger_rates"]["guard"]) == 1.0
+    assert build_report_parallel(path, 3, window=spec).windows == expected
+    state = tmp_path / "report.state.json"
+    assert build_report_incremental(path, state, window=spec).windows == expected
+    assert build_report_incremental(path, state, window=spec).windows == expected
+    assert build_report_streaming(PacketReader(path).read()).windows is None
+
+
+def test_cli_window(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """`run --window` writes the windows series to report.json and report.md."""
+    path = _write_trace(tmp_path / "trace.jsonl", 100)
+    out = tmp_path / "out"
+    argv = ["eval-cal", "run", "--in", str(path), "--out", str(out), "--window", "10"]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+    written = json.loads((out / "report.json").read_text(encoding="utf-8"))
+    assert written["windows"]["start"] == [0.0, 10.0, 20.0, 30.0, 40.0]
+    assert "## Windows" in (out / "report.md").read_text(encoding="utf-8")
@@ -0,0 +1,100 @@
+# Decision Ecosystem — evaluation-calibration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the report writer (compact, compressed and atomic output)."""
+
+import gzip
+import io
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from eval_calibration_core.io.fixtures import load_fixture_suite
+from eval_calibration_core.report import build_report, writer
+from eval_calibration_core.report.writer import _format_markdown, write_report
+
+
+def _report():
+    return build_report(load_fixture_suite("smoke"), suite_name="smoke", group_by="run_id")
+
+
+def test_compact_and_compressed_output(tmp_path: Path) -> None:
+    """Every output mode holds the same JSON document; report.md is unchanged."""
+    report = _report()
+    expected = json.loads(json.dumps(report.to_dict()))
+
+    path = write_report(report, tmp_path / "plain")
+    assert path == tmp_path / "plain" / "report.json"
+    assert json.loads(path.read_text(encoding="utf-8")) == expected
+    md = (tmp_path / "plain" / "report.md").read_text(encoding="utf-8")
+    assert md == _format_markdown(report)
+
+    path = write_report(report, tmp_path / "compact", compact=True)
+    text = path.read_text(encoding="utf-8")
+    assert "\n" not in text and json.loads(text) == expected
+
+    path = write_report(report, tmp_path / "gz", compact=True, compression="gzip")
+    assert path.name == "report.json.gz"
+    assert json.loads(gzip.decompress(path.read_bytes())) == expected
+
+    zstandard = pytest.importorskip("zstandard")
+    path = write_report(report, tmp_path / "zst", compression="zstd")
+    data = zstandard.ZstdDecompressor().decompressobj().decompress(path.read_bytes())
+    assert json.loads(data) == expected
+
+    with pytest.raises(ValueError, match="Unknown report compression"):
+        write_report(report, tmp_path, compression="bz2")
+
+
+def test_failed_write_keeps_previous_report(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A write that fails midway leaves the previous report and no temporary file."""
+    report = _report()
+    write_report(report, tmp_path)
+    before = (tmp_path / "report.json").read_text(encoding="utf-8")
+    md = (tmp_path / "report.md").read_text(encoding="utf-8")
+
+    def broken(*args, **kwargs):
+        yield "# Evaluation Report"
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(writer, "_iter_markdown", broken)
+    report.suite_name = "changed"
+    with pytest.raises(RuntimeError, match="disk full"):
+        write_report(report, tmp_path)
+    assert (tmp_path / "report.md").read_text(encoding="utf-8") == md
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report.json", "report.md"]
+    assert (tmp_path / "report.json").read_text(encoding="utf-8") != before  # JSON completed
+
+
+class _RecordingFile(io.StringIO):
+    """StringIO that records the longest single write."""
+
+    longest = 0
+
+    def write(self, text: str) -> int:
+        self.longest = max(self.longest, len(text))
+        return super().write(text)
+
+
+def test_compact_json_streams_sections_and_keeps_nan(tmp_path: Path) -> None:
+    """Large sections are written entry by entry; NaN/Infinity match the indented report."""
+    data = {
+        "windows": {"start": list(range(50_000)), "latency": {"p50": [0.5] * 50_000}},
+        "groups": {"groups": {f"g{i}": {"total_packets": i, "rate": 0.25} for i in range(5_000)}},
+        "metrics": {"nan": math.nan, "inf": [1.0, math.inf, None], 3: "int key"},
+    }
+    f = _RecordingFile()
+    writer._write_compact_json(f, data)
+    assert f.longest < 64 * 1024
+    assert f.getvalue() == json.dumps(data, separators=(",", ":"))
+
+    report = _report()
+    report.metrics["plugin"] = {"score": math.nan, "bound": -math.inf}
+    plain = write_report(report, tmp_path / "plain").read_text(encoding="utf-8")
+    compact = write_report(report, tmp_path / "compact", compact=True).read_text(encoding="utf-8")
+    assert "NaN" in compact and "-Infinity" in compact
+    assert json.dumps(json.loads(compact)) == json.dumps(json.loads(plain))